@@ -11,18 +11,49 @@ Key Features:
 - Audit logging and reporting
 """
 
-from azure_pim.auth import PIMAuth
-from azure_pim.clients.arm import ARMClient
-from azure_pim.clients.graph import GraphClient
-from azure_pim.config import PIMConfig
-from azure_pim.exceptions import PIMError
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from azure_pim.auth import PIMAuth
+    from azure_pim.clients.arm import ARMClient
+    from azure_pim.clients.graph import ActivationSpec, AsyncGraphClient, GraphClient
+    from azure_pim.config import PIMConfig, RetryConfig
+    from azure_pim.exceptions import PIMError
 
 __version__ = "0.1.0"
 
+# Public names are resolved on first access so that importing a submodule
+# (e.g. the CLI) does not load msal/httpx up front.
+_LAZY_EXPORTS = {
+    "PIMAuth": "azure_pim.auth",
+    "PIMConfig": "azure_pim.config",
+    "RetryConfig": "azure_pim.config",
+    "PIMError": "azure_pim.exceptions",
+    "GraphClient": "azure_pim.clients.graph",
+    "AsyncGraphClient": "azure_pim.clients.graph",
+    "ActivationSpec": "azure_pim.clients.graph",
+    "ARMClient": "azure_pim.clients.arm",
+}
+
 __all__ = [
     "PIMAuth",
     "PIMConfig",
+    "RetryConfig",
     "PIMError",
     "GraphClient",
+    "AsyncGraphClient",
+    "ActivationSpec",
     "ARMClient",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
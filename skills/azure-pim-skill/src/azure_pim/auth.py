@@ -10,16 +10,16 @@ Supports:
 
 from __future__ import annotations
 
+import base64
 import json
 import logging
 import os
 import subprocess
+import threading
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
-
-import msal
+from typing import TYPE_CHECKING
 
 from azure_pim.config import PIMConfig
 from azure_pim.exceptions import AuthenticationError, MFARequiredError
@@ -27,8 +27,28 @@ from azure_pim.exceptions import AuthenticationError, MFARequiredError
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    import msal
+
 logger = logging.getLogger(__name__)
 
+# Refresh cached tokens this long before they actually expire.
+TOKEN_REFRESH_MARGIN = timedelta(seconds=60)
+
+
+def _token_expiry(token: str) -> datetime:
+    """Read the ``exp`` claim from a JWT access token without verifying it.
+
+    Returns the current time for opaque or malformed tokens so they are
+    never served from the cache.
+    """
+    now = datetime.now(tz=timezone.utc)
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return datetime.fromtimestamp(int(claims["exp"]), tz=timezone.utc)
+    except (IndexError, KeyError, TypeError, ValueError):
+        return now
+
 
 class TokenProvider(ABC):
     """Abstract base class for token providers."""
@@ -42,6 +62,8 @@ class MSALTokenProvider(TokenProvider):
     """MSAL-based token provider with caching."""
 
     def __init__(self, config: PIMConfig) -> None:
+        import msal
+
         self.config = config
         self._cache = msal.SerializableTokenCache()
         self._load_cache()
@@ -57,12 +79,22 @@ class MSALTokenProvider(TokenProvider):
                 logger.warning("Failed to load token cache: %s", e)
 
     def _save_cache(self) -> None:
-        """Persist token cache to disk."""
+        """Persist token cache to disk.
+
+        The file is created with mode 0600 and swapped into place atomically,
+        so it is never readable by others nor observed half-written.
+        """
         cache_path = self.config.cache_path
         cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.tmp")
         try:
-            cache_path.write_text(self._cache.serialize())
-            cache_path.chmod(0o600)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.write(fd, self._cache.serialize().encode())
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, cache_path)
         except OSError as e:
             logger.warning("Failed to save token cache: %s", e)
 
@@ -71,6 +103,8 @@ class MSALTokenProvider(TokenProvider):
         if self._app is not None:
             return self._app
 
+        import msal
+
         if self.config.client_secret:
             self._app = msal.ConfidentialClientApplication(
                 client_id=self.config.client_id or "",
@@ -90,6 +124,8 @@ class MSALTokenProvider(TokenProvider):
 
     def get_token(self, scopes: list[str]) -> str:
         """Acquire token silently or interactively."""
+        import msal
+
         app = self._get_app()
 
         accounts = app.get_accounts()
@@ -119,12 +155,16 @@ class DeviceCodeTokenProvider(TokenProvider):
     """Device code flow for headless environments."""
 
     def __init__(self, config: PIMConfig, callback: Callable[[str], None] | None = None) -> None:
+        import msal
+
         self.config = config
         self.callback = callback or print
         self._cache = msal.SerializableTokenCache()
 
     def get_token(self, scopes: list[str]) -> str:
         """Acquire token using device code flow."""
+        import msal
+
         client_id = self.config.client_id or "04b07795-8ddb-461a-bbee-02f9e1bf7b46"
         app = msal.PublicClientApplication(
             client_id=client_id,
@@ -173,38 +213,40 @@ class AzureCliTokenProvider(TokenProvider):
 
 
 class ManagedIdentityTokenProvider(TokenProvider):
-    """Azure Managed Identity authentication."""
+    """Azure Managed Identity authentication.
+
+    Delegates to MSAL's managed identity client, which handles endpoint
+    discovery, IMDS retries and in-memory token caching.
+    """
 
     def __init__(self, client_id: str | None = None) -> None:
+        import msal
+        import requests
+
         self.client_id = client_id
+        identity: msal.SystemAssignedManagedIdentity | msal.UserAssignedManagedIdentity
+        if client_id:
+            identity = msal.UserAssignedManagedIdentity(client_id=client_id)
+        else:
+            identity = msal.SystemAssignedManagedIdentity()
+        self._mi = msal.ManagedIdentityClient(identity, http_client=requests.Session())
 
     def get_token(self, scopes: list[str]) -> str:
         """Get token from managed identity endpoint."""
-        import httpx
+        import msal
 
         resource = scopes[0].rsplit("/", 1)[0] if scopes else "https://graph.microsoft.com"
-        endpoint = os.environ.get("IDENTITY_ENDPOINT", "http://169.254.169.254/metadata/identity/oauth2/token")
-        api_version = "2019-08-01" if "169.254.169.254" in endpoint else "2019-08-01"
-
-        params: dict[str, str] = {
-            "api-version": api_version,
-            "resource": resource,
-        }
-        if self.client_id:
-            params["client_id"] = self.client_id
-
-        headers = {"Metadata": "true"}
-        if "IDENTITY_HEADER" in os.environ:
-            headers["X-IDENTITY-HEADER"] = os.environ["IDENTITY_HEADER"]
 
         try:
-            response = httpx.get(endpoint, params=params, headers=headers, timeout=10)
-            response.raise_for_status()
-            data: dict[str, Any] = response.json()
-            return data["access_token"]
-        except httpx.HTTPError as e:
+            result = self._mi.acquire_token_for_client(resource=resource)
+        except msal.ManagedIdentityError as e:
             raise AuthenticationError(f"Managed identity authentication failed: {e}") from e
 
+        if "access_token" not in result:
+            error = result.get("error_description") or result.get("error", "unknown")
+            raise AuthenticationError(f"Managed identity authentication failed: {error}")
+        return result["access_token"]
+
 
 class PIMAuth:
     """High-level authentication manager for Azure PIM.
@@ -221,6 +263,7 @@ class PIMAuth:
         self.config = config or PIMConfig.from_env()
         self._provider = provider or self._auto_select_provider()
         self._tokens: dict[str, tuple[str, datetime]] = {}
+        self._refresh_lock = threading.Lock()
 
     def _auto_select_provider(self) -> TokenProvider:
         """Automatically select best available token provider."""
@@ -242,13 +285,36 @@ class PIMAuth:
         logger.info("Using interactive browser authentication")
         return MSALTokenProvider(self.config)
 
+    def _get_token(self, key: str, scopes: list[str]) -> str:
+        """Return a cached token for ``key``, refreshing it when close to expiry.
+
+        The cache hit path is lock-free: the ``(token, expires_on)`` tuple is
+        replaced with a single dict assignment, so readers always see a
+        consistent pair. Only a miss takes the refresh lock, and the cache is
+        checked again once it is held so concurrent callers refresh only once.
+        """
+        token, expires_on = self._tokens.get(key, (None, None))
+        refresh_at = datetime.now(tz=timezone.utc) + TOKEN_REFRESH_MARGIN
+        if token and expires_on and expires_on > refresh_at:
+            return token
+
+        with self._refresh_lock:
+            token, expires_on = self._tokens.get(key, (None, None))
+            refresh_at = datetime.now(tz=timezone.utc) + TOKEN_REFRESH_MARGIN
+            if token and expires_on and expires_on > refresh_at:
+                return token
+
+            token = self._provider.get_token(scopes)
+            self._tokens[key] = (token, _token_expiry(token))
+            return token
+
     def get_graph_token(self) -> str:
         """Get access token for Microsoft Graph API."""
-        return self._provider.get_token(self.config.scopes_graph)
+        return self._get_token("graph", self.config.scopes_graph)
 
     def get_arm_token(self) -> str:
         """Get access token for Azure Resource Manager API."""
-        return self._provider.get_token(self.config.scopes_arm)
+        return self._get_token("arm", self.config.scopes_arm)
 
     @classmethod
     def interactive(cls, tenant_id: str, client_id: str | None = None) -> PIMAuth:
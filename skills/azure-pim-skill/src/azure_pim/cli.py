@@ -9,40 +9,64 @@ Usage:
 
 from __future__ import annotations
 
+import atexit
+import copy
+import dataclasses
+import functools
+import itertools
 import json
 import logging
 import sys
 from datetime import datetime
 from enum import Enum
-from typing import Annotated, Any
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
 
-import typer
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.table import Table
+import click
 
-from azure_pim.auth import PIMAuth
-from azure_pim.config import PIMConfig
 from azure_pim.exceptions import PIMError
-from azure_pim.operations.pim import PIMOperations
+
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from rich.console import Console
+    from rich.table import Table
+
+    from azure_pim.auth import PIMAuth
+    from azure_pim.operations.pim import PIMOperations
+
 
 # Initialize CLI app
-app = typer.Typer(
-    name="pim",
-    help="Azure Privileged Identity Management (PIM) CLI",
-    no_args_is_help=True,
-)
+@click.group(name="pim", help="Azure Privileged Identity Management (PIM) CLI")
+@click.option("-v", "--verbose", is_flag=True, help="Enable verbose output")
+def app(verbose: bool) -> None:
+    """Azure PIM CLI - Manage privileged identity assignments."""
+    setup_logging(verbose)
+
 
 # Sub-commands
-entra_app = typer.Typer(help="Entra ID (Azure AD) role management")
-azure_app = typer.Typer(help="Azure RBAC role management")
-config_app = typer.Typer(help="Configuration management")
+entra_app = click.Group("entra", help="Entra ID (Azure AD) role management")
+azure_app = click.Group("azure", help="Azure RBAC role management")
+config_app = click.Group("config", help="Configuration management")
+
+app.add_command(entra_app)
+app.add_command(azure_app)
+app.add_command(config_app)
 
-app.add_typer(entra_app, name="entra")
-app.add_typer(azure_app, name="azure")
-app.add_typer(config_app, name="config")
+# PyYAML module, imported on first YAML output.
+_yaml: Any = None
 
-console = Console()
+# Tables longer than this are drawn without box borders.
+PLAIN_TABLE_ROWS = 20
+
+# Most rows the table view renders before reporting "... and more".
+TABLE_ROWS = 50
 
 
 class OutputFormat(str, Enum):
@@ -53,21 +77,70 @@ class OutputFormat(str, Enum):
     YAML = "yaml"
 
 
+tenant_option = click.option("--tenant-id", help="Azure tenant ID")
+limit_option = click.option(
+    "--limit",
+    type=click.IntRange(min=0),
+    default=50,
+    show_default=True,
+    help="Maximum number of results to fetch (0 for all)",
+)
+output_option = click.option(
+    "-o",
+    "--output",
+    type=click.Choice([f.value for f in OutputFormat]),
+    default=OutputFormat.TABLE.value,
+    callback=lambda _ctx, _param, value: OutputFormat(value),
+)
+
+
 # ==================== Global Options ====================
 
 
+@functools.lru_cache(maxsize=1)
+def get_console() -> Console:
+    """Create the shared Rich console on first use.
+
+    When stdout is not a terminal the console skips colors and
+    highlighting; see also the plain-text paths in the output helpers.
+    """
+    from rich.console import Console
+
+    if sys.stdout.isatty():
+        return Console()
+    return Console(no_color=True, highlight=False, soft_wrap=True)
+
+
+@functools.lru_cache(maxsize=1)
+def get_table_console() -> Console:
+    """Create the console used for tables, with highlighting and markup off.
+
+    Cell values are plain data, so running Rich's regex highlighters and
+    markup parser over every cell only costs time (and mangles brackets).
+    """
+    from rich.console import Console
+
+    return Console(highlight=False, markup=False)
+
+
 def setup_logging(verbose: bool) -> None:
     """Configure logging based on verbosity."""
+    from rich.logging import RichHandler
+
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
         level=level,
         format="%(message)s",
-        handlers=[RichHandler(console=console, rich_tracebacks=True)],
+        handlers=[RichHandler(console=get_console(), rich_tracebacks=True)],
     )
 
 
+@functools.lru_cache(maxsize=4)
 def get_auth(tenant_id: str | None = None) -> PIMAuth:
-    """Get authentication from config or environment."""
+    """Get authentication from config or environment, memoized per tenant."""
+    from azure_pim.auth import PIMAuth
+    from azure_pim.config import PIMConfig
+
     if tenant_id:
         config = PIMConfig(tenant_id=tenant_id)
     else:
@@ -75,433 +148,578 @@ def get_auth(tenant_id: str | None = None) -> PIMAuth:
     return PIMAuth(config)
 
 
-def output_result(data: Any, fmt: OutputFormat) -> None:
-    """Output data in specified format."""
-    if fmt == OutputFormat.JSON:
-        if isinstance(data, list):
-            console.print_json(json.dumps([_serialize(d) for d in data], default=str))
-        else:
-            console.print_json(json.dumps(_serialize(data), default=str))
-    elif fmt == OutputFormat.YAML:
-        import yaml
+@functools.lru_cache(maxsize=4)
+def get_pim(tenant_id: str | None = None) -> PIMOperations:
+    """Get PIM operations for a tenant, shared for the rest of the process."""
+    from azure_pim.operations.pim import PIMOperations
+
+    pim = PIMOperations(get_auth(tenant_id))
+    atexit.register(pim.close)
+    return pim
+
+
+def pim_command(
+    error_prefix: str = "Error",
+    *,
+    show_details: bool = False,
+) -> Callable[[Callable[..., None]], Callable[..., None]]:
+    """Turn a handler taking ``pim`` first into a command body.
 
-        console.print(yaml.safe_dump(_serialize(data), default_flow_style=False))
+    Adds the ``--tenant-id`` option, injects the tenant's shared
+    PIMOperations, and reports PIMError as a red message and exit code 1.
+    """
+
+    def decorator(fn: Callable[..., None]) -> Callable[..., None]:
+        @tenant_option
+        @functools.wraps(fn)
+        def wrapper(*args: Any, tenant_id: str | None = None, **kwargs: Any) -> None:
+            try:
+                fn(get_pim(tenant_id), *args, **kwargs)
+            except PIMError as e:
+                get_console().print(f"[red]{error_prefix}: {e.message}[/red]")
+                if show_details and e.details:
+                    get_console().print(f"[dim]{e.details}[/dim]")
+                raise click.exceptions.Exit(1) from e
+
+        return wrapper
+
+    return decorator
+
+
+def _emit_json(data: Any) -> None:
+    if hasattr(data, "model_dump_json"):
+        _print_json_text(data.model_dump_json(indent=2, by_alias=True, exclude_none=True))
+    elif isinstance(data, list) and data and hasattr(data[0], "model_dump_json"):
+        from pydantic import TypeAdapter
+
+        item_type: Any = type(data[0])
+        adapter: TypeAdapter[list[Any]] = TypeAdapter(list[item_type])
+        dumped = adapter.dump_json(data, indent=2, by_alias=True, exclude_none=True)
+        _print_json_text(dumped.decode())
     else:
-        if isinstance(data, list):
-            _print_table(data)
-        else:
-            _print_dict(data)
+        _print_json_text(_dumps_json(data))
+
+
+def _emit_yaml(data: Any) -> None:
+    global _yaml  # noqa: PLW0603
+    if _yaml is None:
+        import yaml as _yaml
+
+    dumper = getattr(_yaml, "CSafeDumper", _yaml.SafeDumper)
+    get_console().print(_yaml.dump(_serialize(data), Dumper=dumper, default_flow_style=False))
+
+
+def _emit_table(data: Any) -> None:
+    if isinstance(data, dict):
+        _print_dict(data)
+    else:
+        _print_table(data)
+
+
+_FORMATTERS: dict[OutputFormat, Callable[[Any], None]] = {
+    OutputFormat.JSON: _emit_json,
+    OutputFormat.YAML: _emit_yaml,
+    OutputFormat.TABLE: _emit_table,
+}
+
+
+def output_result(data: Any, fmt: OutputFormat, limit: int = 0) -> None:
+    """Output data in specified format.
+
+    ``data`` may be a dict, a model, or any iterable of rows; iterables are
+    only materialized for JSON/YAML, the table view consumes them lazily.
+    With ``limit``, at most that many rows are output; callers fetch one
+    more row so the table can report that the listing was cut short.
+    """
+    is_rows = not isinstance(data, (dict, list)) and not hasattr(data, "model_dump")
+    if is_rows and limit:
+        if fmt is OutputFormat.TABLE:
+            _print_table(data, min(limit, TABLE_ROWS))
+            return
+        data = itertools.islice(data, limit)
+    if fmt is not OutputFormat.TABLE and is_rows:
+        data = list(data)
+    _FORMATTERS[fmt](data)
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for values the JSON encoder cannot serialize natively.
+
+    orjson handles datetimes itself; the stdlib encoder reaches this for them.
+    """
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json", by_alias=True, exclude_none=True)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _dumps_json(data: Any) -> str:
+    """Encode data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        dumped: bytes = orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2)
+        return dumped.decode()
+    return json.dumps(data, indent=2, ensure_ascii=False, default=_json_default)
+
+
+def _print_json_text(text: str) -> None:
+    """Print an already-encoded JSON document with syntax highlighting."""
+    if not sys.stdout.isatty():
+        sys.stdout.write(text)
+        sys.stdout.write("\n")
+        return
+
+    from rich.highlighter import JSONHighlighter
+
+    rendered = JSONHighlighter()(text)
+    rendered.no_wrap = True
+    rendered.overflow = None
+    get_console().print(rendered, soft_wrap=True)
+
+
+_PRIMITIVES = (str, int, float, bool, type(None))
+
+
+def _is_flat(obj: dict[str, Any]) -> bool:
+    """Return True if every value of ``obj`` is already a JSON primitive."""
+    return all(isinstance(v, _PRIMITIVES) for v in obj.values())
 
 
 def _serialize(obj: Any) -> Any:
-    """Serialize object for output."""
+    """Serialize object for output.
+
+    Flat dicts (and lists of them) are returned as-is rather than rebuilt.
+    """
+    if isinstance(obj, _PRIMITIVES):
+        return obj
     if hasattr(obj, "model_dump"):
-        return obj.model_dump()
+        return obj.model_dump(mode="json", by_alias=True, exclude_none=True)
     if isinstance(obj, datetime):
         return obj.isoformat()
     if isinstance(obj, dict):
+        if _is_flat(obj):
+            return obj
         return {k: _serialize(v) for k, v in obj.items()}
     if isinstance(obj, list):
+        if all(isinstance(v, dict) and _is_flat(v) for v in obj):
+            return obj
         return [_serialize(v) for v in obj]
     return obj
 
 
-def _print_table(data: list[dict[str, Any]]) -> None:
-    """Print list of dicts as a table."""
-    if not data:
-        console.print("[yellow]No results found[/yellow]")
-        return
+@functools.lru_cache(maxsize=32)
+def _table_template(columns: tuple[str, ...], show_header: bool, plain: bool) -> Table:
+    """Build a column-configured, row-less table to clone for output."""
+    from rich.table import Table
 
-    table = Table(show_header=True, header_style="bold cyan")
+    if not show_header:
+        table = Table(show_header=False)
+        table.add_column(columns[0], style="cyan")
+        for key in columns[1:]:
+            table.add_column(key)
+        return table
 
-    keys = list(data[0].keys()) if data else []
-    for key in keys[:6]:
+    if plain:
+        table = Table(show_header=True, header_style="bold cyan", box=None, show_edge=False)
+    else:
+        table = Table(show_header=True, header_style="bold cyan")
+    for key in columns:
         table.add_column(key)
+    return table
+
 
-    for row in data[:50]:
-        values = [str(row.get(k, ""))[:50] for k in keys[:6]]
-        table.add_row(*values)
+def _new_table(columns: tuple[str, ...], *, show_header: bool = True, plain: bool = False) -> Table:
+    """Return a fresh table cloned from the cached template for ``columns``."""
+    template = _table_template(columns, show_header, plain)
+    table = copy.copy(template)
+    table.columns = [dataclasses.replace(c, _cells=[]) for c in template.columns]
+    table.rows = []
+    return table
 
-    console.print(table)
-    if len(data) > 50:
-        console.print(f"[dim]... and {len(data) - 50} more[/dim]")
+
+def _write_tsv(
+    columns: tuple[str, ...], rows: Iterable[dict[str, Any]], *, header: bool = True
+) -> None:
+    """Write rows as tab-separated lines for non-terminal output."""
+    lines = ["\t".join(columns)] if header else []
+    for row in rows:
+        get = row.get
+        lines.append("\t".join(str(get(k, "")) for k in columns))
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.write("\n")
+
+
+def _print_table(data: Iterable[dict[str, Any]], limit: int = TABLE_ROWS) -> None:
+    """Print rows of dicts as a table, rendering at most ``limit`` rows."""
+    rows = iter(data)
+    shown = list(itertools.islice(rows, limit))
+    if not shown:
+        get_console().print("[yellow]No results found[/yellow]")
+        return
+
+    columns = tuple(shown[0].keys())[:6]
+    if not sys.stdout.isatty():
+        _write_tsv(columns, shown)
+        if next(rows, None) is not None:
+            sys.stderr.write("... and more\n")
+        return
+
+    table = _new_table(columns, plain=len(shown) > PLAIN_TABLE_ROWS)
+
+    for row in shown:
+        get = row.get
+        table.add_row(*[str(get(k, ""))[:50] for k in columns])
+
+    get_table_console().print(table)
+    # Peek one row instead of counting, so pages past the limit aren't fetched
+    if next(rows, None) is not None:
+        get_console().print("[dim]... and more[/dim]")
 
 
 def _print_dict(data: dict[str, Any]) -> None:
     """Print dict as key-value pairs."""
-    table = Table(show_header=False)
-    table.add_column("Key", style="cyan")
-    table.add_column("Value")
+    if not sys.stdout.isatty():
+        rows = ({"Key": k, "Value": v} for k, v in data.items())
+        _write_tsv(("Key", "Value"), rows, header=False)
+        return
+
+    table = _new_table(("Key", "Value"), show_header=False)
 
     for key, value in data.items():
         table.add_row(key, str(value)[:100])
 
-    console.print(table)
+    get_table_console().print(table)
 
 
 # ==================== Main Commands ====================
 
 
 @app.command()
+@output_option
+@pim_command()
 def whoami(
-    tenant_id: Annotated[str | None, typer.Option(help="Azure tenant ID")] = None,
-    output: Annotated[OutputFormat, typer.Option("-o", "--output")] = OutputFormat.TABLE,
+    pim: PIMOperations,
+    output: OutputFormat,
 ) -> None:
     """Show current authenticated user."""
-    try:
-        auth = get_auth(tenant_id)
-        with PIMOperations(auth) as pim:
-            user = pim.whoami()
-            output_result(
-                {
-                    "id": user.get("id"),
-                    "displayName": user.get("displayName"),
-                    "userPrincipalName": user.get("userPrincipalName"),
-                    "mail": user.get("mail"),
-                },
-                output,
-            )
-    except PIMError as e:
-        console.print(f"[red]Error: {e.message}[/red]")
-        raise typer.Exit(1) from e
+    user = pim.whoami()
+    output_result(
+        {
+            "id": user.get("id"),
+            "displayName": user.get("displayName"),
+            "userPrincipalName": user.get("userPrincipalName"),
+            "mail": user.get("mail"),
+        },
+        output,
+    )
 
 
 @app.command("activate")
+@click.argument("role")
+@click.option("-j", "--justification", required=True, help="Reason for activation")
+@click.option("-d", "--duration", default="PT1H", help="Duration (ISO 8601)")
+@click.option("-s", "--scope", default="/", help="Scope (/ for tenant, subscription ID for Azure)")
+@click.option("--ticket", help="Ticket/incident number")
+@click.option("--ticket-system", help="Ticket system name")
+@click.option("--azure", is_flag=True, help="Activate Azure RBAC role (not Entra)")
+@output_option
+@pim_command("Activation failed", show_details=True)
 def activate_role(
-    role: Annotated[str, typer.Argument(help="Role name or ID to activate")],
-    justification: Annotated[str, typer.Option("-j", "--justification", help="Reason for activation")],
-    duration: Annotated[str, typer.Option("-d", "--duration", help="Duration (ISO 8601)")] = "PT1H",
-    scope: Annotated[str, typer.Option("-s", "--scope", help="Scope (/ for tenant, subscription ID for Azure)")] = "/",
-    ticket: Annotated[str | None, typer.Option("--ticket", help="Ticket/incident number")] = None,
-    ticket_system: Annotated[str | None, typer.Option("--ticket-system", help="Ticket system name")] = None,
-    tenant_id: Annotated[str | None, typer.Option(help="Azure tenant ID")] = None,
-    azure: Annotated[bool, typer.Option("--azure", help="Activate Azure RBAC role (not Entra)")] = False,
-    output: Annotated[OutputFormat, typer.Option("-o", "--output")] = OutputFormat.TABLE,
+    pim: PIMOperations,
+    role: str,
+    justification: str,
+    duration: str,
+    scope: str,
+    ticket: str | None,
+    ticket_system: str | None,
+    azure: bool,
+    output: OutputFormat,
 ) -> None:
     """Activate an eligible role (JIT activation)."""
-    try:
-        auth = get_auth(tenant_id)
-        with PIMOperations(auth) as pim:
-            if azure:
-                result = pim.activate_azure_role(
-                    scope=scope,
-                    role_name_or_id=role,
-                    justification=justification,
-                    duration=duration,
-                    ticket_number=ticket,
-                    ticket_system=ticket_system,
-                )
-            else:
-                result = pim.activate_entra_role(
-                    role_name_or_id=role,
-                    justification=justification,
-                    duration=duration,
-                    scope=scope,
-                    ticket_number=ticket,
-                    ticket_system=ticket_system,
-                )
-
-            status = result.get("status", result.get("properties", {}).get("status", "Unknown"))
-            console.print(f"[green]Role activation requested. Status: {status}[/green]")
-            output_result(result, output)
-
-    except PIMError as e:
-        console.print(f"[red]Activation failed: {e.message}[/red]")
-        if e.details:
-            console.print(f"[dim]{e.details}[/dim]")
-        raise typer.Exit(1) from e
+    if azure:
+        result = pim.activate_azure_role(
+            scope=scope,
+            role_name_or_id=role,
+            justification=justification,
+            duration=duration,
+            ticket_number=ticket,
+            ticket_system=ticket_system,
+        )
+    else:
+        result = pim.activate_entra_role(
+            role_name_or_id=role,
+            justification=justification,
+            duration=duration,
+            scope=scope,
+            ticket_number=ticket,
+            ticket_system=ticket_system,
+        )
+
+    status = result.get("status", result.get("properties", {}).get("status", "Unknown"))
+    get_console().print(f"[green]Role activation requested. Status: {status}[/green]")
+    output_result(result, output)
 
 
 @app.command("deactivate")
+@click.argument("role")
+@click.option("-s", "--scope", default="/", help="Scope")
+@click.option("--azure", is_flag=True, help="Deactivate Azure RBAC role")
+@pim_command("Deactivation failed")
 def deactivate_role(
-    role: Annotated[str, typer.Argument(help="Role name or ID to deactivate")],
-    scope: Annotated[str, typer.Option("-s", "--scope", help="Scope")] = "/",
-    tenant_id: Annotated[str | None, typer.Option(help="Azure tenant ID")] = None,
-    azure: Annotated[bool, typer.Option("--azure", help="Deactivate Azure RBAC role")] = False,
+    pim: PIMOperations,
+    role: str,
+    scope: str,
+    azure: bool,
 ) -> None:
     """Deactivate an active role early."""
-    try:
-        auth = get_auth(tenant_id)
-        with PIMOperations(auth) as pim:
-            if azure:
-                result = pim.deactivate_azure_role(scope=scope, role_name_or_id=role)
-            else:
-                result = pim.deactivate_entra_role(role_name_or_id=role, scope=scope)
-
-            console.print(f"[green]Role deactivated successfully[/green]")
+    if azure:
+        result = pim.deactivate_azure_role(scope=scope, role_name_or_id=role)
+    else:
+        result = pim.deactivate_entra_role(role_name_or_id=role, scope=scope)
 
-    except PIMError as e:
-        console.print(f"[red]Deactivation failed: {e.message}[/red]")
-        raise typer.Exit(1) from e
+    get_console().print(f"[green]Role deactivated successfully[/green]")
 
 
 # ==================== Entra ID Commands ====================
 
 
 @entra_app.command("roles")
+@limit_option
+@output_option
+@pim_command()
 def list_entra_roles(
-    tenant_id: Annotated[str | None, typer.Option(help="Azure tenant ID")] = None,
-    output: Annotated[OutputFormat, typer.Option("-o", "--output")] = OutputFormat.TABLE,
+    pim: PIMOperations,
+    limit: int,
+    output: OutputFormat,
 ) -> None:
     """List all Entra ID role definitions."""
-    try:
-        auth = get_auth(tenant_id)
-        with PIMOperations(auth) as pim:
-            roles = pim.list_entra_roles()
-            data = [{"displayName": r.display_name, "id": r.id, "templateId": r.template_id} for r in roles]
-            output_result(data, output)
-
-    except PIMError as e:
-        console.print(f"[red]Error: {e.message}[/red]")
-        raise typer.Exit(1) from e
+    # One row past the limit lets the table report that there are more
+    roles = pim.list_entra_roles(limit=limit + 1 if limit else None)
+    data = (
+        {"displayName": r.display_name, "id": r.id, "templateId": r.template_id} for r in roles
+    )
+    output_result(data, output, limit)
 
 
 @entra_app.command("eligible")
+@limit_option
+@output_option
+@pim_command()
 def list_my_eligible_entra(
-    tenant_id: Annotated[str | None, typer.Option(help="Azure tenant ID")] = None,
-    output: Annotated[OutputFormat, typer.Option("-o", "--output")] = OutputFormat.TABLE,
+    pim: PIMOperations,
+    limit: int,
+    output: OutputFormat,
 ) -> None:
     """List my eligible Entra ID roles."""
-    try:
-        auth = get_auth(tenant_id)
-        with PIMOperations(auth) as pim:
-            roles = pim.list_my_eligible_entra_roles()
-            data = [
-                {
-                    "roleDefinitionId": r.get("roleDefinitionId"),
-                    "status": r.get("status"),
-                    "createdDateTime": r.get("createdDateTime"),
-                }
-                for r in roles
-            ]
-            output_result(data, output)
-
-    except PIMError as e:
-        console.print(f"[red]Error: {e.message}[/red]")
-        raise typer.Exit(1) from e
+    roles = pim.list_my_eligible_entra_roles(limit=limit + 1 if limit else None)
+    data = (
+        {
+            "roleDefinitionId": r.get("roleDefinitionId"),
+            "status": r.get("status"),
+            "createdDateTime": r.get("createdDateTime"),
+        }
+        for r in roles
+    )
+    output_result(data, output, limit)
 
 
 @entra_app.command("active")
+@limit_option
+@output_option
+@pim_command()
 def list_my_active_entra(
-    tenant_id: Annotated[str | None, typer.Option(help="Azure tenant ID")] = None,
-    output: Annotated[OutputFormat, typer.Option("-o", "--output")] = OutputFormat.TABLE,
+    pim: PIMOperations,
+    limit: int,
+    output: OutputFormat,
 ) -> None:
     """List my active Entra ID roles."""
-    try:
-        auth = get_auth(tenant_id)
-        with PIMOperations(auth) as pim:
-            roles = pim.list_my_active_entra_roles()
-            data = [
-                {
-                    "roleDefinitionId": r.get("roleDefinitionId"),
-                    "status": r.get("status"),
-                    "action": r.get("action"),
-                }
-                for r in roles
-            ]
-            output_result(data, output)
-
-    except PIMError as e:
-        console.print(f"[red]Error: {e.message}[/red]")
-        raise typer.Exit(1) from e
+    roles = pim.list_my_active_entra_roles(limit=limit + 1 if limit else None)
+    data = (
+        {
+            "roleDefinitionId": r.get("roleDefinitionId"),
+            "status": r.get("status"),
+            "action": r.get("action"),
+        }
+        for r in roles
+    )
+    output_result(data, output, limit)
 
 
 @entra_app.command("policy")
+@click.argument("role")
+@output_option
+@pim_command()
 def get_entra_policy(
-    role: Annotated[str, typer.Argument(help="Role name or ID")],
-    tenant_id: Annotated[str | None, typer.Option(help="Azure tenant ID")] = None,
-    output: Annotated[OutputFormat, typer.Option("-o", "--output")] = OutputFormat.TABLE,
+    pim: PIMOperations,
+    role: str,
+    output: OutputFormat,
 ) -> None:
     """Get policy settings for an Entra ID role."""
-    try:
-        auth = get_auth(tenant_id)
-        with PIMOperations(auth) as pim:
-            policy = pim.get_entra_role_policy(role)
-            if policy:
-                data = {
-                    "id": policy.id,
-                    "maxActivationDuration": policy.max_activation_duration,
-                    "requiresMFA": policy.requires_mfa,
-                    "requiresJustification": policy.requires_justification,
-                    "requiresApproval": policy.requires_approval,
-                }
-                output_result(data, output)
-            else:
-                console.print("[yellow]No policy found for this role[/yellow]")
-
-    except PIMError as e:
-        console.print(f"[red]Error: {e.message}[/red]")
-        raise typer.Exit(1) from e
+    policy = pim.get_entra_role_policy(role)
+    if policy:
+        data = {
+            "id": policy.id,
+            "maxActivationDuration": policy.max_activation_duration,
+            "requiresMFA": policy.requires_mfa,
+            "requiresJustification": policy.requires_justification,
+            "requiresApproval": policy.requires_approval,
+        }
+        output_result(data, output)
+    else:
+        get_console().print("[yellow]No policy found for this role[/yellow]")
 
 
 @entra_app.command("assign")
+@click.argument("principal_id")
+@click.argument("role")
+@click.option("-j", "--justification", default="")
+@click.option("-s", "--scope", default="/")
+@click.option("-d", "--duration", help="Eligibility duration (e.g., P365D)")
+@pim_command("Assignment failed")
 def assign_entra_role(
-    principal_id: Annotated[str, typer.Argument(help="User or service principal ID")],
-    role: Annotated[str, typer.Argument(help="Role name or ID")],
-    justification: Annotated[str, typer.Option("-j", "--justification")] = "",
-    scope: Annotated[str, typer.Option("-s", "--scope")] = "/",
-    duration: Annotated[str | None, typer.Option("-d", "--duration", help="Eligibility duration (e.g., P365D)")] = None,
-    tenant_id: Annotated[str | None, typer.Option(help="Azure tenant ID")] = None,
+    pim: PIMOperations,
+    principal_id: str,
+    role: str,
+    justification: str,
+    scope: str,
+    duration: str | None,
 ) -> None:
     """Create an eligible role assignment."""
-    try:
-        auth = get_auth(tenant_id)
-        with PIMOperations(auth) as pim:
-            result = pim.assign_eligible_entra_role(
-                principal_id=principal_id,
-                role_name_or_id=role,
-                justification=justification,
-                scope=scope,
-                expiration_type="afterDuration" if duration else "noExpiration",
-                expiration_duration=duration,
-            )
-            console.print(f"[green]Eligible assignment created. ID: {result.get('id')}[/green]")
-
-    except PIMError as e:
-        console.print(f"[red]Assignment failed: {e.message}[/red]")
-        raise typer.Exit(1) from e
+    result = pim.assign_eligible_entra_role(
+        principal_id=principal_id,
+        role_name_or_id=role,
+        justification=justification,
+        scope=scope,
+        expiration_type="afterDuration" if duration else "noExpiration",
+        expiration_duration=duration,
+    )
+    get_console().print(f"[green]Eligible assignment created. ID: {result.get('id')}[/green]")
 
 
 @entra_app.command("remove")
+@click.argument("principal_id")
+@click.argument("role")
+@click.option("-j", "--justification", default="")
+@click.option("-s", "--scope", default="/")
+@pim_command("Removal failed")
 def remove_entra_role(
-    principal_id: Annotated[str, typer.Argument(help="User or service principal ID")],
-    role: Annotated[str, typer.Argument(help="Role name or ID")],
-    justification: Annotated[str, typer.Option("-j", "--justification")] = "",
-    scope: Annotated[str, typer.Option("-s", "--scope")] = "/",
-    tenant_id: Annotated[str | None, typer.Option(help="Azure tenant ID")] = None,
+    pim: PIMOperations,
+    principal_id: str,
+    role: str,
+    justification: str,
+    scope: str,
 ) -> None:
     """Remove an eligible role assignment."""
-    try:
-        auth = get_auth(tenant_id)
-        with PIMOperations(auth) as pim:
-            pim.remove_eligible_entra_role(
-                principal_id=principal_id,
-                role_name_or_id=role,
-                justification=justification,
-                scope=scope,
-            )
-            console.print(f"[green]Eligible assignment removed[/green]")
-
-    except PIMError as e:
-        console.print(f"[red]Removal failed: {e.message}[/red]")
-        raise typer.Exit(1) from e
+    pim.remove_eligible_entra_role(
+        principal_id=principal_id,
+        role_name_or_id=role,
+        justification=justification,
+        scope=scope,
+    )
+    get_console().print(f"[green]Eligible assignment removed[/green]")
 
 
 # ==================== Azure RBAC Commands ====================
 
 
 @azure_app.command("roles")
+@click.argument("subscription")
+@output_option
+@pim_command()
 def list_azure_roles(
-    subscription: Annotated[str, typer.Argument(help="Azure subscription ID")],
-    tenant_id: Annotated[str | None, typer.Option(help="Azure tenant ID")] = None,
-    output: Annotated[OutputFormat, typer.Option("-o", "--output")] = OutputFormat.TABLE,
+    pim: PIMOperations,
+    subscription: str,
+    output: OutputFormat,
 ) -> None:
     """List Azure RBAC role definitions."""
-    try:
-        auth = get_auth(tenant_id)
-        scope = f"/subscriptions/{subscription}"
-        with PIMOperations(auth) as pim:
-            roles = pim.list_azure_roles(scope)
-            data = [
-                {"roleName": r.role_name, "type": r.role_type, "id": r.name}
-                for r in roles[:50]
-            ]
-            output_result(data, output)
-
-    except PIMError as e:
-        console.print(f"[red]Error: {e.message}[/red]")
-        raise typer.Exit(1) from e
+    scope = f"/subscriptions/{subscription}"
+    roles = pim.list_azure_roles(scope)
+    data = (
+        {"roleName": r.role_name, "type": r.role_type, "id": r.name}
+        for r in roles[:50]
+    )
+    output_result(data, output)
 
 
 @azure_app.command("eligible")
+@click.argument("subscription")
+@click.option("--rg", "resource_group", help="Resource group name")
+@output_option
+@pim_command()
 def list_my_eligible_azure(
-    subscription: Annotated[str, typer.Argument(help="Azure subscription ID")],
-    resource_group: Annotated[str | None, typer.Option("--rg", help="Resource group name")] = None,
-    tenant_id: Annotated[str | None, typer.Option(help="Azure tenant ID")] = None,
-    output: Annotated[OutputFormat, typer.Option("-o", "--output")] = OutputFormat.TABLE,
+    pim: PIMOperations,
+    subscription: str,
+    resource_group: str | None,
+    output: OutputFormat,
 ) -> None:
     """List my eligible Azure RBAC roles."""
-    try:
-        auth = get_auth(tenant_id)
-        scope = f"/subscriptions/{subscription}"
-        if resource_group:
-            scope += f"/resourceGroups/{resource_group}"
-
-        with PIMOperations(auth) as pim:
-            roles = pim.list_my_eligible_azure_roles(scope)
-            data = [
-                {
-                    "roleDefinitionId": r.role_definition_id,
-                    "scope": r.scope,
-                    "principalType": r.principal_type,
-                }
-                for r in roles
-            ]
-            output_result(data, output)
-
-    except PIMError as e:
-        console.print(f"[red]Error: {e.message}[/red]")
-        raise typer.Exit(1) from e
+    scope = f"/subscriptions/{subscription}"
+    if resource_group:
+        scope += f"/resourceGroups/{resource_group}"
+
+    roles = pim.list_my_eligible_azure_roles(scope)
+    data = (
+        {
+            "roleDefinitionId": r.role_definition_id,
+            "scope": r.scope,
+            "principalType": r.principal_type,
+        }
+        for r in roles
+    )
+    output_result(data, output)
 
 
 @azure_app.command("active")
+@click.argument("subscription")
+@click.option("--rg", "resource_group", help="Resource group name")
+@output_option
+@pim_command()
 def list_my_active_azure(
-    subscription: Annotated[str, typer.Argument(help="Azure subscription ID")],
-    resource_group: Annotated[str | None, typer.Option("--rg", help="Resource group name")] = None,
-    tenant_id: Annotated[str | None, typer.Option(help="Azure tenant ID")] = None,
-    output: Annotated[OutputFormat, typer.Option("-o", "--output")] = OutputFormat.TABLE,
+    pim: PIMOperations,
+    subscription: str,
+    resource_group: str | None,
+    output: OutputFormat,
 ) -> None:
     """List my active Azure RBAC roles."""
-    try:
-        auth = get_auth(tenant_id)
-        scope = f"/subscriptions/{subscription}"
-        if resource_group:
-            scope += f"/resourceGroups/{resource_group}"
-
-        with PIMOperations(auth) as pim:
-            roles = pim.list_my_active_azure_roles(scope)
-            data = [
-                {
-                    "roleDefinitionId": r.role_definition_id,
-                    "scope": r.scope,
-                    "status": r.status,
-                }
-                for r in roles
-            ]
-            output_result(data, output)
-
-    except PIMError as e:
-        console.print(f"[red]Error: {e.message}[/red]")
-        raise typer.Exit(1) from e
+    scope = f"/subscriptions/{subscription}"
+    if resource_group:
+        scope += f"/resourceGroups/{resource_group}"
+
+    roles = pim.list_my_active_azure_roles(scope)
+    data = (
+        {
+            "roleDefinitionId": r.role_definition_id,
+            "scope": r.scope,
+            "status": r.status,
+        }
+        for r in roles
+    )
+    output_result(data, output)
 
 
 # ==================== Audit Commands ====================
 
 
 @app.command("audit")
+@click.option("--top", "-n", type=int, default=50, help="Number of events")
+@output_option
+@pim_command()
 def list_audit_events(
-    top: Annotated[int, typer.Option("--top", "-n", help="Number of events")] = 50,
-    tenant_id: Annotated[str | None, typer.Option(help="Azure tenant ID")] = None,
-    output: Annotated[OutputFormat, typer.Option("-o", "--output")] = OutputFormat.TABLE,
+    pim: PIMOperations,
+    top: int,
+    output: OutputFormat,
 ) -> None:
     """List recent PIM audit events."""
-    try:
-        auth = get_auth(tenant_id)
-        with PIMOperations(auth) as pim:
-            events = pim.list_pim_audit_events(top=top)
-            data = [
-                {
-                    "activityDisplayName": e.get("activityDisplayName"),
-                    "activityDateTime": e.get("activityDateTime"),
-                    "result": e.get("result"),
-                }
-                for e in events
-            ]
-            output_result(data, output)
-
-    except PIMError as e:
-        console.print(f"[red]Error: {e.message}[/red]")
-        raise typer.Exit(1) from e
+    events = pim.list_pim_audit_events(top=top)
+    data = (
+        {
+            "activityDisplayName": e.get("activityDisplayName"),
+            "activityDateTime": e.get("activityDateTime"),
+            "result": e.get("result"),
+        }
+        for e in events
+    )
+    output_result(data, output)
 
 
 # ==================== Config Commands ====================
@@ -510,48 +728,44 @@ def list_audit_events(
 @config_app.command("show")
 def show_config() -> None:
     """Show current configuration."""
+    from azure_pim.config import PIMConfig
+
     try:
         config = PIMConfig.from_env()
-        console.print(f"Tenant ID: {config.tenant_id}")
-        console.print(f"Client ID: {config.client_id or '(not set)'}")
-        console.print(f"Default Duration: {config.default_duration}")
-        console.print(f"Cache Path: {config.cache_path}")
+        get_console().print(f"Tenant ID: {config.tenant_id}")
+        get_console().print(f"Client ID: {config.client_id or '(not set)'}")
+        get_console().print(f"Default Duration: {config.default_duration}")
+        get_console().print(f"Cache Path: {config.cache_path}")
     except ValueError as e:
-        console.print(f"[yellow]Configuration incomplete: {e}[/yellow]")
+        get_console().print(f"[yellow]Configuration incomplete: {e}[/yellow]")
 
 
 @config_app.command("clear-cache")
 def clear_cache() -> None:
     """Clear token cache."""
+    from azure_pim.config import PIMConfig
+
     try:
         config = PIMConfig.from_env()
         if config.cache_path.exists():
             config.cache_path.unlink()
-            console.print("[green]Token cache cleared[/green]")
+            get_console().print("[green]Token cache cleared[/green]")
         else:
-            console.print("[yellow]No cache file found[/yellow]")
+            get_console().print("[yellow]No cache file found[/yellow]")
     except Exception as e:
-        console.print(f"[red]Error clearing cache: {e}[/red]")
+        get_console().print(f"[red]Error clearing cache: {e}[/red]")
 
 
 # ==================== Version ====================
 
 
-@app.callback()
-def main(
-    verbose: Annotated[bool, typer.Option("-v", "--verbose", help="Enable verbose output")] = False,
-) -> None:
-    """Azure PIM CLI - Manage privileged identity assignments."""
-    setup_logging(verbose)
-
-
 def version_callback(value: bool) -> None:
     """Print version and exit."""
     if value:
         from azure_pim import __version__
 
-        console.print(f"azure-pim version {__version__}")
-        raise typer.Exit()
+        get_console().print(f"azure-pim version {__version__}")
+        raise click.exceptions.Exit()
 
 
 @app.command("version")
@@ -559,7 +773,7 @@ def version() -> None:
     """Show version information."""
     from azure_pim import __version__
 
-    console.print(f"azure-pim version {__version__}")
+    get_console().print(f"azure-pim version {__version__}")
 
 
 if __name__ == "__main__":
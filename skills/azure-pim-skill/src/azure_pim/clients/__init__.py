@@ -1,6 +1,29 @@
 """API clients for Azure PIM operations."""
 
-from azure_pim.clients.arm import ARMClient
-from azure_pim.clients.graph import GraphClient
+from __future__ import annotations
 
-__all__ = ["GraphClient", "ARMClient"]
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from azure_pim.clients.arm import ARMClient
+    from azure_pim.clients.graph import ActivationSpec, AsyncGraphClient, GraphClient
+
+# Resolved on first access so importing one client does not load the other.
+_LAZY_EXPORTS = {
+    "GraphClient": "azure_pim.clients.graph",
+    "AsyncGraphClient": "azure_pim.clients.graph",
+    "ActivationSpec": "azure_pim.clients.graph",
+    "ARMClient": "azure_pim.clients.arm",
+}
+
+__all__ = ["GraphClient", "AsyncGraphClient", "ActivationSpec", "ARMClient"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
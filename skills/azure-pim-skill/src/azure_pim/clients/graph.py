@@ -9,18 +9,323 @@ Handles:
 
 from __future__ import annotations
 
+import asyncio
+import itertools
+import json
 import logging
-from typing import TYPE_CHECKING, Any
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from azure_pim.auth import TOKEN_REFRESH_MARGIN, _token_expiry
+from azure_pim.config import RetryConfig
+from azure_pim.exceptions import (
+    APIError,
+    AssignmentNotFoundError,
+    RateLimitError,
+    RoleNotFoundError,
+)
+
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
-import httpx
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
 
-from azure_pim.exceptions import APIError, AssignmentNotFoundError, RateLimitError, RoleNotFoundError
+    import httpx
 
-if TYPE_CHECKING:
     from azure_pim.auth import PIMAuth
 
+_T = TypeVar("_T")
+
+_EXPIRED = datetime.min.replace(tzinfo=timezone.utc)
+_MISSING = object()
+
+# Read-mostly lookups cached per client instance; see invalidate().
+CACHE_NAMES = ("role_definitions", "roles_by_name", "policies", "users", "service_principals")
+
 logger = logging.getLogger(__name__)
 
+# Policy assignments for directory roles all live at the tenant root scope.
+_DIRECTORY_POLICY_SCOPE = " and scopeId eq '/' and scopeType eq 'DirectoryRole'"
+
+# Graph accepts at most this many sub-requests per $batch call.
+MAX_BATCH_SIZE = 20
+
+# Throttling and gateway errors that are worth retrying.
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# A gateway error or dropped connection can follow a POST that Graph already
+# acted on (activations, assignments), so POSTs only retry when throttled.
+POST_RETRY_STATUS_CODES = frozenset({429})
+
+
+def _loads(content: bytes) -> Any:
+    """Decode a JSON body, using orjson when it is installed."""
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
+
+def _dumps(data: Any) -> bytes | None:
+    """Encode a JSON request body, using orjson when it is installed."""
+    if data is None:
+        return None
+    if orjson is not None:
+        return cast("bytes", orjson.dumps(data))
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _parse_response(response: httpx.Response, endpoint: str) -> dict[str, Any]:
+    """Map a Graph response to its JSON body or the matching PIM exception."""
+    if response.status_code == 429:
+        retry_after = response.headers.get("Retry-After", "60")
+        raise RateLimitError(
+            f"Rate limited. Retry after {retry_after} seconds",
+            status_code=429,
+        )
+
+    if response.status_code == 404:
+        raise RoleNotFoundError(f"Resource not found: {endpoint}")
+
+    if response.status_code >= 400:
+        body = _loads(response.content) if response.content else {}
+        error_msg = body.get("error", {}).get("message", response.text)
+        raise APIError(
+            f"Graph API error: {error_msg}",
+            status_code=response.status_code,
+            response_body=body,
+        )
+
+    if response.status_code == 204:
+        return {}
+
+    return cast("dict[str, Any]", _loads(response.content))
+
+
+@dataclass(frozen=True, slots=True)
+class ActivationSpec:
+    """One role to activate with :meth:`AsyncGraphClient.activate_roles`."""
+
+    role_definition_id: str
+    directory_scope_id: str = "/"
+    justification: str = ""
+    duration: str = "PT1H"
+    ticket_number: str | None = None
+    ticket_system: str | None = None
+
+
+class _TTLCache:
+    """Thread-safe LRU cache whose entries expire ``ttl`` seconds after being stored."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        """Return the cached value or ``_MISSING``."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _MISSING
+            if entry[0] < time.monotonic():
+                del self._data[key]
+                return _MISSING
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class _ETagCache:
+    """Thread-safe LRU of ``(etag, body)`` per request, for conditional GETs."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, tuple[str, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> tuple[str, dict[str, Any]] | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+            return entry
+
+    def set(self, key: str, etag: str, body: dict[str, Any]) -> None:
+        with self._lock:
+            self._data[key] = (etag, body)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+def _new_caches() -> dict[str, _TTLCache]:
+    return {name: _TTLCache() for name in CACHE_NAMES}
+
+
+def _batch_chunks(requests: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    """Split sub-requests into $batch bodies, numbering them by position."""
+    numbered = [{"id": str(i), "method": "GET", **req} for i, req in enumerate(requests)]
+    return [numbered[i : i + MAX_BATCH_SIZE] for i in range(0, len(numbered), MAX_BATCH_SIZE)]
+
+
+def _batch_bodies(responses: list[dict[str, Any]]) -> list[dict[str, Any] | None]:
+    """Unwrap $batch sub-responses, mapping 404 to ``None`` and raising on other errors."""
+    bodies: list[dict[str, Any] | None] = []
+    for response in responses:
+        status = response.get("status", 0)
+        body = response.get("body") or {}
+        if status == 404:
+            bodies.append(None)
+        elif status >= 400:
+            error_msg = body.get("error", {}).get("message", f"status {status}")
+            raise APIError(f"Graph API error: {error_msg}", status_code=status, response_body=body)
+        else:
+            bodies.append(body)
+    return bodies
+
+
+def _token_fresh(expires_on: datetime) -> bool:
+    """Whether a token expiring at ``expires_on`` can still be sent."""
+    return expires_on > datetime.now(tz=timezone.utc) + TOKEN_REFRESH_MARGIN
+
+
+def _pool_limits(max_connections: int, max_keepalive_connections: int) -> httpx.Limits:
+    """Connection pool sized for fanning out many Graph calls over HTTP/2."""
+    import httpx
+
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=30.0,
+    )
+
+
+def _retry_statuses(method: str) -> frozenset[int]:
+    """Status codes that are safe to retry for ``method``."""
+    return POST_RETRY_STATUS_CODES if method == "POST" else RETRY_STATUS_CODES
+
+
+def _retry_transport_error(method: str, error: httpx.TransportError) -> bool:
+    """Whether a failed send can be repeated; a POST only if it never connected."""
+    import httpx
+
+    return method != "POST" or isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
+
+
+def _log_retry(method: str, endpoint: str, attempt: int, max_retries: int, delay: float) -> None:
+    logger.warning(
+        "Graph %s %s failed (attempt %d/%d), retrying in %.1fs",
+        method,
+        endpoint,
+        attempt + 1,
+        max_retries + 1,
+        delay,
+    )
+
+
+def _query_params(
+    params: dict[str, str] | None = None,
+    select: list[str] | None = None,
+    top: int | None = None,
+) -> dict[str, str]:
+    """Add OData ``$select``/``$top`` options to query params."""
+    query = dict(params or {})
+    if select:
+        query["$select"] = ",".join(select)
+    if top:
+        query["$top"] = str(min(top, GraphClient.MAX_PAGE_SIZE))
+    return query
+
+
+def _parse_conditional(
+    response: httpx.Response,
+    endpoint: str,
+    etags: _ETagCache,
+    cache_key: str | None,
+) -> dict[str, Any]:
+    """Parse a response, serving 304s from and storing ETagged bodies in ``etags``."""
+    if cache_key is None:
+        return _parse_response(response, endpoint)
+    if response.status_code == 304:
+        entry = etags.get(cache_key)
+        if entry is not None:
+            return entry[1]
+    body = _parse_response(response, endpoint)
+    etag = response.headers.get("ETag")
+    if etag:
+        etags.set(cache_key, etag, body)
+    return body
+
+
+def _odata_eq(field: str, value: str) -> str:
+    """Build an OData ``eq`` comparison, doubling quotes inside the literal."""
+    escaped = value.replace("'", "''")
+    return f"{field} eq '{escaped}'"
+
+
+def _assignment_filter(principal_id: str | None, role_definition_id: str | None) -> dict[str, str]:
+    """Build ``$filter`` params for schedule listings."""
+    filters = []
+    if principal_id:
+        filters.append(_odata_eq("principalId", principal_id))
+    if role_definition_id:
+        filters.append(_odata_eq("roleDefinitionId", role_definition_id))
+
+    params: dict[str, str] = {}
+    if filters:
+        params["$filter"] = " and ".join(filters)
+    return params
+
+
+def _activation_payload(
+    role_definition_id: str,
+    directory_scope_id: str,
+    justification: str,
+    duration: str,
+    ticket_number: str | None,
+    ticket_system: str | None,
+) -> dict[str, Any]:
+    """Build the selfActivate schedule request body."""
+    payload: dict[str, Any] = {
+        "action": "selfActivate",
+        "roleDefinitionId": role_definition_id,
+        "directoryScopeId": directory_scope_id,
+        "justification": justification,
+        "scheduleInfo": {
+            "expiration": {
+                "type": "afterDuration",
+                "duration": duration,
+            },
+        },
+    }
+
+    if ticket_number or ticket_system:
+        payload["ticketInfo"] = {}
+        if ticket_number:
+            payload["ticketInfo"]["ticketNumber"] = ticket_number
+        if ticket_system:
+            payload["ticketInfo"]["ticketSystem"] = ticket_system
+
+    return payload
+
 
 class GraphClient:
     """Microsoft Graph API client for Entra ID PIM.
@@ -33,27 +338,51 @@ class GraphClient:
 
     BASE_URL = "https://graph.microsoft.com/v1.0"
     BETA_URL = "https://graph.microsoft.com/beta"
+    MAX_PAGE_SIZE = 999
 
-    def __init__(self, auth: PIMAuth, timeout: float = 30.0) -> None:
+    def __init__(
+        self,
+        auth: PIMAuth,
+        timeout: float = 30.0,
+        retry: RetryConfig | None = None,
+        max_connections: int = 200,
+        max_keepalive_connections: int = 50,
+    ) -> None:
         self.auth = auth
         self.timeout = timeout
+        self.retry = retry or RetryConfig()
+        self.limits = _pool_limits(max_connections, max_keepalive_connections)
         self._client: httpx.Client | None = None
+        self._token_expires_on = _EXPIRED
+        self._token_lock = threading.Lock()
+        self._caches = _new_caches()
+        self._etags = _ETagCache()
 
     def _get_client(self) -> httpx.Client:
-        """Get or create HTTP client with auth headers."""
-        token = self.auth.get_graph_token()
-        if self._client is None:
-            self._client = httpx.Client(
-                base_url=self.BASE_URL,
-                timeout=self.timeout,
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json",
-                },
-            )
-        else:
-            self._client.headers["Authorization"] = f"Bearer {token}"
-        return self._client
+        """Get or create HTTP client, refreshing its auth header near token expiry."""
+        if self._client is not None and _token_fresh(self._token_expires_on):
+            return self._client
+
+        import httpx
+
+        with self._token_lock:
+            if self._client is None or not _token_fresh(self._token_expires_on):
+                token = self.auth.get_graph_token()
+                if self._client is None:
+                    self._client = httpx.Client(
+                        base_url=self.BASE_URL,
+                        timeout=self.timeout,
+                        limits=self.limits,
+                        http2=True,
+                        headers={
+                            "Authorization": f"Bearer {token}",
+                            "Content-Type": "application/json",
+                        },
+                    )
+                else:
+                    self._client.headers["Authorization"] = f"Bearer {token}"
+                self._token_expires_on = _token_expiry(token)
+            return self._client
 
     def _request(
         self,
@@ -63,8 +392,11 @@ class GraphClient:
         json_data: dict[str, Any] | None = None,
         params: dict[str, str] | None = None,
         use_beta: bool = False,
+        cache_key: str | None = None,
     ) -> dict[str, Any]:
-        """Make HTTP request to Graph API."""
+        """Make HTTP request to Graph API, retrying throttled and transient failures."""
+        import httpx
+
         client = self._get_client()
 
         if use_beta:
@@ -72,46 +404,88 @@ class GraphClient:
         else:
             url = endpoint
 
-        try:
-            response = client.request(
-                method,
-                url,
-                json=json_data,
-                params=params,
-            )
-
-            if response.status_code == 429:
-                retry_after = response.headers.get("Retry-After", "60")
-                raise RateLimitError(
-                    f"Rate limited. Retry after {retry_after} seconds",
-                    status_code=429,
+        content = _dumps(json_data)
+        etag = self._etags.get(cache_key) if cache_key else None
+        headers = {"If-None-Match": etag[0]} if etag else None
+        retry_statuses = _retry_statuses(method)
+        for attempt in range(self.retry.max_retries + 1):
+            last_attempt = attempt == self.retry.max_retries
+            try:
+                response = client.request(
+                    method,
+                    url,
+                    content=content,
+                    params=params,
+                    headers=headers,
                 )
-
-            if response.status_code == 404:
-                raise RoleNotFoundError(f"Resource not found: {endpoint}")
-
-            if response.status_code >= 400:
-                body = response.json() if response.content else {}
-                error_msg = body.get("error", {}).get("message", response.text)
-                raise APIError(
-                    f"Graph API error: {error_msg}",
-                    status_code=response.status_code,
-                    response_body=body,
-                )
-
-            if response.status_code == 204:
-                return {}
-
-            return response.json()
-
-        except httpx.HTTPError as e:
-            raise APIError(f"HTTP request failed: {e}", status_code=0) from e
+            except httpx.TransportError as e:
+                if last_attempt or not _retry_transport_error(method, e):
+                    raise APIError(f"HTTP request failed: {e}", status_code=0) from e
+                delay = self.retry.delay(attempt)
+            except httpx.HTTPError as e:
+                raise APIError(f"HTTP request failed: {e}", status_code=0) from e
+            else:
+                if last_attempt or response.status_code not in retry_statuses:
+                    break
+                delay = self.retry.delay(attempt, response.headers.get("Retry-After"))
+
+            _log_retry(method, endpoint, attempt, self.retry.max_retries, delay)
+            time.sleep(delay)
+
+        return _parse_conditional(response, endpoint, self._etags, cache_key)
+
+    def _paged(
+        self,
+        endpoint: str,
+        params: dict[str, str] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield ``value`` items, fetching ``@odata.nextLink`` pages on demand."""
+        result = self._request("GET", endpoint, params=params)
+        yield from result.get("value", [])
+        next_link = result.get("@odata.nextLink")
+        while next_link:
+            result = self._request("GET", next_link)
+            yield from result.get("value", [])
+            next_link = result.get("@odata.nextLink")
+
+    def _list(
+        self,
+        endpoint: str,
+        *,
+        params: dict[str, str] | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Collect paged items, requesting no further pages once ``limit`` is reached."""
+        return list(itertools.islice(self._paged(endpoint, params), limit))
 
     def close(self) -> None:
         """Close HTTP client."""
         if self._client:
             self._client.close()
             self._client = None
+            self._token_expires_on = _EXPIRED
+
+    def _get_conditional(
+        self, endpoint: str, params: dict[str, str] | None = None
+    ) -> dict[str, Any]:
+        """GET with ``If-None-Match``, reusing the stored body on 304 Not Modified."""
+        return self._request("GET", endpoint, params=params, cache_key=endpoint)
+
+    def _cached(self, cache_name: str, key: str, refresh: bool, fetch: Callable[[], _T]) -> _T:
+        """Return ``fetch()`` through the named TTL cache unless ``refresh`` is set."""
+        cache = self._caches[cache_name]
+        if not refresh:
+            value = cache.get(key)
+            if value is not _MISSING:
+                return cast("_T", value)
+        value = fetch()
+        cache.set(key, value)
+        return value
+
+    def invalidate(self, cache_name: str | None = None) -> None:
+        """Drop cached lookups, either one cache from ``CACHE_NAMES`` or all of them."""
+        for name in [cache_name] if cache_name else CACHE_NAMES:
+            self._caches[name].clear()
 
     def __enter__(self) -> GraphClient:
         return self
@@ -121,31 +495,69 @@ class GraphClient:
 
     # ==================== Role Definitions ====================
 
-    def list_role_definitions(self) -> list[dict[str, Any]]:
-        """List all directory role definitions."""
-        result = self._request("GET", "/roleManagement/directory/roleDefinitions")
-        return result.get("value", [])
+    def iter_role_definitions(
+        self,
+        select: list[str] | None = None,
+        top: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate directory role definitions, ``top`` per page."""
+        return self._paged(
+            "/roleManagement/directory/roleDefinitions", _query_params(select=select, top=top)
+        )
 
-    def get_role_definition(self, role_id: str) -> dict[str, Any]:
+    def list_role_definitions(
+        self,
+        limit: int | None = None,
+        select: list[str] | None = None,
+        top: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """List directory role definitions, up to ``limit`` if given."""
+        return list(itertools.islice(self.iter_role_definitions(select, top), limit))
+
+    def get_role_definition(self, role_id: str, refresh: bool = False) -> dict[str, Any]:
         """Get a specific role definition by ID or template ID."""
-        return self._request("GET", f"/roleManagement/directory/roleDefinitions/{role_id}")
+        return self._cached(
+            "role_definitions",
+            role_id,
+            refresh,
+            lambda: self._get_conditional(f"/roleManagement/directory/roleDefinitions/{role_id}"),
+        )
 
-    def find_role_by_name(self, display_name: str) -> dict[str, Any] | None:
+    def find_role_by_name(self, display_name: str, refresh: bool = False) -> dict[str, Any] | None:
         """Find role definition by display name."""
-        result = self._request(
-            "GET",
-            "/roleManagement/directory/roleDefinitions",
-            params={"$filter": f"displayName eq '{display_name}'"},
-        )
-        roles = result.get("value", [])
-        return roles[0] if roles else None
+
+        def fetch() -> dict[str, Any] | None:
+            result = self._request(
+                "GET",
+                "/roleManagement/directory/roleDefinitions",
+                params={"$filter": _odata_eq("displayName", display_name)},
+            )
+            roles = result.get("value", [])
+            return roles[0] if roles else None
+
+        return self._cached("roles_by_name", display_name, refresh, fetch)
 
     # ==================== Eligible Role Assignments ====================
 
+    def iter_eligible_assignments(
+        self,
+        principal_id: str | None = None,
+        role_definition_id: str | None = None,
+        select: list[str] | None = None,
+        top: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate eligible role assignments across all pages."""
+        return self._paged(
+            "/roleManagement/directory/roleEligibilitySchedules",
+            _query_params(_assignment_filter(principal_id, role_definition_id), select, top),
+        )
+
     def list_eligible_assignments(
         self,
         principal_id: str | None = None,
         role_definition_id: str | None = None,
+        select: list[str] | None = None,
+        top: int | None = None,
     ) -> list[dict[str, Any]]:
         """List eligible role assignments.
 
@@ -153,30 +565,14 @@ class GraphClient:
             principal_id: Filter by user/service principal ID
             role_definition_id: Filter by role definition ID
         """
-        filters = []
-        if principal_id:
-            filters.append(f"principalId eq '{principal_id}'")
-        if role_definition_id:
-            filters.append(f"roleDefinitionId eq '{role_definition_id}'")
-
-        params: dict[str, str] = {}
-        if filters:
-            params["$filter"] = " and ".join(filters)
-
-        result = self._request(
-            "GET",
-            "/roleManagement/directory/roleEligibilitySchedules",
-            params=params,
-        )
-        return result.get("value", [])
+        return list(self.iter_eligible_assignments(principal_id, role_definition_id, select, top))
 
-    def list_my_eligible_roles(self) -> list[dict[str, Any]]:
-        """List eligible roles for the current user."""
-        result = self._request(
-            "GET",
+    def list_my_eligible_roles(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """List eligible roles for the current user, up to ``limit`` if given."""
+        return self._list(
             "/roleManagement/directory/roleEligibilityScheduleRequests/filterByCurrentUser(on='principal')",
+            limit=limit,
         )
-        return result.get("value", [])
 
     def create_eligible_assignment(
         self,
@@ -251,36 +647,35 @@ class GraphClient:
 
     # ==================== Active Role Assignments ====================
 
+    def iter_active_assignments(
+        self,
+        principal_id: str | None = None,
+        role_definition_id: str | None = None,
+        select: list[str] | None = None,
+        top: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate active (assigned) role assignments across all pages."""
+        return self._paged(
+            "/roleManagement/directory/roleAssignmentSchedules",
+            _query_params(_assignment_filter(principal_id, role_definition_id), select, top),
+        )
+
     def list_active_assignments(
         self,
         principal_id: str | None = None,
         role_definition_id: str | None = None,
+        select: list[str] | None = None,
+        top: int | None = None,
     ) -> list[dict[str, Any]]:
         """List active (assigned) role assignments."""
-        filters = []
-        if principal_id:
-            filters.append(f"principalId eq '{principal_id}'")
-        if role_definition_id:
-            filters.append(f"roleDefinitionId eq '{role_definition_id}'")
-
-        params: dict[str, str] = {}
-        if filters:
-            params["$filter"] = " and ".join(filters)
-
-        result = self._request(
-            "GET",
-            "/roleManagement/directory/roleAssignmentSchedules",
-            params=params,
-        )
-        return result.get("value", [])
+        return list(self.iter_active_assignments(principal_id, role_definition_id, select, top))
 
-    def list_my_active_roles(self) -> list[dict[str, Any]]:
-        """List active roles for the current user."""
-        result = self._request(
-            "GET",
+    def list_my_active_roles(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """List active roles for the current user, up to ``limit`` if given."""
+        return self._list(
             "/roleManagement/directory/roleAssignmentScheduleRequests/filterByCurrentUser(on='principal')",
+            limit=limit,
         )
-        return result.get("value", [])
 
     def create_active_assignment(
         self,
@@ -343,25 +738,14 @@ class GraphClient:
             ticket_number: Optional ticket/incident number
             ticket_system: Optional ticket system name (e.g., "ServiceNow")
         """
-        payload: dict[str, Any] = {
-            "action": "selfActivate",
-            "roleDefinitionId": role_definition_id,
-            "directoryScopeId": directory_scope_id,
-            "justification": justification,
-            "scheduleInfo": {
-                "expiration": {
-                    "type": "afterDuration",
-                    "duration": duration,
-                },
-            },
-        }
-
-        if ticket_number or ticket_system:
-            payload["ticketInfo"] = {}
-            if ticket_number:
-                payload["ticketInfo"]["ticketNumber"] = ticket_number
-            if ticket_system:
-                payload["ticketInfo"]["ticketSystem"] = ticket_system
+        payload = _activation_payload(
+            role_definition_id,
+            directory_scope_id,
+            justification,
+            duration,
+            ticket_number,
+            ticket_system,
+        )
 
         return self._request(
             "POST",
@@ -398,12 +782,16 @@ class GraphClient:
         )
         return result.get("value", [])
 
-    def get_policy(self, policy_id: str) -> dict[str, Any]:
+    def get_policy(self, policy_id: str, refresh: bool = False) -> dict[str, Any]:
         """Get a specific policy with its rules."""
-        return self._request(
-            "GET",
-            f"/policies/roleManagementPolicies/{policy_id}",
-            params={"$expand": "rules"},
+        return self._cached(
+            "policies",
+            policy_id,
+            refresh,
+            lambda: self._get_conditional(
+                f"/policies/roleManagementPolicies/{policy_id}",
+                params={"$expand": "rules"},
+            ),
         )
 
     def get_policy_for_role(self, role_definition_id: str) -> dict[str, Any] | None:
@@ -412,7 +800,8 @@ class GraphClient:
             "GET",
             "/policies/roleManagementPolicyAssignments",
             params={
-                "$filter": f"roleDefinitionId eq '{role_definition_id}' and scopeId eq '/' and scopeType eq 'DirectoryRole'"
+                "$filter": _odata_eq("roleDefinitionId", role_definition_id)
+                + _DIRECTORY_POLICY_SCOPE
             },
         )
         assignments = result.get("value", [])
@@ -424,21 +813,27 @@ class GraphClient:
 
     # ==================== Audit Logs ====================
 
+    def iter_audit_logs(
+        self,
+        filter_query: str | None = None,
+        select: list[str] | None = None,
+        top: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate directory audit logs, ``top`` per page."""
+        params = {"$filter": filter_query} if filter_query else None
+        return self._paged("/auditLogs/directoryAudits", _query_params(params, select, top))
+
     def list_audit_logs(
         self,
         filter_query: str | None = None,
         top: int = 100,
+        select: list[str] | None = None,
     ) -> list[dict[str, Any]]:
-        """List directory audit logs.
+        """List up to ``top`` directory audit logs.
 
         Example filter: "activityDisplayName eq 'Add member to role'"
         """
-        params: dict[str, str] = {"$top": str(top)}
-        if filter_query:
-            params["$filter"] = filter_query
-
-        result = self._request("GET", "/auditLogs/directoryAudits", params=params)
-        return result.get("value", [])
+        return list(itertools.islice(self.iter_audit_logs(filter_query, select, top), top))
 
     def list_pim_audit_logs(self, top: int = 100) -> list[dict[str, Any]]:
         """List PIM-specific audit events."""
@@ -453,10 +848,498 @@ class GraphClient:
         """Get the current signed-in user's profile."""
         return self._request("GET", "/me")
 
-    def get_user(self, user_id: str) -> dict[str, Any]:
+    def get_user(self, user_id: str, refresh: bool = False) -> dict[str, Any]:
+        """Get user by ID or UPN."""
+        return self._cached(
+            "users", user_id, refresh, lambda: self._get_conditional(f"/users/{user_id}")
+        )
+
+    def get_service_principal(self, sp_id: str, refresh: bool = False) -> dict[str, Any]:
+        """Get service principal by ID."""
+        return self._cached(
+            "service_principals",
+            sp_id,
+            refresh,
+            lambda: self._get_conditional(f"/servicePrincipals/{sp_id}"),
+        )
+
+    # ==================== Batching ====================
+
+    def batch(self, requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Send sub-requests through ``/$batch``, 20 per round-trip.
+
+        Each request is a dict with ``url`` (relative, e.g. ``/users/{id}``) and
+        optionally ``method``, ``headers`` and ``body``. Sub-responses are
+        returned in request order.
+        """
+        responses: list[dict[str, Any]] = []
+        for chunk in _batch_chunks(requests):
+            result = self._request("POST", "/$batch", json_data={"requests": chunk})
+            responses.extend(sorted(result.get("responses", []), key=lambda r: int(r["id"])))
+        return responses
+
+    def get_users(self, user_ids: list[str]) -> list[dict[str, Any] | None]:
+        """Get several users by ID or UPN; missing users are ``None``."""
+        return _batch_bodies(self.batch([{"url": f"/users/{u}"} for u in user_ids]))
+
+    def get_role_definitions(self, role_ids: list[str]) -> list[dict[str, Any] | None]:
+        """Get several role definitions by ID; missing roles are ``None``."""
+        base = "/roleManagement/directory/roleDefinitions"
+        return _batch_bodies(self.batch([{"url": f"{base}/{r}"} for r in role_ids]))
+
+
+class AsyncGraphClient:
+    """Asynchronous Microsoft Graph client for Entra ID PIM.
+
+    Mirrors the read and activation methods of :class:`GraphClient` so that
+    independent requests can be issued concurrently over one connection pool.
+
+    Example:
+        >>> async with AsyncGraphClient(auth) as graph:
+        ...     users = await asyncio.gather(*(graph.get_user(u) for u in user_ids))
+    """
+
+    BASE_URL = GraphClient.BASE_URL
+    BETA_URL = GraphClient.BETA_URL
+    MAX_PAGE_SIZE = GraphClient.MAX_PAGE_SIZE
+
+    def __init__(
+        self,
+        auth: PIMAuth,
+        timeout: float = 30.0,
+        max_connections: int = 200,
+        max_keepalive_connections: int = 50,
+        retry: RetryConfig | None = None,
+    ) -> None:
+        self.auth = auth
+        self.timeout = timeout
+        self.retry = retry or RetryConfig()
+        self.limits = _pool_limits(max_connections, max_keepalive_connections)
+        self._client: httpx.AsyncClient | None = None
+        self._token_expires_on = _EXPIRED
+        self._token_lock = asyncio.Lock()
+        self._caches = _new_caches()
+        self._etags = _ETagCache()
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create HTTP client, refreshing its auth header near token expiry."""
+        if self._client is not None and _token_fresh(self._token_expires_on):
+            return self._client
+
+        import httpx
+
+        async with self._token_lock:
+            if self._client is None or not _token_fresh(self._token_expires_on):
+                token = await asyncio.to_thread(self.auth.get_graph_token)
+                if self._client is None:
+                    self._client = httpx.AsyncClient(
+                        base_url=self.BASE_URL,
+                        timeout=self.timeout,
+                        limits=self.limits,
+                        http2=True,
+                        headers={
+                            "Authorization": f"Bearer {token}",
+                            "Content-Type": "application/json",
+                        },
+                    )
+                else:
+                    self._client.headers["Authorization"] = f"Bearer {token}"
+                self._token_expires_on = _token_expiry(token)
+            return self._client
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        json_data: dict[str, Any] | None = None,
+        params: dict[str, str] | None = None,
+        use_beta: bool = False,
+        cache_key: str | None = None,
+    ) -> dict[str, Any]:
+        """Make HTTP request to Graph API, retrying throttled and transient failures."""
+        import httpx
+
+        client = await self._get_client()
+        url = f"{self.BETA_URL}{endpoint}" if use_beta else endpoint
+
+        content = _dumps(json_data)
+        etag = self._etags.get(cache_key) if cache_key else None
+        headers = {"If-None-Match": etag[0]} if etag else None
+        retry_statuses = _retry_statuses(method)
+        for attempt in range(self.retry.max_retries + 1):
+            last_attempt = attempt == self.retry.max_retries
+            try:
+                response = await client.request(
+                    method, url, content=content, params=params, headers=headers
+                )
+            except httpx.TransportError as e:
+                if last_attempt or not _retry_transport_error(method, e):
+                    raise APIError(f"HTTP request failed: {e}", status_code=0) from e
+                delay = self.retry.delay(attempt)
+            except httpx.HTTPError as e:
+                raise APIError(f"HTTP request failed: {e}", status_code=0) from e
+            else:
+                if last_attempt or response.status_code not in retry_statuses:
+                    break
+                delay = self.retry.delay(attempt, response.headers.get("Retry-After"))
+
+            _log_retry(method, endpoint, attempt, self.retry.max_retries, delay)
+            await asyncio.sleep(delay)
+
+        return _parse_conditional(response, endpoint, self._etags, cache_key)
+
+    async def _paged(
+        self,
+        endpoint: str,
+        params: dict[str, str] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield ``value`` items, fetching ``@odata.nextLink`` pages on demand."""
+        result = await self._request("GET", endpoint, params=params)
+        for item in result.get("value", []):
+            yield item
+        next_link = result.get("@odata.nextLink")
+        while next_link:
+            result = await self._request("GET", next_link)
+            for item in result.get("value", []):
+                yield item
+            next_link = result.get("@odata.nextLink")
+
+    async def _list(
+        self,
+        endpoint: str,
+        *,
+        params: dict[str, str] | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Collect paged items, requesting no further pages once ``limit`` is reached."""
+        items: list[dict[str, Any]] = []
+        if limit == 0:
+            return items
+        async for item in self._paged(endpoint, params):
+            items.append(item)
+            if limit is not None and len(items) >= limit:
+                break
+        return items
+
+    async def _get_conditional(
+        self, endpoint: str, params: dict[str, str] | None = None
+    ) -> dict[str, Any]:
+        """GET with ``If-None-Match``, reusing the stored body on 304 Not Modified."""
+        return await self._request("GET", endpoint, params=params, cache_key=endpoint)
+
+    async def _cached(
+        self,
+        cache_name: str,
+        key: str,
+        refresh: bool,
+        fetch: Callable[[], Awaitable[_T]],
+    ) -> _T:
+        """Return ``await fetch()`` through the named TTL cache unless ``refresh`` is set."""
+        cache = self._caches[cache_name]
+        if not refresh:
+            value = cache.get(key)
+            if value is not _MISSING:
+                return cast("_T", value)
+        value = await fetch()
+        cache.set(key, value)
+        return value
+
+    async def aclose(self) -> None:
+        """Close HTTP client."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+            self._token_expires_on = _EXPIRED
+
+    def invalidate(self, cache_name: str | None = None) -> None:
+        """Drop cached lookups, either one cache from ``CACHE_NAMES`` or all of them."""
+        for name in [cache_name] if cache_name else CACHE_NAMES:
+            self._caches[name].clear()
+
+    async def __aenter__(self) -> AsyncGraphClient:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.aclose()
+
+    # ==================== Role Definitions ====================
+
+    def iter_role_definitions(
+        self,
+        select: list[str] | None = None,
+        top: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate directory role definitions, ``top`` per page."""
+        return self._paged(
+            "/roleManagement/directory/roleDefinitions", _query_params(select=select, top=top)
+        )
+
+    async def list_role_definitions(
+        self,
+        limit: int | None = None,
+        select: list[str] | None = None,
+        top: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """List directory role definitions, up to ``limit`` if given."""
+        return await self._list(
+            "/roleManagement/directory/roleDefinitions",
+            params=_query_params(select=select, top=top),
+            limit=limit,
+        )
+
+    async def get_role_definition(self, role_id: str, refresh: bool = False) -> dict[str, Any]:
+        """Get a specific role definition by ID or template ID."""
+        return await self._cached(
+            "role_definitions",
+            role_id,
+            refresh,
+            lambda: self._get_conditional(f"/roleManagement/directory/roleDefinitions/{role_id}"),
+        )
+
+    async def find_role_by_name(
+        self, display_name: str, refresh: bool = False
+    ) -> dict[str, Any] | None:
+        """Find role definition by display name."""
+
+        async def fetch() -> dict[str, Any] | None:
+            result = await self._request(
+                "GET",
+                "/roleManagement/directory/roleDefinitions",
+                params={"$filter": _odata_eq("displayName", display_name)},
+            )
+            roles = result.get("value", [])
+            return roles[0] if roles else None
+
+        return await self._cached("roles_by_name", display_name, refresh, fetch)
+
+    # ==================== Role Assignments ====================
+
+    def iter_eligible_assignments(
+        self,
+        principal_id: str | None = None,
+        role_definition_id: str | None = None,
+        select: list[str] | None = None,
+        top: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate eligible role assignments across all pages."""
+        return self._paged(
+            "/roleManagement/directory/roleEligibilitySchedules",
+            _query_params(_assignment_filter(principal_id, role_definition_id), select, top),
+        )
+
+    async def list_eligible_assignments(
+        self,
+        principal_id: str | None = None,
+        role_definition_id: str | None = None,
+        select: list[str] | None = None,
+        top: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """List eligible role assignments."""
+        return await self._list(
+            "/roleManagement/directory/roleEligibilitySchedules",
+            params=_query_params(_assignment_filter(principal_id, role_definition_id), select, top),
+        )
+
+    async def list_my_eligible_roles(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """List eligible roles for the current user, up to ``limit`` if given."""
+        return await self._list(
+            "/roleManagement/directory/roleEligibilityScheduleRequests/filterByCurrentUser(on='principal')",
+            limit=limit,
+        )
+
+    def iter_active_assignments(
+        self,
+        principal_id: str | None = None,
+        role_definition_id: str | None = None,
+        select: list[str] | None = None,
+        top: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate active (assigned) role assignments across all pages."""
+        return self._paged(
+            "/roleManagement/directory/roleAssignmentSchedules",
+            _query_params(_assignment_filter(principal_id, role_definition_id), select, top),
+        )
+
+    async def list_active_assignments(
+        self,
+        principal_id: str | None = None,
+        role_definition_id: str | None = None,
+        select: list[str] | None = None,
+        top: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """List active (assigned) role assignments."""
+        return await self._list(
+            "/roleManagement/directory/roleAssignmentSchedules",
+            params=_query_params(_assignment_filter(principal_id, role_definition_id), select, top),
+        )
+
+    async def list_my_active_roles(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """List active roles for the current user, up to ``limit`` if given."""
+        return await self._list(
+            "/roleManagement/directory/roleAssignmentScheduleRequests/filterByCurrentUser(on='principal')",
+            limit=limit,
+        )
+
+    # ==================== Role Activation (JIT) ====================
+
+    async def activate_role(
+        self,
+        role_definition_id: str,
+        directory_scope_id: str = "/",
+        justification: str = "",
+        duration: str = "PT1H",
+        ticket_number: str | None = None,
+        ticket_system: str | None = None,
+    ) -> dict[str, Any]:
+        """Activate an eligible role (JIT activation)."""
+        payload = _activation_payload(
+            role_definition_id,
+            directory_scope_id,
+            justification,
+            duration,
+            ticket_number,
+            ticket_system,
+        )
+        return await self._request(
+            "POST",
+            "/roleManagement/directory/roleAssignmentScheduleRequests",
+            json_data=payload,
+        )
+
+    async def activate_roles(
+        self,
+        specs: list[ActivationSpec],
+        max_concurrency: int = 5,
+    ) -> list[dict[str, Any] | BaseException]:
+        """Activate several roles concurrently.
+
+        Returns one entry per spec, in order: the schedule request on success
+        or the exception raised for that role, so partial failures can be
+        reported.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def activate(spec: ActivationSpec) -> dict[str, Any]:
+            async with semaphore:
+                return await self.activate_role(**asdict(spec))
+
+        return await asyncio.gather(*(activate(spec) for spec in specs), return_exceptions=True)
+
+    async def deactivate_role(
+        self,
+        role_definition_id: str,
+        directory_scope_id: str = "/",
+    ) -> dict[str, Any]:
+        """Deactivate an active role early."""
+        payload = {
+            "action": "selfDeactivate",
+            "roleDefinitionId": role_definition_id,
+            "directoryScopeId": directory_scope_id,
+        }
+        return await self._request(
+            "POST",
+            "/roleManagement/directory/roleAssignmentScheduleRequests",
+            json_data=payload,
+        )
+
+    # ==================== Role Management Policies ====================
+
+    async def get_policy(self, policy_id: str, refresh: bool = False) -> dict[str, Any]:
+        """Get a specific policy with its rules."""
+        return await self._cached(
+            "policies",
+            policy_id,
+            refresh,
+            lambda: self._get_conditional(
+                f"/policies/roleManagementPolicies/{policy_id}",
+                params={"$expand": "rules"},
+            ),
+        )
+
+    async def get_policy_for_role(self, role_definition_id: str) -> dict[str, Any] | None:
+        """Get the policy assigned to a specific role."""
+        result = await self._request(
+            "GET",
+            "/policies/roleManagementPolicyAssignments",
+            params={
+                "$filter": _odata_eq("roleDefinitionId", role_definition_id)
+                + _DIRECTORY_POLICY_SCOPE
+            },
+        )
+        assignments = result.get("value", [])
+        if not assignments:
+            return None
+
+        policy_id = assignments[0].get("policyId")
+        return await self.get_policy(policy_id) if policy_id else None
+
+    # ==================== Audit Logs ====================
+
+    def iter_audit_logs(
+        self,
+        filter_query: str | None = None,
+        select: list[str] | None = None,
+        top: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate directory audit logs, ``top`` per page."""
+        params = {"$filter": filter_query} if filter_query else None
+        return self._paged("/auditLogs/directoryAudits", _query_params(params, select, top))
+
+    async def list_audit_logs(
+        self,
+        filter_query: str | None = None,
+        top: int = 100,
+        select: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """List up to ``top`` directory audit logs."""
+        params = {"$filter": filter_query} if filter_query else None
+        return await self._list(
+            "/auditLogs/directoryAudits", params=_query_params(params, select, top), limit=top
+        )
+
+    # ==================== User/Principal Info ====================
+
+    async def get_current_user(self) -> dict[str, Any]:
+        """Get the current signed-in user's profile."""
+        return await self._request("GET", "/me")
+
+    async def get_user(self, user_id: str, refresh: bool = False) -> dict[str, Any]:
         """Get user by ID or UPN."""
-        return self._request("GET", f"/users/{user_id}")
+        return await self._cached(
+            "users", user_id, refresh, lambda: self._get_conditional(f"/users/{user_id}")
+        )
 
-    def get_service_principal(self, sp_id: str) -> dict[str, Any]:
+    async def get_service_principal(self, sp_id: str, refresh: bool = False) -> dict[str, Any]:
         """Get service principal by ID."""
-        return self._request("GET", f"/servicePrincipals/{sp_id}")
+        return await self._cached(
+            "service_principals",
+            sp_id,
+            refresh,
+            lambda: self._get_conditional(f"/servicePrincipals/{sp_id}"),
+        )
+
+    # ==================== Batching ====================
+
+    async def batch(self, requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Send sub-requests through ``/$batch``, 20 per round-trip, chunks concurrently."""
+        results = await asyncio.gather(
+            *(
+                self._request("POST", "/$batch", json_data={"requests": chunk})
+                for chunk in _batch_chunks(requests)
+            )
+        )
+        responses = [r for result in results for r in result.get("responses", [])]
+        return sorted(responses, key=lambda r: int(r["id"]))
+
+    async def get_users(self, user_ids: list[str]) -> list[dict[str, Any] | None]:
+        """Get several users by ID or UPN; missing users are ``None``."""
+        return _batch_bodies(await self.batch([{"url": f"/users/{u}"} for u in user_ids]))
+
+    async def get_role_definitions(self, role_ids: list[str]) -> list[dict[str, Any] | None]:
+        """Get several role definitions by ID; missing roles are ``None``."""
+        return _batch_bodies(
+            await self.batch(
+                [{"url": f"/roleManagement/directory/roleDefinitions/{r}"} for r in role_ids]
+            )
+        )
@@ -3,14 +3,60 @@
 from __future__ import annotations
 
 import os
+import random
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Any
 
-import yaml
+_DEFAULT_GRAPH_SCOPES = (
+    "https://graph.microsoft.com/RoleManagement.ReadWrite.Directory",
+    "https://graph.microsoft.com/RoleEligibilitySchedule.ReadWrite.Directory",
+    "https://graph.microsoft.com/RoleAssignmentSchedule.ReadWrite.Directory",
+)
+_DEFAULT_ARM_SCOPES = ("https://management.azure.com/.default",)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class RetryConfig:
+    """Retry policy for throttled (429) and transient (502/503/504) responses.
+
+    Attributes:
+        max_retries: Retries after the first attempt (0 disables retrying)
+        base_delay: Backoff delay in seconds for the first retry
+        max_delay: Upper bound for computed backoff delays
+        jitter: Maximum random fraction added to each backoff delay
+    """
+
+    max_retries: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    jitter: float = 0.5
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """Seconds to wait before retry ``attempt`` (0-based).
+
+        A server-provided ``Retry-After`` (seconds or HTTP-date) wins over the
+        computed exponential backoff.
+        """
+        if retry_after:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                pass
+            try:
+                when = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                pass
+            else:
+                return max((when - datetime.now(tz=timezone.utc)).total_seconds(), 0.0)
+
+        backoff = self.base_delay * 2.0**attempt * (1 + random.uniform(0, self.jitter))  # noqa: S311
+        return min(backoff, self.max_delay)
+
+
+@dataclass(slots=True)
 class PIMConfig:
     """Configuration for Azure PIM operations.
 
@@ -38,13 +84,9 @@ class PIMConfig:
         if not self.authority:
             self.authority = f"https://login.microsoftonline.com/{self.tenant_id}"
         if not self.scopes_graph:
-            self.scopes_graph = [
-                "https://graph.microsoft.com/RoleManagement.ReadWrite.Directory",
-                "https://graph.microsoft.com/RoleEligibilitySchedule.ReadWrite.Directory",
-                "https://graph.microsoft.com/RoleAssignmentSchedule.ReadWrite.Directory",
-            ]
+            self.scopes_graph = list(_DEFAULT_GRAPH_SCOPES)
         if not self.scopes_arm:
-            self.scopes_arm = ["https://management.azure.com/.default"]
+            self.scopes_arm = list(_DEFAULT_ARM_SCOPES)
 
     @classmethod
     def from_env(cls) -> PIMConfig:
@@ -69,8 +111,12 @@ class PIMConfig:
             msg = f"Config file not found: {config_path}"
             raise FileNotFoundError(msg)
 
+        import yaml
+
+        # libyaml's C loader when PyYAML was built with it.
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
         with config_path.open() as f:
-            data: dict[str, Any] = yaml.safe_load(f)
+            data: dict[str, Any] = yaml.load(f, Loader=loader)  # noqa: S506
 
         return cls(
             tenant_id=data.get("tenant_id", ""),
@@ -90,5 +136,8 @@ class PIMConfig:
             "default_duration": self.default_duration,
         }
 
+        import yaml
+
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
         with config_path.open("w") as f:
-            yaml.safe_dump(data, f, default_flow_style=False)
+            yaml.dump(data, f, Dumper=dumper, default_flow_style=False)
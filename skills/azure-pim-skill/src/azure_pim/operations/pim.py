@@ -72,9 +72,9 @@ class PIMOperations:
 
     # ==================== Entra ID Role Operations ====================
 
-    def list_entra_roles(self) -> list[EntraRole]:
-        """List all Entra ID role definitions."""
-        data = self.graph.list_role_definitions()
+    def list_entra_roles(self, limit: int | None = None) -> list[EntraRole]:
+        """List Entra ID role definitions, up to ``limit`` if given."""
+        data = self.graph.list_role_definitions(limit=limit)
         return [EntraRole.model_validate(r) for r in data]
 
     def get_entra_role(self, role_name_or_id: str) -> EntraRole:
@@ -97,13 +97,13 @@ class PIMOperations:
         msg = f"Role not found: {role_name_or_id}"
         raise RoleNotFoundError(msg)
 
-    def list_my_eligible_entra_roles(self) -> list[dict[str, Any]]:
+    def list_my_eligible_entra_roles(self, limit: int | None = None) -> list[dict[str, Any]]:
         """List current user's eligible Entra ID roles."""
-        return self.graph.list_my_eligible_roles()
+        return self.graph.list_my_eligible_roles(limit=limit)
 
-    def list_my_active_entra_roles(self) -> list[dict[str, Any]]:
+    def list_my_active_entra_roles(self, limit: int | None = None) -> list[dict[str, Any]]:
         """List current user's active Entra ID roles."""
-        return self.graph.list_my_active_roles()
+        return self.graph.list_my_active_roles(limit=limit)
 
     def get_entra_role_policy(self, role_name_or_id: str) -> EntraRolePolicy | None:
         """Get the policy for an Entra ID role."""
@@ -0,0 +1,83 @@
+"""Tests for PIM authentication."""
+
+import base64
+import json
+import stat
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from azure_pim.auth import MSALTokenProvider, PIMAuth, TokenProvider
+from azure_pim.config import PIMConfig
+
+
+def _make_jwt(expires_in: timedelta) -> str:
+    exp = int((datetime.now(tz=timezone.utc) + expires_in).timestamp())
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).rstrip(b"=").decode()
+    return f"header.{payload}.signature"
+
+
+class CountingProvider(TokenProvider):
+    """Token provider that records how often it is asked for a token."""
+
+    def __init__(self, expires_in: timedelta) -> None:
+        self.expires_in = expires_in
+        self.calls = 0
+
+    def get_token(self, _scopes: list[str]) -> str:
+        self.calls += 1
+        return _make_jwt(self.expires_in)
+
+
+class TestPIMAuthTokenCache:
+    """Tests for the in-process token cache."""
+
+    def test_valid_token_is_reused(self) -> None:
+        provider = CountingProvider(timedelta(hours=1))
+        auth = PIMAuth(config=PIMConfig(tenant_id="t"), provider=provider)
+
+        first = auth.get_graph_token()
+        assert auth.get_graph_token() == first
+        assert provider.calls == 1
+
+    def test_graph_and_arm_are_cached_separately(self) -> None:
+        provider = CountingProvider(timedelta(hours=1))
+        auth = PIMAuth(config=PIMConfig(tenant_id="t"), provider=provider)
+
+        auth.get_graph_token()
+        auth.get_arm_token()
+        assert provider.calls == 2
+
+    def test_token_near_expiry_is_refreshed(self) -> None:
+        provider = CountingProvider(timedelta(seconds=30))
+        auth = PIMAuth(config=PIMConfig(tenant_id="t"), provider=provider)
+
+        auth.get_graph_token()
+        auth.get_graph_token()
+        assert provider.calls == 2
+
+    def test_opaque_token_is_not_cached(self) -> None:
+        class OpaqueProvider(CountingProvider):
+            def get_token(self, _scopes: list[str]) -> str:
+                self.calls += 1
+                return "opaque-token"
+
+        provider = OpaqueProvider(timedelta(hours=1))
+        auth = PIMAuth(config=PIMConfig(tenant_id="t"), provider=provider)
+
+        assert auth.get_graph_token() == "opaque-token"
+        auth.get_graph_token()
+        assert provider.calls == 2
+
+
+class TestMSALTokenCachePersistence:
+    """Tests for MSALTokenProvider's on-disk cache."""
+
+    def test_save_cache_is_owner_only(self, tmp_path: Path) -> None:
+        config = PIMConfig(tenant_id="t", cache_path=tmp_path / "pim" / "token_cache")
+        provider = MSALTokenProvider(config)
+
+        provider._save_cache()
+
+        assert config.cache_path.exists()
+        assert stat.S_IMODE(config.cache_path.stat().st_mode) == 0o600
+        assert not (tmp_path / "pim" / "token_cache.tmp").exists()
@@ -0,0 +1,99 @@
+"""Tests for the PIM command-line interface."""
+
+import json
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from click.testing import CliRunner
+
+from azure_pim import cli
+from azure_pim.exceptions import PIMError
+
+
+class FakePIM:
+    """Stand-in for PIMOperations returning canned data."""
+
+    def __init__(self) -> None:
+        self.scopes: list[str] = []
+        self.limits: list[int | None] = []
+
+    def list_my_eligible_azure_roles(self, scope: str) -> list[Any]:
+        self.scopes.append(scope)
+        return []
+
+    def list_pim_audit_events(self, top: int = 50) -> list[dict[str, Any]]:
+        return [
+            {
+                "activityDisplayName": f"event {i}",
+                "activityDateTime": "2024-01-01",
+                "result": "success",
+            }
+            for i in range(top)
+        ]
+
+    def list_my_eligible_entra_roles(self, limit: int | None = None) -> list[dict[str, Any]]:
+        self.limits.append(limit)
+        rows = [{"roleDefinitionId": f"role {i}", "status": "Provisioned"} for i in range(5)]
+        return rows[:limit]
+
+    def whoami(self) -> dict[str, Any]:
+        raise PIMError("token expired")
+
+
+@pytest.fixture
+def fake_pim(monkeypatch: pytest.MonkeyPatch) -> FakePIM:
+    pim = FakePIM()
+    monkeypatch.setattr(cli, "get_pim", lambda _tenant_id: pim)
+    return pim
+
+
+class TestCommands:
+    """Tests for command wiring."""
+
+    def test_resource_group_option(self, fake_pim: FakePIM) -> None:
+        result = CliRunner().invoke(cli.app, ["azure", "eligible", "sub-id", "--rg", "my-rg"])
+        assert result.exit_code == 0
+        assert fake_pim.scopes == ["/subscriptions/sub-id/resourceGroups/my-rg"]
+
+    @pytest.mark.usefixtures("fake_pim")
+    def test_pim_error_exits_with_message(self) -> None:
+        result = CliRunner().invoke(cli.app, ["whoami"])
+        assert result.exit_code == 1
+        assert "Error: token expired" in result.output
+
+    @pytest.mark.usefixtures("fake_pim")
+    def test_json_output(self) -> None:
+        result = CliRunner().invoke(cli.app, ["audit", "-n", "3", "-o", "json"])
+        assert result.exit_code == 0
+        events = json.loads(result.output)
+        assert [e["activityDisplayName"] for e in events] == ["event 0", "event 1", "event 2"]
+
+    def test_table_reports_rows_past_the_limit(self, fake_pim: FakePIM) -> None:
+        result = CliRunner().invoke(cli.app, ["entra", "eligible", "--limit", "3"])
+        assert result.exit_code == 0
+        assert fake_pim.limits == [4]
+        assert [line.split("\t")[0] for line in result.stdout.splitlines()[1:]] == [
+            "role 0",
+            "role 1",
+            "role 2",
+        ]
+        assert "... and more" in result.stderr
+
+    @pytest.mark.usefixtures("fake_pim")
+    def test_json_output_stops_at_the_limit(self) -> None:
+        result = CliRunner().invoke(cli.app, ["entra", "eligible", "--limit", "3", "-o", "json"])
+        assert result.exit_code == 0
+        assert len(json.loads(result.output)) == 3
+
+
+class TestSerialize:
+    """Tests for output serialization."""
+
+    def test_flat_rows_are_returned_unchanged(self) -> None:
+        rows = [{"id": "1", "count": 2}]
+        assert cli._serialize(rows) is rows
+
+    def test_nested_values_are_serialized(self) -> None:
+        data = {"when": {"at": datetime(2024, 1, 1, tzinfo=UTC)}}
+        assert cli._serialize(data) == {"when": {"at": "2024-01-01T00:00:00+00:00"}}
@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from azure_pim.config import PIMConfig
+from azure_pim.config import PIMConfig, RetryConfig
 
 
 class TestPIMConfig:
@@ -18,6 +18,16 @@ class TestPIMConfig:
         assert config.default_duration == "PT1H"
         assert "graph.microsoft.com" in config.scopes_graph[0]
 
+    def test_defaults_are_not_shared(self) -> None:
+        first = PIMConfig(tenant_id="a")
+        first.scopes_graph.append("extra")
+        assert "extra" not in PIMConfig(tenant_id="b").scopes_graph
+
+    def test_rejects_unknown_attributes(self) -> None:
+        config = PIMConfig(tenant_id="t")
+        with pytest.raises(AttributeError):
+            config.tenant = "typo"  # type: ignore[attr-defined]
+
     def test_authority_auto_set(self) -> None:
         config = PIMConfig(tenant_id="my-tenant-id")
         assert config.authority == "https://login.microsoftonline.com/my-tenant-id"
@@ -57,3 +67,17 @@ class TestPIMConfig:
     def test_from_file_not_found(self) -> None:
         with pytest.raises(FileNotFoundError):
             PIMConfig.from_file("/nonexistent/config.yaml")
+
+
+class TestRetryConfig:
+    """Tests for RetryConfig backoff delays."""
+
+    def test_backoff_grows_and_is_capped(self) -> None:
+        retry = RetryConfig(base_delay=1.0, max_delay=5.0, jitter=0.0)
+        assert [retry.delay(n) for n in range(4)] == [1.0, 2.0, 4.0, 5.0]
+
+    def test_retry_after_seconds_wins(self) -> None:
+        assert RetryConfig().delay(0, "7") == 7.0
+
+    def test_retry_after_http_date(self) -> None:
+        assert RetryConfig().delay(0, "Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
@@ -0,0 +1,299 @@
+"""Tests for the Microsoft Graph client."""
+
+import asyncio
+import json
+from datetime import timedelta
+from typing import Any
+
+import httpx
+import pytest
+
+from azure_pim.auth import PIMAuth, TokenProvider
+from azure_pim.clients.graph import (
+    ActivationSpec,
+    AsyncGraphClient,
+    GraphClient,
+    _assignment_filter,
+    _ETagCache,
+)
+from azure_pim.config import PIMConfig, RetryConfig
+from azure_pim.exceptions import APIError, RateLimitError
+from tests.test_auth import _make_jwt
+
+
+class StaticProvider(TokenProvider):
+    def get_token(self, _scopes: list[str]) -> str:
+        return "token"
+
+
+@pytest.fixture
+def client() -> GraphClient:
+    return GraphClient(PIMAuth(config=PIMConfig(tenant_id="t"), provider=StaticProvider()))
+
+
+def _paged(
+    client: GraphClient, monkeypatch: pytest.MonkeyPatch, pages: list[list[int]]
+) -> list[str]:
+    """Serve ``pages`` from _request and return the endpoints requested."""
+    requested: list[str] = []
+
+    def fake_request(_method: str, endpoint: str, **_kwargs: Any) -> dict[str, Any]:
+        index = len(requested)
+        requested.append(endpoint)
+        body: dict[str, Any] = {"value": [{"id": i} for i in pages[index]]}
+        if index + 1 < len(pages):
+            body["@odata.nextLink"] = f"https://graph.microsoft.com/v1.0/next?page={index + 1}"
+        return body
+
+    monkeypatch.setattr(client, "_request", fake_request)
+    return requested
+
+
+class TestFilters:
+    """Tests for OData filter building."""
+
+    def test_quotes_are_escaped(self) -> None:
+        assert _assignment_filter("o'brien", None) == {"$filter": "principalId eq 'o''brien'"}
+
+
+class TestPagination:
+    """Tests for @odata.nextLink handling."""
+
+    def test_follows_next_links(self, client: GraphClient, monkeypatch: pytest.MonkeyPatch) -> None:
+        requested = _paged(client, monkeypatch, [[1, 2], [3, 4], [5]])
+        assert [r["id"] for r in client.list_role_definitions()] == [1, 2, 3, 4, 5]
+        assert len(requested) == 3
+
+    def test_stops_at_limit(self, client: GraphClient, monkeypatch: pytest.MonkeyPatch) -> None:
+        requested = _paged(client, monkeypatch, [[1, 2], [3, 4], [5]])
+        assert [r["id"] for r in client.list_role_definitions(limit=3)] == [1, 2, 3]
+        assert len(requested) == 2
+
+    def test_iterator_fetches_pages_lazily(
+        self, client: GraphClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        requested = _paged(client, monkeypatch, [[1, 2], [3, 4], [5]])
+        items = client.iter_eligible_assignments()
+        assert next(items)["id"] == 1
+        assert len(requested) == 1
+        assert [r["id"] for r in items] == [2, 3, 4, 5]
+
+    def test_select_and_top_are_sent(
+        self, client: GraphClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        seen: list[dict[str, str] | None] = []
+
+        def fake_request(_method: str, _endpoint: str, **kwargs: Any) -> dict[str, Any]:
+            seen.append(kwargs.get("params"))
+            return {"value": []}
+
+        monkeypatch.setattr(client, "_request", fake_request)
+        client.list_active_assignments(
+            principal_id="p", select=["id", "roleDefinitionId"], top=5000
+        )
+        assert seen == [
+            {"$filter": "principalId eq 'p'", "$select": "id,roleDefinitionId", "$top": "999"}
+        ]
+
+
+class TestAsyncGraphClient:
+    """Tests for AsyncGraphClient."""
+
+    async def test_gather_fans_out(self) -> None:
+        auth = PIMAuth(config=PIMConfig(tenant_id="t"), provider=StaticProvider())
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, json={"id": request.url.path})
+        )
+        async with AsyncGraphClient(auth) as graph:
+            graph._client = httpx.AsyncClient(base_url=graph.BASE_URL, transport=transport)
+            users = await asyncio.gather(*(graph.get_user(u) for u in ["a", "b", "c"]))
+        assert [u["id"] for u in users] == ["/v1.0/users/a", "/v1.0/users/b", "/v1.0/users/c"]
+        assert graph._client is None
+
+    async def test_activate_roles_reports_partial_failures(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            role = json.loads(request.content)["roleDefinitionId"]
+            if role == "bad":
+                return httpx.Response(400, json={"error": {"message": "not eligible"}})
+            return httpx.Response(201, json={"roleDefinitionId": role})
+
+        auth = PIMAuth(config=PIMConfig(tenant_id="t"), provider=StaticProvider())
+        async with AsyncGraphClient(auth) as graph:
+            graph._client = httpx.AsyncClient(
+                base_url=graph.BASE_URL, transport=httpx.MockTransport(handler)
+            )
+            specs = [ActivationSpec("r1"), ActivationSpec("bad"), ActivationSpec("r2")]
+            results = await graph.activate_roles(specs)
+
+        assert results[0] == {"roleDefinitionId": "r1"}
+        assert isinstance(results[1], Exception)
+        assert results[2] == {"roleDefinitionId": "r2"}
+
+
+def _mock_client(
+    responses: list[httpx.Response | Exception],
+) -> tuple[GraphClient, list[httpx.Request]]:
+    """Build a GraphClient whose transport replays ``responses`` in order.
+
+    Exceptions in ``responses`` are raised by the transport instead.
+    """
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        response = responses[len(seen) - 1]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    auth = PIMAuth(config=PIMConfig(tenant_id="t"), provider=StaticProvider())
+    client = GraphClient(auth, retry=RetryConfig(max_retries=2, base_delay=0.0, jitter=0.0))
+    client._client = httpx.Client(base_url=client.BASE_URL, transport=httpx.MockTransport(handler))
+    return client, seen
+
+
+class TestRetry:
+    """Tests for retrying throttled and transient responses."""
+
+    def test_retries_until_success(self) -> None:
+        client, seen = _mock_client(
+            [
+                httpx.Response(429, headers={"Retry-After": "0"}),
+                httpx.Response(503),
+                httpx.Response(200, json={"id": "me"}),
+            ]
+        )
+        assert client.get_current_user() == {"id": "me"}
+        assert len(seen) == 3
+
+    def test_raises_rate_limit_after_exhaustion(self) -> None:
+        client, seen = _mock_client([httpx.Response(429, headers={"Retry-After": "0"})] * 3)
+        with pytest.raises(RateLimitError):
+            client.get_current_user()
+        assert len(seen) == 3
+
+    def test_client_errors_are_not_retried(self) -> None:
+        client, seen = _mock_client([httpx.Response(400, json={"error": {"message": "bad"}})])
+        with pytest.raises(Exception, match="bad"):
+            client.get_current_user()
+        assert len(seen) == 1
+
+    def test_get_retries_read_timeout(self) -> None:
+        client, seen = _mock_client(
+            [httpx.ReadTimeout("slow"), httpx.Response(200, json={"id": "me"})]
+        )
+        assert client.get_current_user() == {"id": "me"}
+        assert len(seen) == 2
+
+    @pytest.mark.parametrize(
+        "failure",
+        [httpx.Response(503), httpx.ReadTimeout("slow")],
+        ids=["503", "read-timeout"],
+    )
+    def test_post_is_not_resent_after_it_may_have_landed(
+        self, failure: httpx.Response | Exception
+    ) -> None:
+        client, seen = _mock_client([failure, httpx.Response(201, json={})])
+        with pytest.raises(APIError):
+            client.remove_eligible_assignment("p", "r")
+        assert len(seen) == 1
+
+    @pytest.mark.parametrize(
+        "failure",
+        [httpx.Response(429, headers={"Retry-After": "0"}), httpx.ConnectError("refused")],
+        ids=["429", "connect-error"],
+    )
+    def test_post_retries_throttling_and_connect_errors(
+        self, failure: httpx.Response | Exception
+    ) -> None:
+        client, seen = _mock_client([failure, httpx.Response(201, json={"id": "req"})])
+        assert client.remove_eligible_assignment("p", "r") == {"id": "req"}
+        assert len(seen) == 2
+
+
+class TestTokenReuse:
+    """Tests for reusing the bearer token across requests."""
+
+    def test_valid_token_is_not_refetched(self) -> None:
+        auth = PIMAuth(config=PIMConfig(tenant_id="t"), provider=StaticProvider())
+        calls: list[int] = []
+
+        def get_graph_token() -> str:
+            calls.append(1)
+            return _make_jwt(timedelta(hours=1))
+
+        auth.get_graph_token = get_graph_token  # type: ignore[method-assign]
+        client = GraphClient(auth)
+        transport = httpx.MockTransport(lambda _request: httpx.Response(200, json={}))
+        client._client = httpx.Client(base_url=client.BASE_URL, transport=transport)
+
+        for _ in range(3):
+            client.get_current_user()
+        assert len(calls) == 1
+
+
+class TestBatch:
+    """Tests for $batch requests."""
+
+    def test_chunks_and_orders_responses(self) -> None:
+        batches: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            subs = json.loads(request.content)["requests"]
+            responses = [
+                {
+                    "id": r["id"],
+                    "status": 404 if r["url"] == "/users/u3" else 200,
+                    "body": {"url": r["url"]},
+                }
+                for r in reversed(subs)
+            ]
+            batches.append(len(subs))
+            return httpx.Response(200, json={"responses": responses})
+
+        client, _ = _mock_client([])
+        client._client = httpx.Client(
+            base_url=client.BASE_URL, transport=httpx.MockTransport(handler)
+        )
+
+        ids = [f"u{i}" for i in range(25)]
+        users = client.get_users(ids)
+
+        assert batches == [20, 5]
+        assert users[3] is None
+        assert [u["url"] for u in users if u] == [f"/users/{i}" for i in ids if i != "u3"]
+
+
+class TestLookupCache:
+    """Tests for the per-client lookup cache."""
+
+    def test_repeated_lookups_hit_cache(self) -> None:
+        client, seen = _mock_client([httpx.Response(200, json={"id": "u1"})] * 3)
+        client.get_user("u1")
+        client.get_user("u1")
+        assert len(seen) == 1
+
+        client.get_user("u1", refresh=True)
+        client.invalidate("users")
+        client.get_user("u1")
+        assert len(seen) == 3
+
+    def test_refresh_revalidates_with_etag(self) -> None:
+        client, seen = _mock_client(
+            [
+                httpx.Response(200, json={"id": "u1"}, headers={"ETag": 'W/"1"'}),
+                httpx.Response(304),
+            ]
+        )
+        assert client.get_user("u1") == {"id": "u1"}
+        assert client.get_user("u1", refresh=True) == {"id": "u1"}
+        assert seen[1].headers["If-None-Match"] == 'W/"1"'
+
+    def test_etag_cache_is_bounded(self) -> None:
+        etags = _ETagCache(maxsize=2)
+        etags.set("/a", "1", {"id": "a"})
+        etags.set("/b", "2", {"id": "b"})
+        assert etags.get("/a") == ("1", {"id": "a"})
+        etags.set("/c", "3", {"id": "c"})
+        assert etags.get("/b") is None
+        assert etags.get("/a") is not None
@@ -7,6 +7,7 @@ Supports all common operations: projects, SBOMs, vulnerabilities, policies.
 
 Requirements:
     pip install requests python-dotenv
+    pip install orjson  # optional, faster JSON for large findings/vulnerability lists
 
 Usage:
     from python_client import DependencyTrackClient
@@ -23,19 +24,113 @@ Usage:
     client.upload_sbom("bom.json", project_name="my-app", project_version="1.0.0")
 """
 
+import io
+import math
 import os
 import json
+import atexit
 import base64
+import functools
+import hashlib
+import random
+import sqlite3
+import threading
 import time
+import uuid
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator
 from dataclasses import dataclass
 from datetime import datetime
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # orjson is an optional speedup (pip install orjson)
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# On-disk name/version lookup cache shared by CLI invocations (see lookup_cache_ttl)
+LOOKUP_CACHE_PATH = Path(os.getenv("XDG_CACHE_HOME", "~/.cache")).expanduser() / "dtrack" / "lookup.sqlite"
+# Misses are kept only briefly so a project created elsewhere shows up quickly
+LOOKUP_MISS_TTL = 5.0
+
+
+class MultipartStream:
+    """
+    File-like multipart/form-data body that reads the file part lazily.
+
+    requests sends objects with read() and a known length in blocks, so the
+    BOM flows from disk to the socket without being held in memory.
+    """
+
+    def __init__(self, fields: Dict[str, str], name: str, filename: str, fileobj, size: int):
+        self.boundary = uuid.uuid4().hex
+        head = "".join(
+            f'--{self.boundary}\r\nContent-Disposition: form-data; name="{key}"\r\n\r\n{value}\r\n'
+            for key, value in fields.items()
+        )
+        head += (
+            f'--{self.boundary}\r\nContent-Disposition: form-data; name="{name}"; '
+            f'filename="{filename}"\r\nContent-Type: application/octet-stream\r\n\r\n'
+        )
+        tail = f"\r\n--{self.boundary}--\r\n".encode()
+        self._parts = [io.BytesIO(head.encode()), fileobj, io.BytesIO(tail)]
+        self._sizes = [len(head.encode()), size, len(tail)]
+        self._length = sum(self._sizes)
+        self._index = 0
+        self._pos = 0
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        chunks = []
+        while self._index < len(self._parts) and (size < 0 or size > 0):
+            chunk = self._parts[self._index].read(size)
+            if not chunk:
+                self._index += 1
+                continue
+            chunks.append(chunk)
+            self._pos += len(chunk)
+            if size > 0:
+                size -= len(chunk)
+        return b"".join(chunks)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Move to offset; urllib3 rewinds the body this way before a retry."""
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._length
+        self._pos = min(max(offset, 0), self._length)
+        # Parts before the position are left at their end, so read() skips them
+        start = 0
+        for part, part_size in zip(self._parts, self._sizes):
+            part.seek(min(max(self._pos - start, 0), part_size))
+            start += part_size
+        self._index = 0
+        return self._pos
+
 
 @dataclass
 class VulnerabilitySummary:
@@ -77,16 +172,36 @@ class PolicyViolationSummary:
     def total(self) -> int:
         return self.fail + self.warn + self.info
 
+    @classmethod
+    def from_violations(cls, violations: Iterable[Dict[str, Any]]) -> "PolicyViolationSummary":
+        """Tally violation objects (as returned by /violation endpoints) by state."""
+        states = Counter(
+            v["policyViolation"]["violationState"] for v in violations if "policyViolation" in v
+        )
+        return cls(fail=states["FAIL"], warn=states["WARN"], info=states["INFO"])
+
 
 class DependencyTrackClient:
-    """Client for Dependency-Track REST API."""
+    """
+    Client for Dependency-Track REST API.
+
+    One instance may be shared across threads: requests.Session handles
+    concurrent calls as long as pool_maxsize covers the number of workers.
+    Use it as a context manager (or call close()) to release pooled sockets.
+    """
 
     def __init__(
         self,
         base_url: Optional[str] = None,
         api_key: Optional[str] = None,
         timeout: int = 30,
-        verify_ssl: bool = True
+        verify_ssl: bool = True,
+        max_workers: int = 16,
+        cache_ttl: float = 0.0,
+        cache_size: int = 1024,
+        use_http2: bool = False,
+        pool_maxsize: int = 32,
+        lookup_cache_ttl: float = 0.0
     ):
         """
         Initialize the Dependency-Track client.
@@ -96,6 +211,15 @@ class DependencyTrackClient:
             api_key: API key for authentication (or DTRACK_API_KEY env var)
             timeout: Request timeout in seconds
             verify_ssl: Whether to verify SSL certificates
+            max_workers: Concurrent requests used by the batch (*_summaries) methods
+            cache_ttl: Seconds to reuse GET responses (0 disables the cache)
+            cache_size: Maximum number of cached GET responses
+            use_http2: Send API calls over one multiplexed HTTP/2 connection
+                (requires: pip install 'httpx[http2]')
+            pool_maxsize: Pooled connections kept per host; raise it alongside
+                max_workers when fanning out against large instances
+            lookup_cache_ttl: Seconds to keep name/version lookups in
+                LOOKUP_CACHE_PATH across processes (0 or DTRACK_NO_CACHE=1 disables)
         """
         self.base_url = (base_url or os.getenv("DTRACK_URL", "")).rstrip("/")
         self.api_key = api_key or os.getenv("DTRACK_API_KEY", "")
@@ -107,24 +231,79 @@ class DependencyTrackClient:
 
         self.timeout = timeout
         self.verify_ssl = verify_ssl
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        if os.getenv("DTRACK_NO_CACHE") == "1":
+            lookup_cache_ttl = 0.0
+        self.lookup_cache_ttl = lookup_cache_ttl
 
         # Configure session with retries
         self.session = requests.Session()
-        retry_strategy = Retry(
+        retry_kwargs = dict(
             total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504]
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            # BOM uploads and policy updates are safe to replay, so retry them too;
+            # MultipartStream supports seek/tell so urllib3 can rewind the body
+            allowed_methods=frozenset({"GET", "PUT", "POST", "DELETE"})
+        )
+        try:
+            # urllib3 >= 2.0: randomize backoff so parallel CI jobs don't retry in lockstep
+            retry_strategy = Retry(backoff_jitter=0.5, **retry_kwargs)
+        except TypeError:
+            retry_strategy = Retry(**retry_kwargs)
+        # Keep enough pooled connections for the batch methods' worker threads
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=max(pool_maxsize, max_workers),
+            max_retries=retry_strategy
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
+        # Close sockets at interpreter exit even if the client is never closed
+        atexit.register(self.session.close)
 
         self.session.headers.update({
             "X-Api-Key": self.api_key,
             "Content-Type": "application/json",
-            "Accept": "application/json"
+            "Accept": "application/json",
+            # Every encoding urllib3 can decode here (gzip/deflate, plus br/zstd if installed)
+            "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"]
         })
 
+        # Optional HTTP/2 transport: concurrent batch calls become streams on one
+        # connection instead of one socket each. BOM multipart uploads stay on requests.
+        self._http2 = None
+        if use_http2:
+            import httpx
+
+            self._http2 = httpx.Client(
+                headers=dict(self.session.headers),
+                timeout=self.timeout,
+                transport=httpx.HTTPTransport(http2=True, verify=self.verify_ssl, retries=3),
+            )
+
+    def close(self) -> None:
+        """Release pooled connections and the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self._http2 is not None:
+            self._http2.close()
+        self.session.close()
+        atexit.unregister(self.session.close)
+
+    def __enter__(self) -> "DependencyTrackClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
     def _request(
         self,
         method: str,
@@ -133,6 +312,11 @@ class DependencyTrackClient:
     ) -> requests.Response:
         """Make an API request."""
         url = f"{self.base_url}/api/v1{endpoint}"
+        if "json" in kwargs:
+            # Encode ourselves (orjson when available); the session sends JSON Content-Type
+            kwargs["data"] = _json_dumps(kwargs.pop("json"))
+        if self._http2 is not None:
+            return self._request_http2(method, url, **kwargs)
         response = self.session.request(
             method,
             url,
@@ -143,17 +327,132 @@ class DependencyTrackClient:
         response.raise_for_status()
         return response
 
+    def _request_http2(self, method: str, url: str, **kwargs) -> Any:
+        """Send a request over the httpx HTTP/2 client, raising requests.HTTPError on failure."""
+        import httpx
+
+        if "data" in kwargs:
+            kwargs["content"] = kwargs.pop("data")
+        response = self._http2.request(method, url, **kwargs)
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            # Keep the requests exception type callers already handle
+            raise requests.HTTPError(str(e), response=response) from e
+        return response
+
+    def _map(self, func, items: List[Any]) -> List[Any]:
+        """Apply func to items concurrently over the pooled session, keeping order."""
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return list(self._executor.map(func, items))
+
     def _get(self, endpoint: str, **kwargs) -> Any:
-        """Make a GET request and return JSON."""
-        return self._request("GET", endpoint, **kwargs).json()
+        """
+        Make a GET request and return JSON.
+
+        With cache_ttl > 0, responses are reused per (endpoint, params) until
+        they expire or are invalidated. Cached objects are shared between
+        callers, so treat them as read-only.
+        """
+        if self.cache_ttl <= 0:
+            return _json_loads(self._request("GET", endpoint, **kwargs).content)
+
+        key = (endpoint, tuple(sorted((kwargs.get("params") or {}).items())))
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            if hit and hit[0] > time.monotonic():
+                self._cache.move_to_end(key)
+                return hit[1]
+
+        result = _json_loads(self._request("GET", endpoint, **kwargs).content)
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + self.cache_ttl, result)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def _get_paged(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = 100
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every item of a paginated endpoint in page order.
+
+        The first page is fetched on its own to read X-Total-Count; the
+        remaining pages are then requested concurrently. Servers that omit
+        the header are walked sequentially until a short page comes back.
+        """
+        params = {**(params or {}), "pageSize": page_size}
+        response = self._request("GET", endpoint, params={**params, "pageNumber": 1})
+        page = _json_loads(response.content)
+        yield from page
+
+        def fetch(page_number: int) -> List[Dict[str, Any]]:
+            return self._get(endpoint, params={**params, "pageNumber": page_number})
+
+        total = response.headers.get("X-Total-Count")
+        if total is not None:
+            n_pages = math.ceil(int(total) / page_size)
+            for page in self._map(fetch, list(range(2, n_pages + 1))):
+                yield from page
+            return
+
+        page_number = 1
+        while len(page) == page_size:
+            page_number += 1
+            page = fetch(page_number)
+            yield from page
+
+    def invalidate(self, prefix: str = "") -> None:
+        """Drop cached GET responses whose endpoint starts with prefix (all by default)."""
+        with self._cache_lock:
+            for key in [k for k in self._cache if k[0].startswith(prefix)]:
+                del self._cache[key]
+
+    def _lookup_db(self) -> sqlite3.Connection:
+        """Open the lookup cache (one connection per call, so threads don't share it)."""
+        LOOKUP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(LOOKUP_CACHE_PATH, timeout=5)
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS lookup "
+            "(key TEXT PRIMARY KEY, uuid TEXT, value BLOB, expires REAL)"
+        )
+        return db
+
+    def _lookup_key(self, name: str, version: str) -> str:
+        return f"{self.base_url}\0{name}\0{version}"
+
+    def _forget_lookup(
+        self,
+        name: Optional[str] = None,
+        version: Optional[str] = None,
+        uuid: Optional[str] = None
+    ) -> None:
+        """Drop cached lookups for a name/version or for a project UUID."""
+        if self.lookup_cache_ttl <= 0:
+            return
+        try:
+            with closing(self._lookup_db()) as db, db:
+                if uuid:
+                    db.execute("DELETE FROM lookup WHERE uuid = ?", (uuid,))
+                if name and version:
+                    db.execute("DELETE FROM lookup WHERE key = ?", (self._lookup_key(name, version),))
+        except sqlite3.Error:
+            pass
 
     def _put(self, endpoint: str, **kwargs) -> Any:
         """Make a PUT request and return JSON."""
-        return self._request("PUT", endpoint, **kwargs).json()
+        return _json_loads(self._request("PUT", endpoint, **kwargs).content)
 
     def _post(self, endpoint: str, **kwargs) -> Any:
         """Make a POST request and return JSON."""
-        return self._request("POST", endpoint, **kwargs).json()
+        return _json_loads(self._request("POST", endpoint, **kwargs).content)
 
     def _delete(self, endpoint: str, **kwargs) -> None:
         """Make a DELETE request."""
@@ -206,6 +505,19 @@ class DependencyTrackClient:
 
         return self._get("/project", params=params)
 
+    def iter_projects(
+        self,
+        name: Optional[str] = None,
+        exclude_inactive: bool = False,
+        only_root: bool = False,
+        page_size: int = 100
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over all projects, fetching pages after the first concurrently."""
+        params = {"excludeInactive": exclude_inactive, "onlyRoot": only_root}
+        if name:
+            params["name"] = name
+        return self._get_paged("/project", params=params, page_size=page_size)
+
     def get_project(self, uuid: str) -> Dict[str, Any]:
         """Get a project by UUID."""
         return self._get(f"/project/{uuid}")
@@ -215,7 +527,39 @@ class DependencyTrackClient:
         name: str,
         version: str
     ) -> Optional[Dict[str, Any]]:
-        """Look up a project by name and version."""
+        """
+        Look up a project by name and version.
+
+        With lookup_cache_ttl > 0 the result is also kept on disk, so repeated
+        CLI runs (e.g. metrics then gate) skip the round trip.
+        """
+        if self.lookup_cache_ttl <= 0:
+            return self._lookup_project(name, version)
+
+        key = self._lookup_key(name, version)
+        try:
+            with closing(self._lookup_db()) as db:
+                row = db.execute(
+                    "SELECT value FROM lookup WHERE key = ? AND expires > ?", (key, time.time())
+                ).fetchone()
+            if row:
+                return _json_loads(row[0])
+        except sqlite3.Error:
+            pass  # An unusable cache only costs the round trip
+
+        project = self._lookup_project(name, version)
+        ttl = self.lookup_cache_ttl if project else min(self.lookup_cache_ttl, LOOKUP_MISS_TTL)
+        try:
+            with closing(self._lookup_db()) as db, db:
+                db.execute(
+                    "INSERT OR REPLACE INTO lookup VALUES (?, ?, ?, ?)",
+                    (key, project and project.get("uuid"), _json_dumps(project), time.time() + ttl)
+                )
+        except sqlite3.Error:
+            pass
+        return project
+
+    def _lookup_project(self, name: str, version: str) -> Optional[Dict[str, Any]]:
         try:
             return self._get("/project/lookup", params={"name": name, "version": version})
         except requests.HTTPError as e:
@@ -223,6 +567,13 @@ class DependencyTrackClient:
                 return None
             raise
 
+    def get_projects_by_name_version(
+        self,
+        targets: List[tuple]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Look up several (name, version) pairs concurrently."""
+        return self._map(lambda t: self.get_project_by_name_version(*t), targets)
+
     def create_project(
         self,
         name: str,
@@ -256,11 +607,16 @@ class DependencyTrackClient:
         if parent_uuid:
             data["parent"] = {"uuid": parent_uuid}
 
-        return self._put("/project", json=data)
+        project = self._put("/project", json=data)
+        self.invalidate("/project")
+        self._forget_lookup(name, version)
+        return project
 
     def delete_project(self, uuid: str) -> None:
         """Delete a project by UUID."""
         self._delete(f"/project/{uuid}")
+        self.invalidate()
+        self._forget_lookup(uuid=uuid)
 
     def get_project_children(self, uuid: str) -> List[Dict[str, Any]]:
         """Get child projects of a parent project."""
@@ -276,7 +632,9 @@ class DependencyTrackClient:
         project_name: Optional[str] = None,
         project_version: Optional[str] = None,
         auto_create: bool = True,
-        parent_uuid: Optional[str] = None
+        parent_uuid: Optional[str] = None,
+        multipart: bool = True,
+        sha256: bool = False
     ) -> Dict[str, Any]:
         """
         Upload a CycloneDX SBOM to Dependency-Track.
@@ -288,6 +646,9 @@ class DependencyTrackClient:
             project_version: Project version (required if no UUID)
             auto_create: Create project if it doesn't exist
             parent_uuid: UUID of parent project for auto-created projects
+            multipart: Stream the raw file as multipart/form-data; set False to
+                send it base64-encoded in a JSON body (PUT /bom) instead
+            sha256: Also return the BOM's SHA-256 hex digest under "sha256"
 
         Returns:
             Upload response containing token for tracking
@@ -296,91 +657,125 @@ class DependencyTrackClient:
         if not bom_path.exists():
             raise FileNotFoundError(f"BOM file not found: {bom_path}")
 
-        with open(bom_path, "rb") as f:
-            bom_content = base64.b64encode(f.read()).decode("utf-8")
-
-        data = {
-            "bom": bom_content,
-            "autoCreate": auto_create
-        }
-
-        if project_uuid:
-            data["project"] = project_uuid
+        fields = self._bom_fields(project_uuid, project_name, project_version, auto_create, parent_uuid)
+        if multipart:
+            result = self._post_bom_multipart(bom_path, fields)
         else:
-            if not project_name or not project_version:
-                raise ValueError("project_name and project_version required when project_uuid not provided")
-            data["projectName"] = project_name
-            data["projectVersion"] = project_version
-
-        if parent_uuid:
-            data["parentUUID"] = parent_uuid
-
-        return self._put("/bom", json=data)
+            with open(bom_path, "rb") as f:
+                fields["bom"] = base64.b64encode(f.read()).decode("utf-8")
+            result = self._put("/bom", json=fields)
+        # A new BOM changes the project's components, findings and metrics
+        self.invalidate()
+        if auto_create and not project_uuid:
+            self._forget_lookup(project_name, project_version)
+
+        if sha256:
+            with open(bom_path, "rb") as f:
+                if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                    digest = hashlib.file_digest(f, "sha256")
+                else:
+                    digest = hashlib.sha256()
+                    for block in iter(lambda: f.read(1 << 20), b""):
+                        digest.update(block)
+            result["sha256"] = digest.hexdigest()
+        return result
 
     def upload_sbom_multipart(
         self,
         bom_path: str,
-        project_name: str,
-        project_version: str,
-        auto_create: bool = True
+        project_name: Optional[str] = None,
+        project_version: Optional[str] = None,
+        auto_create: bool = True,
+        project_uuid: Optional[str] = None,
+        parent_uuid: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Upload SBOM using multipart form data (no base64 encoding needed).
-        Useful for very large SBOMs.
+
+        Kept for compatibility; upload_sbom now uses multipart by default.
         """
-        bom_path = Path(bom_path)
-        if not bom_path.exists():
-            raise FileNotFoundError(f"BOM file not found: {bom_path}")
+        return self.upload_sbom(
+            bom_path,
+            project_uuid=project_uuid,
+            project_name=project_name,
+            project_version=project_version,
+            auto_create=auto_create,
+            parent_uuid=parent_uuid
+        )
 
-        # Remove Content-Type header for multipart
-        headers = {"X-Api-Key": self.api_key}
+    @staticmethod
+    def _bom_fields(
+        project_uuid: Optional[str],
+        project_name: Optional[str],
+        project_version: Optional[str],
+        auto_create: bool,
+        parent_uuid: Optional[str]
+    ) -> Dict[str, Any]:
+        """Build the project-selection fields shared by both BOM upload formats."""
+        fields: Dict[str, Any] = {"autoCreate": auto_create}
+        if project_uuid:
+            fields["project"] = project_uuid
+        else:
+            if not project_name or not project_version:
+                raise ValueError("project_name and project_version required when project_uuid not provided")
+            fields["projectName"] = project_name
+            fields["projectVersion"] = project_version
+        if parent_uuid:
+            fields["parentUUID"] = parent_uuid
+        return fields
 
+    def _post_bom_multipart(self, bom_path: Path, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """POST /bom as multipart, streaming the file from disk."""
+        form = {k: str(v).lower() if isinstance(v, bool) else v for k, v in fields.items()}
         with open(bom_path, "rb") as f:
-            files = {"bom": (bom_path.name, f)}
-            data = {
-                "projectName": project_name,
-                "projectVersion": project_version,
-                "autoCreate": str(auto_create).lower()
-            }
-
+            body = MultipartStream(form, "bom", bom_path.name, f, bom_path.stat().st_size)
             response = self.session.post(
                 f"{self.base_url}/api/v1/bom",
-                headers=headers,
-                files=files,
-                data=data,
+                headers={"Content-Type": body.content_type},
+                data=body,
                 timeout=self.timeout,
                 verify=self.verify_ssl
             )
-            response.raise_for_status()
-            return response.json()
+        response.raise_for_status()
+        return _json_loads(response.content)
 
     def is_bom_processing_complete(self, token: str) -> bool:
         """Check if BOM processing is complete."""
-        result = self._get(f"/bom/token/{token}")
+        # Status changes between polls, so it never goes through the GET cache
+        result = _json_loads(self._request("GET", f"/bom/token/{token}").content)
         return result.get("processing", True) is False
 
     def wait_for_bom_processing(
         self,
         token: str,
         timeout_seconds: int = 300,
-        poll_interval: int = 5
+        poll_interval: float = 5,
+        initial_interval: float = 0.5
     ) -> bool:
         """
         Wait for BOM processing to complete.
 
+        Polls with capped exponential backoff and full jitter: the n-th wait is
+        random(0, min(poll_interval, initial_interval * 2**n)), so small BOMs are
+        noticed quickly and many concurrent waiters don't poll in lockstep.
+
         Args:
             token: Upload token from upload_sbom response
             timeout_seconds: Maximum time to wait
-            poll_interval: Seconds between status checks
+            poll_interval: Maximum seconds between status checks
+            initial_interval: Backoff ceiling for the first wait
 
         Returns:
             True if processing completed, False if timeout
         """
         start_time = time.time()
+        attempt = 0
         while time.time() - start_time < timeout_seconds:
             if self.is_bom_processing_complete(token):
                 return True
-            time.sleep(poll_interval)
+            time.sleep(random.uniform(0, min(poll_interval, initial_interval * 2 ** attempt)))
+            # Stop doubling once past the cap; an unbounded power overflows the float
+            attempt = min(attempt + 1, 16)
         return False
 
     def export_sbom(
@@ -402,7 +797,8 @@ class DependencyTrackClient:
         """
         params = {"format": format, "variant": variant}
         response = self._request("GET", f"/bom/cyclonedx/project/{project_uuid}", params=params)
-        return response.text
+        # Decode directly; response.text would run charset detection over the whole SBOM
+        return response.content.decode(response.encoding or "utf-8")
 
     # =========================================================================
     # Vulnerabilities
@@ -426,7 +822,8 @@ class DependencyTrackClient:
 
     def get_project_metrics(self, project_uuid: str) -> Dict[str, Any]:
         """Get current vulnerability metrics for a project."""
-        return self._get(f"/metrics/project/{project_uuid}/current")
+        # Read live: metrics are usually checked right after an upload changes them
+        return _json_loads(self._request("GET", f"/metrics/project/{project_uuid}/current").content)
 
     def get_vulnerability_summary(self, project_uuid: str) -> VulnerabilitySummary:
         """Get vulnerability summary for a project."""
@@ -439,6 +836,14 @@ class DependencyTrackClient:
             unassigned=metrics.get("unassigned", 0)
         )
 
+    def get_vulnerability_summaries(
+        self,
+        project_uuids: List[str]
+    ) -> Dict[str, VulnerabilitySummary]:
+        """Get vulnerability summaries for several projects concurrently."""
+        summaries = self._map(self.get_vulnerability_summary, project_uuids)
+        return dict(zip(project_uuids, summaries))
+
     # =========================================================================
     # Components
     # =========================================================================
@@ -452,6 +857,14 @@ class DependencyTrackClient:
         params = {"pageSize": page_size, "pageNumber": page_number}
         return self._get(f"/component/project/{project_uuid}", params=params)
 
+    def iter_project_components(
+        self,
+        project_uuid: str,
+        page_size: int = 100
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over all components of a project, fetching pages concurrently."""
+        return self._get_paged(f"/component/project/{project_uuid}", page_size=page_size)
+
     def get_component(self, uuid: str) -> Dict[str, Any]:
         """Get component details by UUID."""
         return self._get(f"/component/{uuid}")
@@ -492,11 +905,15 @@ class DependencyTrackClient:
         if conditions:
             data["policyConditions"] = conditions
 
-        return self._put("/policy", json=data)
+        policy = self._put("/policy", json=data)
+        self.invalidate("/policy")
+        return policy
 
     def delete_policy(self, uuid: str) -> None:
         """Delete a policy by UUID."""
         self._delete(f"/policy/{uuid}")
+        self.invalidate("/policy")
+        self.invalidate("/violation")
 
     # =========================================================================
     # Policy Violations
@@ -514,20 +931,47 @@ class DependencyTrackClient:
         self,
         project_uuid: str
     ) -> PolicyViolationSummary:
-        """Get policy violation summary for a project."""
-        violations = self.get_project_policy_violations(project_uuid)
+        """
+        Get policy violation summary for a project.
 
-        summary = PolicyViolationSummary()
-        for v in violations:
-            state = v.get("policyViolation", {}).get("violationState", "")
-            if state == "FAIL":
-                summary.fail += 1
-            elif state == "WARN":
-                summary.warn += 1
-            elif state == "INFO":
-                summary.info += 1
+        Reads the counts from the project's current metrics and only walks the
+        violation list when the metrics don't carry them.
+        """
+        metrics = self.get_project_metrics(project_uuid)
+        counts = (
+            metrics.get("policyViolationsFail"),
+            metrics.get("policyViolationsWarn"),
+            metrics.get("policyViolationsInfo"),
+        )
+        if None not in counts:
+            return PolicyViolationSummary(*counts)
 
-        return summary
+        return PolicyViolationSummary.from_violations(self._iter_policy_violations(project_uuid))
+
+    def _iter_policy_violations(
+        self,
+        project_uuid: str,
+        page_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield a project's unsuppressed policy violations page by page."""
+        page_number = 1
+        while True:
+            page = self._get(
+                f"/violation/project/{project_uuid}",
+                params={"suppressed": False, "pageSize": page_size, "pageNumber": page_number}
+            )
+            yield from page
+            if len(page) < page_size:
+                return
+            page_number += 1
+
+    def get_policy_violation_summaries(
+        self,
+        project_uuids: List[str]
+    ) -> Dict[str, PolicyViolationSummary]:
+        """Get policy violation summaries for several projects concurrently."""
+        summaries = self._map(self.get_policy_violation_summary, project_uuids)
+        return dict(zip(project_uuids, summaries))
 
     # =========================================================================
     # Findings (Analysis/Audit)
@@ -573,7 +1017,10 @@ class DependencyTrackClient:
         if comment:
             data["comment"] = comment
 
-        return self._put("/analysis", json=data)
+        analysis = self._put("/analysis", json=data)
+        self.invalidate("/finding")
+        self.invalidate("/vulnerability")
+        return analysis
 
     # =========================================================================
     # License
@@ -590,6 +1037,35 @@ class DependencyTrackClient:
 # =========================================================================
 # CLI Interface
 # =========================================================================
+@functools.lru_cache(maxsize=8)
+def get_client(
+    base_url: Optional[str] = None,
+    api_key: Optional[str] = None,
+    timeout: int = 30,
+    verify_ssl: bool = True
+) -> DependencyTrackClient:
+    """
+    Return a shared client per (base_url, api_key, timeout, verify_ssl).
+
+    Repeated calls in one process reuse the same pooled session. Don't close
+    the returned client; it lives until interpreter exit.
+    """
+    return DependencyTrackClient(base_url, api_key, timeout=timeout, verify_ssl=verify_ssl)
+
+
+def parse_targets(values: List[str]) -> Optional[List[tuple]]:
+    """Parse CLI project arguments: either NAME VERSION or NAME:VERSION ..."""
+    if len(values) == 2 and ":" not in values[0]:
+        return [(values[0], values[1])]
+    targets = []
+    for value in values:
+        name, sep, version = value.rpartition(":")
+        if not sep or not name or not version:
+            return None
+        targets.append((name, version))
+    return targets
+
+
 def main():
     """CLI interface for common operations."""
     import argparse
@@ -612,13 +1088,15 @@ def main():
 
     # Get metrics command
     metrics_parser = subparsers.add_parser("metrics", help="Get project metrics")
-    metrics_parser.add_argument("project", help="Project name")
-    metrics_parser.add_argument("version", help="Project version")
+    metrics_parser.add_argument(
+        "projects", nargs="+", help="Project name and version, or one or more name:version"
+    )
 
     # Security gate command
     gate_parser = subparsers.add_parser("gate", help="Security gate check")
-    gate_parser.add_argument("project", help="Project name")
-    gate_parser.add_argument("version", help="Project version")
+    gate_parser.add_argument(
+        "projects", nargs="+", help="Project name and version, or one or more name:version"
+    )
     gate_parser.add_argument("--max-critical", type=int, default=0)
     gate_parser.add_argument("--max-high", type=int, default=0)
 
@@ -627,62 +1105,67 @@ def main():
     if not args.url or not args.api_key:
         parser.error("--url and --api-key required (or set DTRACK_URL and DTRACK_API_KEY)")
 
-    client = DependencyTrackClient(base_url=args.url, api_key=args.api_key)
-
-    if args.command == "upload":
-        result = client.upload_sbom(
-            args.bom,
-            project_name=args.project,
-            project_version=args.version
-        )
-        print(f"Upload initiated. Token: {result.get('token')}")
-
-        if args.wait:
-            print("Waiting for processing...")
-            if client.wait_for_bom_processing(result["token"]):
-                print("Processing complete!")
-            else:
-                print("Processing timeout!")
+    # Keep name/version lookups on disk so back-to-back metrics/gate runs skip them
+    with DependencyTrackClient(
+        base_url=args.url, api_key=args.api_key, lookup_cache_ttl=900
+    ) as client:
+        if args.command == "upload":
+            result = client.upload_sbom(
+                args.bom,
+                project_name=args.project,
+                project_version=args.version
+            )
+            print(f"Upload initiated. Token: {result.get('token')}")
+
+            if args.wait:
+                print("Waiting for processing...")
+                if client.wait_for_bom_processing(result["token"]):
+                    print("Processing complete!")
+                else:
+                    print("Processing timeout!")
+                    exit(1)
+
+        elif args.command == "projects":
+            for p in client.iter_projects():
+                print(f"{p['name']}:{p['version']} ({p['uuid']})")
+
+        elif args.command in ("metrics", "gate"):
+            targets = parse_targets(args.projects)
+            if targets is None:
+                parser.error("expected NAME VERSION or one or more NAME:VERSION")
+
+            projects = client.get_projects_by_name_version(targets)
+            missing = [f"{n}:{v}" for (n, v), p in zip(targets, projects) if not p]
+            if missing:
+                print(f"Project not found: {', '.join(missing)}")
                 exit(1)
 
-    elif args.command == "projects":
-        projects = client.get_projects()
-        for p in projects:
-            print(f"{p['name']}:{p['version']} ({p['uuid']})")
-
-    elif args.command == "metrics":
-        project = client.get_project_by_name_version(args.project, args.version)
-        if not project:
-            print(f"Project not found: {args.project}:{args.version}")
-            exit(1)
-
-        summary = client.get_vulnerability_summary(project["uuid"])
-        print(f"Vulnerabilities for {args.project}:{args.version}")
-        print(f"  Critical: {summary.critical}")
-        print(f"  High:     {summary.high}")
-        print(f"  Medium:   {summary.medium}")
-        print(f"  Low:      {summary.low}")
-        print(f"  Total:    {summary.total}")
-
-    elif args.command == "gate":
-        project = client.get_project_by_name_version(args.project, args.version)
-        if not project:
-            print(f"Project not found: {args.project}:{args.version}")
-            exit(1)
-
-        summary = client.get_vulnerability_summary(project["uuid"])
-
-        if summary.exceeds_threshold(
-            max_critical=args.max_critical,
-            max_high=args.max_high
-        ):
-            print(f"FAILED: Vulnerabilities exceed threshold")
-            print(f"  Critical: {summary.critical} (max: {args.max_critical})")
-            print(f"  High: {summary.high} (max: {args.max_high})")
-            exit(1)
-        else:
-            print("PASSED: Security gate check")
-
+            summaries = client.get_vulnerability_summaries([p["uuid"] for p in projects])
+
+            failed = False
+            for (name, version), project in zip(targets, projects):
+                summary = summaries[project["uuid"]]
+                if args.command == "metrics":
+                    print(f"Vulnerabilities for {name}:{version}")
+                    print(f"  Critical: {summary.critical}")
+                    print(f"  High:     {summary.high}")
+                    print(f"  Medium:   {summary.medium}")
+                    print(f"  Low:      {summary.low}")
+                    print(f"  Total:    {summary.total}")
+                elif summary.exceeds_threshold(
+                    max_critical=args.max_critical,
+                    max_high=args.max_high
+                ):
+                    failed = True
+                    prefix = f"{name}:{version} " if len(targets) > 1 else ""
+                    print(f"{prefix}FAILED: Vulnerabilities exceed threshold")
+                    print(f"  Critical: {summary.critical} (max: {args.max_critical})")
+                    print(f"  High: {summary.high} (max: {args.max_high})")
+
+            if args.command == "gate":
+                if failed:
+                    exit(1)
+                print("PASSED: Security gate check")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Unit tests for python-client.py — uses only stdlib unittest."""
+
+import importlib.util
+import io
+import json
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# python-client.py isn't an importable module name, so load it by path
+_spec = importlib.util.spec_from_file_location(
+    "python_client", Path(__file__).resolve().parent / "python-client.py"
+)
+python_client = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(python_client)
+
+
+class TestMultipartStream(unittest.TestCase):
+    """Tests for the streamed multipart body."""
+
+    def test_seek_rewinds_every_part(self):
+        body = python_client.MultipartStream({"a": "1"}, "bom", "bom.json", io.BytesIO(b"x" * 100), 100)
+        first = body.read()
+        self.assertEqual(len(first), len(body))
+        self.assertEqual(body.tell(), len(body))
+        body.seek(0)
+        self.assertEqual(body.tell(), 0)
+        self.assertEqual(body.read(), first)
+
+    def test_seek_into_middle(self):
+        body = python_client.MultipartStream({}, "bom", "bom.json", io.BytesIO(b"0123456789"), 10)
+        whole = body.read()
+        body.seek(5)
+        self.assertEqual(body.read(), whole[5:])
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self.content = json.dumps(payload).encode()
+
+
+class TestGetCache(unittest.TestCase):
+    """Tests that status reads bypass the GET response cache."""
+
+    def setUp(self):
+        self.client = python_client.DependencyTrackClient(
+            base_url="http://dtrack.invalid", api_key="key", cache_ttl=300
+        )
+        self.addCleanup(self.client.close)
+        self.requested = []
+
+        def fake_request(method, endpoint, **kwargs):
+            self.requested.append(endpoint)
+            processing = len(self.requested) < 3
+            return _FakeResponse({"processing": processing, "critical": len(self.requested)})
+
+        self.client._request = fake_request
+
+    def test_bom_token_status_is_polled_live(self):
+        results = [self.client.is_bom_processing_complete("t") for _ in range(3)]
+        self.assertEqual(results, [False, False, True])
+        self.assertEqual(len(self.requested), 3)
+
+    def test_metrics_are_read_live(self):
+        first = self.client.get_project_metrics("p")
+        second = self.client.get_project_metrics("p")
+        self.assertNotEqual(first["critical"], second["critical"])
+
+    def test_other_gets_are_cached(self):
+        self.client.get_vulnerability("NVD", "CVE-1")
+        self.client.get_vulnerability("NVD", "CVE-1")
+        self.assertEqual(len(self.requested), 1)
+
+
+class _FlakyBomHandler(BaseHTTPRequestHandler):
+    """Answers the first POST /api/v1/bom with 503 and the next with 200."""
+
+    bodies = []
+
+    def do_POST(self):
+        self.bodies.append(self.rfile.read(int(self.headers["Content-Length"])))
+        status = 503 if len(self.bodies) == 1 else 200
+        payload = b"{}" if status == 503 else json.dumps({"token": "t"}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestUploadRetry(unittest.TestCase):
+    """Tests that a retried BOM upload resends the whole body."""
+
+    def setUp(self):
+        _FlakyBomHandler.bodies = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _FlakyBomHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def test_retry_after_503_resends_full_body(self):
+        client = python_client.DependencyTrackClient(
+            base_url=f"http://127.0.0.1:{self.server.server_port}",
+            api_key="key",
+            lookup_cache_ttl=0,
+        )
+        self.addCleanup(client.close)
+        with tempfile.TemporaryDirectory() as tmp:
+            bom = Path(tmp) / "bom.json"
+            content = json.dumps({"bomFormat": "CycloneDX", "components": ["c"] * 500}).encode()
+            bom.write_bytes(content)
+            result = client.upload_sbom(str(bom), project_uuid="00000000-0000-0000-0000-000000000000")
+
+        self.assertEqual(result, {"token": "t"})
+        first, second = _FlakyBomHandler.bodies
+        self.assertEqual(first, second)
+        self.assertIn(content, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+Batch directory listing on macOS with getattrlistbulk(2).
+
+One getattrlistbulk call returns the name, type and allocated size of many
+directory entries at once, where os.scandir needs a readdir pass plus a
+stat call per entry to get sizes. Used by sizecache when available.
+
+Usage:
+    import _fast_walk_darwin
+    if _fast_walk_darwin.AVAILABLE:
+        for name, is_dir, size in _fast_walk_darwin.scan('/some/dir'):
+            ...
+"""
+
+import os
+import sys
+import struct
+import ctypes
+
+
+# <sys/attr.h>
+ATTR_BIT_MAP_COUNT = 5
+ATTR_CMN_NAME = 0x00000001
+ATTR_CMN_OBJTYPE = 0x00000008
+ATTR_CMN_ERROR = 0x20000000
+ATTR_CMN_RETURNED_ATTRS = 0x80000000
+ATTR_FILE_ALLOCSIZE = 0x00000004
+
+# <sys/vnode.h> enum vtype
+VDIR = 2
+
+_BUF_SIZE = 256 * 1024
+
+
+class _AttrList(ctypes.Structure):
+    _fields_ = [
+        ('bitmapcount', ctypes.c_ushort),
+        ('reserved', ctypes.c_uint16),
+        ('commonattr', ctypes.c_uint32),
+        ('volattr', ctypes.c_uint32),
+        ('dirattr', ctypes.c_uint32),
+        ('fileattr', ctypes.c_uint32),
+        ('forkattr', ctypes.c_uint32),
+    ]
+
+
+AVAILABLE = False
+if sys.platform == 'darwin':
+    try:
+        _libc = ctypes.CDLL('/usr/lib/libSystem.dylib', use_errno=True)
+        _getattrlistbulk = _libc.getattrlistbulk
+    except (OSError, AttributeError):
+        pass
+    else:
+        _getattrlistbulk.argtypes = [
+            ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t, ctypes.c_uint64
+        ]
+        _getattrlistbulk.restype = ctypes.c_int
+        AVAILABLE = True
+
+_ATTRLIST = _AttrList(
+    bitmapcount=ATTR_BIT_MAP_COUNT,
+    commonattr=ATTR_CMN_RETURNED_ATTRS | ATTR_CMN_NAME | ATTR_CMN_OBJTYPE | ATTR_CMN_ERROR,
+    fileattr=ATTR_FILE_ALLOCSIZE,
+)
+
+
+def _parse(buf, count, entries):
+    """Append (name, is_dir, size) for count packed entries in buf."""
+    pos = 0
+    for _ in range(count):
+        length, = struct.unpack_from('=I', buf, pos)
+        # attribute_set_t of what was actually returned comes first
+        common, _vol, _dir, fileattr, _fork = struct.unpack_from('=5I', buf, pos + 4)
+        p = pos + 24
+
+        # ATTR_CMN_ERROR is packed first, ahead of the other common attributes;
+        # when it is set the rest of the entry can't be trusted
+        if common & ATTR_CMN_ERROR:
+            error, = struct.unpack_from('=I', buf, p)
+            p += 4
+            if error:
+                pos += length
+                continue
+        name = None
+        if common & ATTR_CMN_NAME:
+            # attrreference_t: offset from this field, length including NUL
+            name_off, name_len = struct.unpack_from('=iI', buf, p)
+            start = p + name_off
+            name = os.fsdecode(bytes(buf[start:start + name_len - 1]))
+            p += 8
+        objtype = 0
+        if common & ATTR_CMN_OBJTYPE:
+            objtype, = struct.unpack_from('=I', buf, p)
+            p += 4
+        size = 0
+        if fileattr & ATTR_FILE_ALLOCSIZE:
+            size, = struct.unpack_from('=q', buf, p)
+
+        if name is not None:
+            entries.append((name, objtype == VDIR, size))
+        pos += length
+
+
+def scan(path):
+    """
+    List a directory's entries with their allocated sizes.
+
+    Args:
+        path: Directory path
+
+    Returns:
+        List of (name, is_dir, allocated_bytes) tuples; directories report 0
+
+    Raises:
+        OSError: If the directory can't be read, including ENOTSUP on
+            file systems without getattrlistbulk support
+    """
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        buf = ctypes.create_string_buffer(_BUF_SIZE)
+        view = memoryview(buf).cast('B')
+        entries = []
+        while True:
+            count = _getattrlistbulk(fd, ctypes.byref(_ATTRLIST), buf, _BUF_SIZE, 0)
+            if count < 0:
+                err = ctypes.get_errno()
+                raise OSError(err, os.strerror(err), path)
+            if count == 0:
+                return entries
+            _parse(view, count, entries)
+    finally:
+        os.close(fd)
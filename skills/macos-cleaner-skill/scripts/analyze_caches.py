@@ -3,23 +3,85 @@
 Analyze macOS cache directories and categorize them by size and safety.
 
 Usage:
-    python3 analyze_caches.py [--user-only] [--min-size SIZE]
+    python3 analyze_caches.py [--user-only] [--min-size SIZE] [--use-du]
 
 Options:
     --user-only    Only scan user caches (~/Library/Caches), skip system caches
     --min-size     Minimum size in MB to report (default: 10)
+    --use-du       Size directories with du (slower; for comparing results)
 """
 
 import os
+import re
 import sys
 import subprocess
 import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from sizecache import format_size
+
+
+# Directory sizes by (st_dev, st_ino), so a tree reached via two paths is walked once
+_SIZE_CACHE = {}
+
 
 def get_dir_size(path):
     """
-    Get directory size using du command.
+    Get directory size by walking it in-process with os.scandir.
+
+    Counts allocated blocks like `du`, without forking a process per directory.
+    Hardlinked files and directories seen twice are counted once, and results
+    are memoized by inode in _SIZE_CACHE. Unreadable entries are skipped.
+
+    Args:
+        path: Directory path
+
+    Returns:
+        Size in bytes, or 0 if error
+    """
+    try:
+        root = os.lstat(path)
+    except OSError:
+        return 0
+    root_key = (root.st_dev, root.st_ino)
+    cached = _SIZE_CACHE.get(root_key)
+    if cached is not None:
+        return cached
+
+    total = root.st_blocks * 512
+    seen = {root_key}
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir or st.st_nlink > 1:
+                    key = (st.st_dev, st.st_ino)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                if is_dir:
+                    stack.append(entry.path)
+                total += st.st_blocks * 512
+
+    _SIZE_CACHE[root_key] = total
+    return total
+
+
+def get_dir_size_du(path):
+    """
+    Get directory size using du command (kept for parity checks via --use-du).
 
     Args:
         path: Directory path
@@ -43,45 +105,52 @@ def get_dir_size(path):
         return 0
 
 
-def format_size(bytes_size):
-    """Convert bytes to human-readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_size < 1024.0:
-            return f"{bytes_size:.1f} {unit}"
-        bytes_size /= 1024.0
-    return f"{bytes_size:.1f} PB"
-
-
-def analyze_cache_dir(base_path, min_size_bytes):
+def analyze_cache_dir(base_path, min_size_bytes, size_func=get_dir_size):
     """
     Analyze a cache directory and list subdirectories by size.
 
     Args:
         base_path: Path to cache directory
         min_size_bytes: Minimum size to report
+        size_func: Directory sizing function (get_dir_size or get_dir_size_du)
 
     Returns:
         List of (name, path, size_bytes) tuples
     """
-    if not os.path.exists(base_path):
-        return []
-
-    results = []
     try:
-        for entry in os.scandir(base_path):
-            if entry.is_dir():
-                size = get_dir_size(entry.path)
-                if size >= min_size_bytes:
-                    results.append((entry.name, entry.path, size))
+        with os.scandir(base_path) as it:
+            entries = [e for e in it if e.is_dir(follow_symlinks=False)]
+    except FileNotFoundError:
+        return []
     except PermissionError:
         print(f"⚠️  Permission denied: {base_path}", file=sys.stderr)
         return []
 
+    # Subtrees are independent and sizing is stat-bound, so overlap the I/O waits
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        sizes = executor.map(size_func, [e.path for e in entries])
+        results = [
+            (entry.name, entry.path, size)
+            for entry, size in zip(entries, sizes)
+            if size >= min_size_bytes
+        ]
+
     # Sort by size descending
     results.sort(key=lambda x: x[2], reverse=True)
     return results
 
 
+# Known safe to delete: browsers, communication, package managers, generic temp
+_SAFE_PATTERN = re.compile(
+    'chrome|firefox|safari|edge|spotify|slack|discord|pip|npm|homebrew|temp|tmp|cache'
+)
+# Check before deleting: IDEs (may slow next launch), docker (build cache)
+_CHECK_PATTERN = re.compile('xcode|android|jetbrains|vscode|docker')
+_SAFETY_ICON = {'safe': '🟢', 'check': '🟡', 'keep': '🔴'}
+
+
+@functools.lru_cache(maxsize=4096)
 def categorize_safety(name):
     """
     Categorize cache safety based on name patterns.
@@ -91,23 +160,10 @@ def categorize_safety(name):
     """
     name_lower = name.lower()
 
-    # Known safe to delete
-    safe_patterns = [
-        'chrome', 'firefox', 'safari', 'edge',  # Browsers
-        'spotify', 'slack', 'discord',           # Communication
-        'pip', 'npm', 'homebrew',                # Package managers
-        'temp', 'tmp', 'cache'                   # Generic temp
-    ]
-    if any(pattern in name_lower for pattern in safe_patterns):
+    if _SAFE_PATTERN.search(name_lower):
         return ('safe', 'Application regenerates cache automatically')
 
-    # Check before deleting
-    check_patterns = [
-        'xcode', 'android',     # IDEs (may slow next launch)
-        'jetbrains', 'vscode',
-        'docker'                # May contain important build cache
-    ]
-    if any(pattern in name_lower for pattern in check_patterns):
+    if _CHECK_PATTERN.search(name_lower):
         return ('check', 'May slow down next application launch')
 
     # Default: check first
@@ -129,7 +185,13 @@ def main():
         default=10,
         help='Minimum size in MB to report (default: 10)'
     )
+    parser.add_argument(
+        '--use-du',
+        action='store_true',
+        help='Size directories with du instead of walking them in-process'
+    )
     args = parser.parse_args()
+    size_func = get_dir_size_du if args.use_du else get_dir_size
 
     min_size_bytes = args.min_size * 1024 * 1024  # Convert MB to bytes
 
@@ -141,17 +203,19 @@ def main():
     print(f"\n📂 User Caches: {user_cache_path}")
     print("-" * 50)
 
-    user_caches = analyze_cache_dir(user_cache_path, min_size_bytes)
+    user_caches = analyze_cache_dir(user_cache_path, min_size_bytes, size_func)
     total_user = 0
 
     if user_caches:
         print(f"{'Application':<40} {'Size':<12} {'Safety'}")
         print("-" * 70)
+        # Build the table and write it once instead of a print per entry
+        rows = []
         for name, path, size in user_caches:
             safety, reason = categorize_safety(name)
-            safety_icon = {'safe': '🟢', 'check': '🟡', 'keep': '🔴'}[safety]
-            print(f"{name:<40} {format_size(size):<12} {safety_icon}")
+            rows.append(f"{name:<40} {format_size(size):<12} {_SAFETY_ICON[safety]}")
             total_user += size
+        sys.stdout.write("\n".join(rows) + "\n")
         print("-" * 70)
         print(f"{'Total':<40} {format_size(total_user):<12}")
     else:
@@ -160,7 +224,7 @@ def main():
     # User logs
     user_log_path = os.path.expanduser('~/Library/Logs')
     if os.path.exists(user_log_path):
-        log_size = get_dir_size(user_log_path)
+        log_size = size_func(user_log_path)
         if log_size >= min_size_bytes:
             print(f"\n📝 User Logs: {user_log_path}")
             print(f"   Size: {format_size(log_size)} 🟢 Safe to delete")
@@ -173,15 +237,17 @@ def main():
         print("⚠️  Requires administrator privileges to delete")
 
         system_cache_path = '/Library/Caches'
-        system_caches = analyze_cache_dir(system_cache_path, min_size_bytes)
+        system_caches = analyze_cache_dir(system_cache_path, min_size_bytes, size_func)
         total_system = 0
 
         if system_caches:
             print(f"{'Application':<40} {'Size':<12}")
             print("-" * 70)
+            rows = []
             for name, path, size in system_caches[:10]:  # Top 10 only
-                print(f"{name:<40} {format_size(size):<12}")
+                rows.append(f"{name:<40} {format_size(size):<12}")
                 total_system += size
+            sys.stdout.write("\n".join(rows) + "\n")
             if len(system_caches) > 10:
                 print(f"... and {len(system_caches) - 10} more")
             print("-" * 70)
@@ -204,6 +270,8 @@ def main():
     print("   3. For 🟡 items, verify the application is not running")
     print("   4. Use safe_delete.py for interactive cleanup")
 
+    # Keep memory bounded when the module is imported and main() run repeatedly
+    _SIZE_CACHE.clear()
     return 0
 
 
@@ -11,24 +11,30 @@ Checks:
 
 Usage:
     python3 analyze_dev_env.py
+
+Directory sizes come from sizecache.py, which reuses unchanged directories
+from earlier runs; set DU_CACHE=0 to disable.
 """
 
+import io
 import os
+import re
+import shutil
 import sys
 import subprocess
 import json
+import heapq
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import sizecache
+
 
 def format_size(bytes_size):
     """Convert bytes to human-readable format."""
     if bytes_size is None:
         return "Unknown"
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_size < 1024.0:
-            return f"{bytes_size:.1f} {unit}"
-        bytes_size /= 1024.0
-    return f"{bytes_size:.1f} PB"
+    return sizecache.format_size(bytes_size)
 
 
 def run_command(cmd):
@@ -47,163 +53,233 @@ def run_command(cmd):
         return None
 
 
-def get_dir_size(path):
-    """Get directory size using du command."""
-    output = run_command(['du', '-sk', path])
-    if output:
+# Docker prints sizes like "1.2GB", "512kB" or "0B", in decimal units
+_DOCKER_SIZE_RE = re.compile(r'([\d.]+)\s*([kKMGTP]?B)')
+_DECIMAL_UNITS = {'B': 1, 'bytes': 1, 'kB': 1000, 'KB': 1000, 'MB': 1000 ** 2,
+                  'GB': 1000 ** 3, 'TB': 1000 ** 4, 'PB': 1000 ** 5}
+# `pip cache info` reports each cache part as "... size: 12.3 MB" (or "0 bytes")
+_PIP_SIZE_RE = re.compile(r'size:\s*([\d.]+)\s*(bytes|[kKMGT]B)\s*$', re.M)
+_PIP_WHEELS_RE = re.compile(r'^Locally built wheels location:\s*(.+?)\s*$', re.M)
+
+
+def parse_docker_size(size_str):
+    """Convert a docker size string to bytes (0 if it can't be parsed)."""
+    match = _DOCKER_SIZE_RE.search(size_str)
+    if not match:
+        return 0
+    return float(match.group(1)) * _DECIMAL_UNITS[match.group(2)]
+
+
+def parse_json_rows(output):
+    """
+    Parse docker JSON output, either one array or one object per line.
+
+    The whole output is decoded in one pass when it is a single document;
+    otherwise each line is decoded and undecodable lines are skipped.
+    """
+    try:
+        rows = json.loads(output)
+        return rows if isinstance(rows, list) else [rows]
+    except json.JSONDecodeError:
+        pass
+    rows = []
+    for line in output.splitlines():
         try:
-            size_kb = int(output.split()[0])
-            return size_kb * 1024  # Convert to bytes
-        except (ValueError, IndexError):
-            pass
-    return 0
+            rows.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return rows
 
 
-def check_docker():
+def _docker_count(row, field):
+    """Read an integer field (e.g. TotalCount) from a `docker system df` row."""
+    try:
+        return int(row.get(field, 0))
+    except ValueError:
+        return 0
+
+
+def check_docker(out=sys.stdout):
     """Check Docker resources."""
-    print("\n🐳 Docker Resources")
-    print("=" * 50)
+    print("\n🐳 Docker Resources", file=out)
+    print("=" * 50, file=out)
 
     # Check if Docker is installed
-    if not run_command(['which', 'docker']):
-        print("   Docker not installed or not in PATH")
+    if shutil.which('docker') is None:
+        print("   Docker not installed or not in PATH", file=out)
         return 0
 
-    # Check if Docker daemon is running
-    if not run_command(['docker', 'info']):
-        print("   Docker daemon not running")
+    # One `docker system df` call covers images, containers, volumes and build
+    # cache; it fails (no rows) when the daemon isn't running
+    output = run_command(['docker', 'system', 'df', '--format', '{{json .}}'])
+    usage = {data.get('Type'): data for data in parse_json_rows(output or '')}
+
+    if not usage:
+        print("   Docker daemon not running", file=out)
         return 0
 
     total_size = 0
 
-    # Images
-    images_output = run_command(['docker', 'images', '-q'])
-    if images_output:
-        image_count = len(images_output.split('\n'))
-        print(f"\n📦 Images: {image_count}")
-
-        # Get size estimate
-        system_output = run_command(['docker', 'system', 'df', '--format', '{{json .}}'])
-        if system_output:
-            for line in system_output.split('\n'):
-                try:
-                    data = json.loads(line)
-                    if data.get('Type') == 'Images':
-                        size_str = data.get('Size', '')
-                        # Parse size (format like "1.2GB")
-                        if 'GB' in size_str:
-                            size = float(size_str.replace('GB', '')) * 1024 * 1024 * 1024
-                        elif 'MB' in size_str:
-                            size = float(size_str.replace('MB', '')) * 1024 * 1024
-                        else:
-                            size = 0
-                        print(f"   Total size: {format_size(size)}")
-                        total_size += size
-                except (json.JSONDecodeError, ValueError):
-                    pass
-
-    # Containers
-    containers_output = run_command(['docker', 'ps', '-a', '-q'])
-    if containers_output:
-        container_count = len(containers_output.split('\n'))
-        stopped = run_command(['docker', 'ps', '-a', '-f', 'status=exited', '-q'])
-        stopped_count = len(stopped.split('\n')) if stopped else 0
-        print(f"\n📦 Containers: {container_count} total, {stopped_count} stopped")
-
-    # Volumes
-    volumes_output = run_command(['docker', 'volume', 'ls', '-q'])
-    if volumes_output:
-        volume_count = len(volumes_output.split('\n'))
-        print(f"\n📦 Volumes: {volume_count}")
-
-        # List volumes
-        for volume in volumes_output.split('\n')[:5]:  # Show first 5
-            inspect = run_command(['docker', 'volume', 'inspect', volume])
-            print(f"   - {volume}")
-        if volume_count > 5:
-            print(f"   ... and {volume_count - 5} more")
-
-    # Build cache
-    buildx_output = run_command(['docker', 'buildx', 'du'])
-    if buildx_output and 'Total:' in buildx_output:
-        print(f"\n📦 Build Cache:")
-        for line in buildx_output.split('\n'):
-            if 'Total:' in line:
-                print(f"   {line}")
-
-    print(f"\n💡 Cleanup command: docker system prune -a --volumes")
-    print(f"   ⚠️  Warning: This will remove ALL unused Docker resources")
+    images = usage.get('Images', {})
+    if _docker_count(images, 'TotalCount'):
+        print(f"\n📦 Images: {_docker_count(images, 'TotalCount')}", file=out)
+        size = parse_docker_size(images.get('Size', ''))
+        print(f"   Total size: {format_size(size)}", file=out)
+        total_size += size
+
+    containers = usage.get('Containers', {})
+    container_count = _docker_count(containers, 'TotalCount')
+    if container_count:
+        stopped_count = container_count - _docker_count(containers, 'Active')
+        print(f"\n📦 Containers: {container_count} total, {stopped_count} stopped", file=out)
+
+    volumes = usage.get('Local Volumes', {})
+    if _docker_count(volumes, 'TotalCount'):
+        print(f"\n📦 Volumes: {_docker_count(volumes, 'TotalCount')}", file=out)
+        print(f"   Size: {volumes.get('Size', 'Unknown')}", file=out)
+        print("   List them with: docker volume ls", file=out)
+
+    build_cache = usage.get('Build Cache', {})
+    if parse_docker_size(build_cache.get('Size', '')):
+        print(f"\n📦 Build Cache:", file=out)
+        print(f"   Total: {build_cache['Size']}", file=out)
+        print(f"   Reclaimable: {build_cache.get('Reclaimable', 'Unknown')}", file=out)
+
+    print(f"\n💡 Cleanup command: docker system prune -a --volumes", file=out)
+    print(f"   ⚠️  Warning: This will remove ALL unused Docker resources", file=out)
 
     return total_size
 
 
-def check_homebrew():
+def _cache_dir_size(cache_path):
+    """Size a tool's cache directory, or None if it doesn't exist (one stat covers both)."""
+    if not cache_path:
+        return None
+    try:
+        st = os.stat(cache_path)
+    except OSError:
+        return None
+    return sizecache.get_size(cache_path, st)
+
+
+def check_homebrew(out=sys.stdout):
     """Check Homebrew cache."""
-    print("\n🍺 Homebrew")
-    print("=" * 50)
+    print("\n🍺 Homebrew", file=out)
+    print("=" * 50, file=out)
 
-    if not run_command(['which', 'brew']):
-        print("   Homebrew not installed")
+    if shutil.which('brew') is None:
+        print("   Homebrew not installed", file=out)
         return 0
 
     cache_path = run_command(['brew', '--cache'])
-    if cache_path and os.path.exists(cache_path):
-        size = get_dir_size(cache_path)
-        print(f"   Cache location: {cache_path}")
-        print(f"   Cache size: {format_size(size)}")
-        print(f"\n💡 Cleanup command: brew cleanup -s")
+    size = _cache_dir_size(cache_path)
+    if size is not None:
+        print(f"   Cache location: {cache_path}", file=out)
+        print(f"   Cache size: {format_size(size)}", file=out)
+        print(f"\n💡 Cleanup command: brew cleanup -s", file=out)
         return size
 
     return 0
 
 
-def check_npm():
+def check_npm(out=sys.stdout):
     """Check npm cache."""
-    print("\n📦 npm")
-    print("=" * 50)
+    print("\n📦 npm", file=out)
+    print("=" * 50, file=out)
 
-    if not run_command(['which', 'npm']):
-        print("   npm not installed")
+    if shutil.which('npm') is None:
+        print("   npm not installed", file=out)
         return 0
 
     cache_path = run_command(['npm', 'config', 'get', 'cache'])
-    if cache_path and cache_path != 'undefined' and os.path.exists(cache_path):
-        size = get_dir_size(cache_path)
-        print(f"   Cache location: {cache_path}")
-        print(f"   Cache size: {format_size(size)}")
-        print(f"\n💡 Cleanup command: npm cache clean --force")
+    size = _cache_dir_size(cache_path) if cache_path != 'undefined' else None
+    if size is not None:
+        print(f"   Cache location: {cache_path}", file=out)
+        print(f"   Cache size: {format_size(size)}", file=out)
+        print(f"\n💡 Cleanup command: npm cache clean --force", file=out)
         return size
 
     return 0
 
 
-def check_pip():
+def check_pip(out=sys.stdout):
     """Check pip cache."""
-    print("\n🐍 pip")
-    print("=" * 50)
+    print("\n🐍 pip", file=out)
+    print("=" * 50, file=out)
 
     # Try pip3 first
-    pip_cmd = 'pip3' if run_command(['which', 'pip3']) else 'pip'
+    pip_cmd = 'pip3' if shutil.which('pip3') else 'pip'
 
-    if not run_command(['which', pip_cmd]):
-        print("   pip not installed")
+    if shutil.which(pip_cmd) is None:
+        print("   pip not installed", file=out)
         return 0
 
-    cache_dir = run_command([pip_cmd, 'cache', 'dir'])
-    if cache_dir and os.path.exists(cache_dir):
-        size = get_dir_size(cache_dir)
-        print(f"   Cache location: {cache_dir}")
-        print(f"   Cache size: {format_size(size)}")
-        print(f"\n💡 Cleanup command: {pip_cmd} cache purge")
+    # pip reports its own cache sizes, which also gives the location in the same call
+    info = run_command([pip_cmd, 'cache', 'info']) or ''
+    sizes = _PIP_SIZE_RE.findall(info)
+    wheels_dir = _PIP_WHEELS_RE.search(info)
+    if sizes and wheels_dir:
+        cache_dir = os.path.dirname(wheels_dir.group(1))
+        size = int(sum(float(value) * _DECIMAL_UNITS[unit] for value, unit in sizes))
+    else:
+        cache_dir = run_command([pip_cmd, 'cache', 'dir'])
+        size = _cache_dir_size(cache_dir)
+
+    if size is not None:
+        print(f"   Cache location: {cache_dir}", file=out)
+        print(f"   Cache size: {format_size(size)}", file=out)
+        print(f"\n💡 Cleanup command: {pip_cmd} cache purge", file=out)
         return size
 
     return 0
 
 
-def check_old_git_repos():
+def _find_git(root, depth=3):
+    """Yield .git directories up to depth levels below root, without descending into them."""
+    try:
+        with os.scandir(root) as it:
+            entries = [e for e in it if e.is_dir(follow_symlinks=False)]
+    except OSError:
+        return
+    for entry in entries:
+        if entry.name == '.git':
+            yield entry.path
+        elif depth > 1:
+            yield from _find_git(entry.path, depth - 1)
+
+
+@sizecache.fs_memoize(ttl=60, name='git_repos')
+def _scan_git_repos(project_dirs):
+    """
+    Size the .git directories over 10 MB under project_dirs.
+
+    Returns:
+        [count, total_bytes, [[size, path], ...] for the 10 largest]
+    """
+    # Only the 10 largest are listed, so keep a bounded min-heap plus running totals
+    top_repos = []
+    repo_count = 0
+    total_size = 0
+
+    for project_dir in project_dirs:
+        # _find_git yields nothing for directories that don't exist
+        for git_path in _find_git(project_dir):
+            size = sizecache.get_size(git_path)
+            if size > 10 * 1024 * 1024:  # > 10 MB
+                repo_count += 1
+                total_size += size
+                if len(top_repos) < 10:
+                    heapq.heappush(top_repos, [size, git_path])
+                else:
+                    heapq.heappushpop(top_repos, [size, git_path])
+
+    return [repo_count, total_size, top_repos]
+
+
+def check_old_git_repos(out=sys.stdout):
     """Find large .git directories in archived projects."""
-    print("\n📁 Old Git Repositories")
-    print("=" * 50)
+    print("\n📁 Old Git Repositories", file=out)
+    print("=" * 50, file=out)
 
     home = Path.home()
     common_project_dirs = [
@@ -214,48 +290,22 @@ def check_old_git_repos():
         home / 'code'
     ]
 
-    git_repos = []
-    total_size = 0
-
-    for project_dir in common_project_dirs:
-        if not project_dir.exists():
-            continue
-
-        # Find .git directories
-        try:
-            result = subprocess.run(
-                ['find', str(project_dir), '-name', '.git', '-type', 'd', '-maxdepth', 3],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            if result.returncode == 0:
-                for git_path in result.stdout.strip().split('\n'):
-                    if git_path:
-                        size = get_dir_size(git_path)
-                        if size > 10 * 1024 * 1024:  # > 10 MB
-                            git_repos.append((git_path, size))
-                            total_size += size
-        except subprocess.TimeoutExpired:
-            continue
-
-    if git_repos:
-        # Sort by size
-        git_repos.sort(key=lambda x: x[1], reverse=True)
+    repo_count, total_size, top_repos = _scan_git_repos([str(d) for d in common_project_dirs])
 
-        print(f"   Found {len(git_repos)} .git directories > 10 MB")
-        print(f"\n   Top 10 largest:")
-        for path, size in git_repos[:10]:
+    if repo_count:
+        print(f"   Found {repo_count} .git directories > 10 MB", file=out)
+        print(f"\n   Top 10 largest:", file=out)
+        for size, path in sorted(top_repos, reverse=True):
             # Get parent directory name (project name)
             project_name = Path(path).parent.name
-            print(f"   - {project_name:<30} {format_size(size)}")
+            print(f"   - {project_name:<30} {format_size(size)}", file=out)
 
-        print(f"\n   Total: {format_size(total_size)}")
-        print(f"\n💡 If these are archived projects, consider:")
-        print(f"   1. Delete .git history: rm -rf <project>/.git")
-        print(f"   2. Or compress entire project: tar -czf archive.tar.gz <project>")
+        print(f"\n   Total: {format_size(total_size)}", file=out)
+        print(f"\n💡 If these are archived projects, consider:", file=out)
+        print(f"   1. Delete .git history: rm -rf <project>/.git", file=out)
+        print(f"   2. Or compress entire project: tar -czf archive.tar.gz <project>", file=out)
     else:
-        print("   No large .git directories found in common project locations")
+        print("   No large .git directories found in common project locations", file=out)
 
     return total_size
 
@@ -266,12 +316,17 @@ def main():
 
     total_savings = 0
 
-    # Check each component
-    docker_size = check_docker()
-    brew_size = check_homebrew()
-    npm_size = check_npm()
-    pip_size = check_pip()
-    git_size = check_old_git_repos()
+    # The checks wait on independent tools, so run them side by side; each
+    # writes to its own buffer, printed afterwards in the usual order
+    checks = [check_docker, check_homebrew, check_npm, check_pip, check_old_git_repos]
+    buffers = [io.StringIO() for _ in checks]
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [executor.submit(check, buf) for check, buf in zip(checks, buffers)]
+        sizes = []
+        for future, buf in zip(futures, buffers):
+            sizes.append(future.result())
+            sys.stdout.write(buf.getvalue())
+    docker_size, brew_size, npm_size, pip_size, git_size = sizes
 
     # Summary
     print("\n\n📊 Summary")
@@ -3,28 +3,65 @@
 Find large files on macOS and categorize them.
 
 Usage:
-    python3 analyze_large_files.py [--threshold SIZE] [--path PATH] [--limit N]
+    python3 analyze_large_files.py [--threshold SIZE] [--path PATH] [--limit N] [--apparent-size]
 
 Options:
-    --threshold    Minimum file size in MB (default: 100)
-    --path         Path to search (default: ~)
-    --limit        Maximum number of results (default: 50)
+    --threshold      Minimum file size in MB (default: 100)
+    --path           Path to search (default: ~)
+    --limit          Maximum number of results (default: 50)
+    --apparent-size  Rank by logical size instead of space allocated on disk
 """
 
 import os
 import sys
+import stat
+import heapq
+import functools
 import argparse
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-
-def format_size(bytes_size):
-    """Convert bytes to human-readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_size < 1024.0:
-            return f"{bytes_size:.1f} {unit}"
-        bytes_size /= 1024.0
-    return f"{bytes_size:.1f} PB"
+import sizecache
+
+
+# Category totals repeat across rows, so remember their formatting
+format_size = functools.lru_cache(maxsize=4096)(sizecache.format_size)
+
+
+def _by_suffix(groups):
+    """Expand {suffixes: category tuple} into a flat suffix -> category dict."""
+    return {suffix: category for suffixes, category in groups.items() for suffix in suffixes}
+
+
+# Checked first; a matching suffix wins over the log-name heuristic
+_SUFFIX_CATEGORIES = _by_suffix({
+    ('.mp4', '.mov', '.avi', '.mkv', '.m4v', '.flv', '.wmv'):
+        ('Video', '🎬', 'Review and archive to external storage'),
+    ('.zip', '.tar', '.gz', '.bz2', '.7z', '.rar', '.dmg'):
+        ('Archive', '📦', 'Extract if needed, then delete archive'),
+    ('.iso', '.img', '.toast'):
+        ('Disk Image', '💿', 'Delete after installation/use'),
+    ('.db', '.sqlite', '.sqlite3', '.sql'):
+        ('Database', '🗄️', '⚠️ Verify not in use before deleting'),
+    ('.csv', '.json', '.xml', '.parquet', '.arrow'):
+        ('Data File', '📊', 'Archive or compress if historical data'),
+})
+_LOG_CATEGORY = ('Log File', '📝', 'Safe to delete old logs')
+# Checked after the log-name heuristic
+_ARTIFACT_CATEGORIES = _by_suffix({
+    ('.o', '.a', '.so', '.dylib', '.framework'):
+        ('Build Artifact', '🔨', 'Safe to delete, rebuild will regenerate'),
+    ('.vmdk', '.vdi', '.qcow2', '.vhd'):
+        ('VM Image', '💻', '⚠️ Contains VM data, verify before deleting'),
+})
+_OTHER_CATEGORY = ('Other', '📄', 'Review before deleting')
+# Every category categorize_file can return, with its safety note
+_CATEGORY_NOTES = {
+    category: note
+    for category, _, note in [
+        *_SUFFIX_CATEGORIES.values(), _LOG_CATEGORY, *_ARTIFACT_CATEGORIES.values(), _OTHER_CATEGORY
+    ]
+}
 
 
 def categorize_file(path):
@@ -36,112 +73,127 @@ def categorize_file(path):
     """
     suffix = path.suffix.lower()
 
-    # Video files
-    video_exts = {'.mp4', '.mov', '.avi', '.mkv', '.m4v', '.flv', '.wmv'}
-    if suffix in video_exts:
-        return ('Video', '🎬', 'Review and archive to external storage')
+    category = _SUFFIX_CATEGORIES.get(suffix)
+    if category:
+        return category
 
-    # Archive files
-    archive_exts = {'.zip', '.tar', '.gz', '.bz2', '.7z', '.rar', '.dmg'}
-    if suffix in archive_exts:
-        return ('Archive', '📦', 'Extract if needed, then delete archive')
+    if suffix == '.log' or 'log' in path.name.lower():
+        return _LOG_CATEGORY
 
-    # Disk images
-    disk_exts = {'.iso', '.img', '.toast'}
-    if suffix in disk_exts:
-        return ('Disk Image', '💿', 'Delete after installation/use')
+    return _ARTIFACT_CATEGORIES.get(suffix, _OTHER_CATEGORY)
 
-    # Database files
-    db_exts = {'.db', '.sqlite', '.sqlite3', '.sql'}
-    if suffix in db_exts:
-        return ('Database', '🗄️', '⚠️ Verify not in use before deleting')
 
-    # Data files
-    data_exts = {'.csv', '.json', '.xml', '.parquet', '.arrow'}
-    if suffix in data_exts:
-        return ('Data File', '📊', 'Archive or compress if historical data')
+# Directories never worth descending into
+EXCLUDE_DIRS = (
+    '.Trash',
+    'Library/Caches',
+    'Library/Application Support/MobileSync',  # iOS backups
+    '.git',
+    'node_modules',
+    '__pycache__'
+)
+# Map each exclusion's last path component to its full suffix, so pruning is a dict lookup
+_EXCLUDE_BY_NAME = {exclude.rsplit('/', 1)[-1]: '/' + exclude for exclude in EXCLUDE_DIRS}
 
-    # Log files
-    if suffix == '.log' or 'log' in path.name.lower():
-        return ('Log File', '📝', 'Safe to delete old logs')
 
-    # Build artifacts
-    build_patterns = ['.o', '.a', '.so', '.dylib', '.framework']
-    if suffix in build_patterns:
-        return ('Build Artifact', '🔨', 'Safe to delete, rebuild will regenerate')
+def _is_excluded(dirpath, name):
+    suffix = _EXCLUDE_BY_NAME.get(name)
+    return suffix is not None and f"/{dirpath}/{name}".endswith(suffix)
+
+
+def _file_size(st, apparent):
+    """
+    Size of a stat result: allocated bytes on disk, or st_size if apparent.
+
+    Sparse and compressed files can allocate far less than their logical
+    size, and only the allocation is freed by deleting them.
+    """
+    return st.st_size if apparent else st.st_blocks * 512
+
 
-    # Virtual machine images
-    vm_exts = {'.vmdk', '.vdi', '.qcow2', '.vhd'}
-    if suffix in vm_exts:
-        return ('VM Image', '💻', '⚠️ Contains VM data, verify before deleting')
+def _walk_subtree(root, threshold_bytes, limit, apparent=False):
+    """
+    Walk root and keep the limit largest regular files above threshold_bytes.
 
-    # Other
-    return ('Other', '📄', 'Review before deleting')
+    Returns:
+        Min-heap of (size_bytes, path) with at most limit entries
+    """
+    heap = []
+    for dirpath, dirnames, filenames, dirfd in os.fwalk(root, follow_symlinks=False):
+        dirnames[:] = [d for d in dirnames if not _is_excluded(dirpath, d)]
+        for name in filenames:
+            try:
+                st = os.stat(name, dir_fd=dirfd, follow_symlinks=False)
+            except OSError:
+                continue
+            size = _file_size(st, apparent)
+            if size <= threshold_bytes or not stat.S_ISREG(st.st_mode):
+                continue
+            item = (size, os.path.join(dirpath, name))
+            if len(heap) < limit:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+    return heap
 
 
-def find_large_files(search_path, threshold_bytes, limit):
+def find_large_files(search_path, threshold_bytes, limit, apparent=False):
     """
-    Find files larger than threshold using find command.
+    Find files larger than threshold by walking the tree in-process.
+
+    Results are reused for 60 seconds (see sizecache.fs_memoize).
 
     Args:
         search_path: Path to search
         threshold_bytes: Minimum size in bytes
         limit: Maximum results
+        apparent: Use logical file size instead of allocated size
 
     Returns:
         List of (path, size_bytes) tuples
     """
-    # Convert bytes to 512-byte blocks (find -size uses 512-byte blocks)
-    threshold_blocks = threshold_bytes // 512
-
-    # Exclude common directories to avoid
-    exclude_dirs = [
-        '.Trash',
-        'Library/Caches',
-        'Library/Application Support/MobileSync',  # iOS backups
-        '.git',
-        'node_modules',
-        '__pycache__'
-    ]
+    found = _scan_large_files(search_path, threshold_bytes, limit, apparent)
+    return [(Path(path), size) for path, size in found]
 
-    # Build find command
-    cmd = ['find', search_path, '-type', 'f', '-size', f'+{threshold_blocks}']
-
-    # Add exclusions
-    for exclude in exclude_dirs:
-        cmd.extend(['-not', '-path', f'*/{exclude}/*'])
 
+@sizecache.fs_memoize(ttl=60, name='large_files')
+def _scan_large_files(search_path, threshold_bytes, limit, apparent):
+    """Walk search_path and return [path, size] pairs, largest first."""
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
-
-        if result.returncode != 0:
-            print(f"⚠️  Warning: find command had errors", file=sys.stderr)
-
-        files = []
-        for line in result.stdout.strip().split('\n'):
-            if not line:
-                continue
-            try:
-                path = Path(line)
-                if path.exists():
-                    size = path.stat().st_size
-                    files.append((path, size))
-            except (OSError, PermissionError):
-                continue
-
-        # Sort by size descending
-        files.sort(key=lambda x: x[1], reverse=True)
-        return files[:limit]
-
-    except subprocess.TimeoutExpired:
-        print("⚠️  Search timed out, showing partial results", file=sys.stderr)
+        with os.scandir(search_path) as it:
+            entries = list(it)
+    except OSError as e:
+        print(f"⚠️  Cannot read {search_path}: {e}", file=sys.stderr)
         return []
 
+    # Files directly under search_path are checked here; each subdirectory is
+    # walked on its own thread, since the walk is bound on metadata I/O
+    candidates = []
+    subdirs = []
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if not _is_excluded(search_path, entry.name):
+                    subdirs.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                size = _file_size(entry.stat(follow_symlinks=False), apparent)
+                if size > threshold_bytes:
+                    candidates.append((size, entry.path))
+        except OSError:
+            continue
+
+    if subdirs:
+        workers = min(os.cpu_count() or 1, len(subdirs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            walk = functools.partial(
+                _walk_subtree, threshold_bytes=threshold_bytes, limit=limit, apparent=apparent
+            )
+            for heap in executor.map(walk, subdirs):
+                candidates.extend(heap)
+
+    # Sort by size descending
+    return [[path, size] for size, path in heapq.nlargest(limit, candidates)]
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -164,6 +216,11 @@ def main():
         default=50,
         help='Maximum number of results (default: 50)'
     )
+    parser.add_argument(
+        '--apparent-size',
+        action='store_true',
+        help='Rank by logical file size instead of space allocated on disk'
+    )
     args = parser.parse_args()
 
     threshold_bytes = args.threshold * 1024 * 1024
@@ -174,7 +231,7 @@ def main():
     print("=" * 80)
     print("This may take a few minutes...\n")
 
-    large_files = find_large_files(search_path, threshold_bytes, args.limit)
+    large_files = find_large_files(search_path, threshold_bytes, args.limit, args.apparent_size)
 
     if not large_files:
         print("✅ No large files found above the threshold.")
@@ -182,11 +239,12 @@ def main():
 
     print(f"\n📦 Found {len(large_files)} large files")
     print("=" * 80)
-    print(f"{'#':<4} {'Size':<12} {'Type':<12} {'Location'}")
+    size_header = 'Size' if args.apparent_size else 'On-disk'
+    print(f"{'#':<4} {size_header:<12} {'Type':<12} {'Location'}")
     print("-" * 80)
 
-    # Group by category
-    by_category = {}
+    # Group by category: [count, size, note] per known category
+    by_category = {category: [0, 0, note] for category, note in _CATEGORY_NOTES.items()}
     total_size = 0
 
     for i, (path, size) in enumerate(large_files, 1):
@@ -206,10 +264,9 @@ def main():
         print(f"{i:<4} {format_size(size):<12} {icon} {category:<10} {display_path}")
 
         # Track by category
-        if category not in by_category:
-            by_category[category] = {'count': 0, 'size': 0, 'note': note}
-        by_category[category]['count'] += 1
-        by_category[category]['size'] += size
+        totals = by_category[category]
+        totals[0] += 1
+        totals[1] += size
         total_size += size
 
     print("-" * 80)
@@ -218,15 +275,17 @@ def main():
     # Category summary
     print("\n\n📊 Breakdown by Category")
     print("=" * 80)
-    for category, data in sorted(
+    for category, (count, size, note) in sorted(
         by_category.items(),
-        key=lambda x: x[1]['size'],
+        key=lambda x: x[1][1],
         reverse=True
     ):
+        if not count:
+            continue
         print(f"\n{category}")
-        print(f"  Files: {data['count']}")
-        print(f"  Total: {format_size(data['size'])}")
-        print(f"  💡 {data['note']}")
+        print(f"  Files: {count}")
+        print(f"  Total: {format_size(size)}")
+        print(f"  💡 {note}")
 
     print("\n\n💡 Next Steps:")
     print("   1. Review the list and identify files you no longer need")
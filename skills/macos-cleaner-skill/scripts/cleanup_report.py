@@ -13,19 +13,12 @@ Usage:
 import os
 import sys
 import json
+import time
 import argparse
-import subprocess
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
-
-def format_size(bytes_size):
-    """Convert bytes to human-readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_size < 1024.0:
-            return f"{bytes_size:.1f} {unit}"
-        bytes_size /= 1024.0
-    return f"{bytes_size:.1f} PB"
+from sizecache import format_size
 
 
 def get_disk_usage():
@@ -36,33 +29,25 @@ def get_disk_usage():
         dict with total, used, available, percent
     """
     try:
-        result = subprocess.run(
-            ['df', '-k', '/'],
-            capture_output=True,
-            text=True
-        )
-
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            if len(lines) >= 2:
-                # Parse df output
-                parts = lines[1].split()
-                total_kb = int(parts[1])
-                used_kb = int(parts[2])
-                available_kb = int(parts[3])
-                percent = int(parts[4].rstrip('%'))
-
-                return {
-                    'total': total_kb * 1024,
-                    'used': used_kb * 1024,
-                    'available': available_kb * 1024,
-                    'percent': percent,
-                    'timestamp': datetime.now().isoformat()
-                }
-    except:
-        pass
-
-    return None
+        # Same figures as `df -k /`, read straight from statvfs(2)
+        st = os.statvfs('/')
+    except OSError:
+        return None
+
+    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    available = st.f_bavail * st.f_frsize
+    # df rounds the capacity up, relative to the space non-root users can reach
+    percent = -(-used * 100 // (used + available)) if used + available else 0
+
+    return {
+        'total': st.f_blocks * st.f_frsize,
+        'used': used,
+        'available': available,
+        'percent': percent,
+        'timestamp_ns': time.time_ns(),
+        # ISO string kept so older versions of this script can still read the snapshot
+        'timestamp': datetime.now().isoformat()
+    }
 
 
 def save_snapshot(name):
@@ -103,9 +88,15 @@ def generate_report(before, after):
     print("=" * 60)
 
     # Time
-    before_time = datetime.fromisoformat(before['timestamp'])
-    after_time = datetime.fromisoformat(after['timestamp'])
-    duration = after_time - before_time
+    if 'timestamp_ns' in before and 'timestamp_ns' in after:
+        duration = timedelta(microseconds=(after['timestamp_ns'] - before['timestamp_ns']) // 1000)
+        before_time = datetime.fromtimestamp(before['timestamp_ns'] / 1e9)
+        after_time = datetime.fromtimestamp(after['timestamp_ns'] / 1e9)
+    else:
+        # Snapshots written before timestamp_ns existed
+        before_time = datetime.fromisoformat(before['timestamp'])
+        after_time = datetime.fromisoformat(after['timestamp'])
+        duration = after_time - before_time
 
     print(f"\nCleanup Duration: {duration}")
     print(f"Before: {before_time.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -13,41 +13,46 @@ Options:
 """
 
 import os
+import re
 import sys
-import subprocess
 import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-
-def format_size(bytes_size):
-    """Convert bytes to human-readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_size < 1024.0:
-            return f"{bytes_size:.1f} {unit}"
-        bytes_size /= 1024.0
-    return f"{bytes_size:.1f} PB"
+import sizecache
+from sizecache import format_size
 
 
 def get_dir_size(path):
-    """Get directory size using du command."""
-    try:
-        result = subprocess.run(
-            ['du', '-sk', path],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        if result.returncode == 0:
-            size_kb = int(result.stdout.split()[0])
-            return size_kb * 1024
-        return 0
-    except (subprocess.TimeoutExpired, ValueError, IndexError):
-        return 0
+    """
+    Get directory size in bytes (allocated blocks, like du -sk).
+
+    Remnants are candidates for deletion and often hold logs or databases
+    that grow in place, so the disk cache is bypassed.
+    """
+    return sizecache.get_size(path, use_cache=False)
+
+
+_NAME_PREFIXES = ('com.', 'org.', 'net.', 'io.')
+# Everything str.isalnum() rejects, so non-ASCII app names keep their letters
+_NON_ALNUM_RE = re.compile(r'[\W_]+')
+
+# System/common directories to always keep, matched anywhere in the name
+_SYSTEM_DIRS = (
+    'apple', 'safari', 'finder', 'mail', 'messages', 'notes',
+    'photos', 'music', 'calendar', 'contacts', 'reminders',
+    'preferences', 'cookies', 'webkit', 'coredata',
+    'cloudkit', 'icloud', 'appstore', 'systemmigration'
+)
+_SYSTEM_RE = re.compile('|'.join(map(re.escape, _SYSTEM_DIRS)))
+
+_CONFIDENCE_ICON = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}
 
 
 def get_installed_apps():
-    """Get list of installed application names."""
-    apps = set()
+    """Get installed application names, keyed by their normalized form."""
+    apps = {}
 
     # System applications
     system_app_dir = Path('/Applications')
@@ -55,18 +60,65 @@ def get_installed_apps():
         for app in system_app_dir.iterdir():
             if app.suffix == '.app':
                 # Remove .app suffix
-                apps.add(app.stem)
+                apps[normalize_name(app.stem)] = app.stem
 
     # User applications
     user_app_dir = Path.home() / 'Applications'
     if user_app_dir.exists():
         for app in user_app_dir.iterdir():
             if app.suffix == '.app':
-                apps.add(app.stem)
+                apps[normalize_name(app.stem)] = app.stem
 
     return apps
 
 
+def build_app_index(installed_apps):
+    """
+    Index normalized app names so a directory is matched in one pass.
+
+    Args:
+        installed_apps: Dict of normalized name -> app name
+
+    Returns:
+        (substrings, trie): every substring of every app name mapped to its
+        app, and a trie of the full names whose end nodes hold the app
+        under the '' key
+    """
+    substrings = {}
+    for norm_app, app in installed_apps.items():
+        for start in range(len(norm_app) + 1):
+            for end in range(start, len(norm_app) + 1):
+                substrings.setdefault(norm_app[start:end], app)
+    return substrings, _build_trie(installed_apps)
+
+
+def _build_trie(words):
+    """Build a char trie from {word: value}; end nodes hold value under ''."""
+    trie = {}
+    for word, value in words.items():
+        node = trie
+        for c in word:
+            node = node.setdefault(c, {})
+        node[''] = value
+    return trie
+
+
+def _find_in(text, trie):
+    """Return the value of a trie word that occurs in text, or None."""
+    if '' in trie:
+        return trie['']
+    for start in range(len(text)):
+        node = trie
+        for c in text[start:]:
+            node = node.get(c)
+            if node is None:
+                break
+            if '' in node:
+                return node['']
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize_name(name):
     """
     Normalize app name for matching.
@@ -76,85 +128,81 @@ def normalize_name(name):
         'com.apple.Safari' -> 'safari'
     """
     # Remove common prefixes
-    for prefix in ['com.', 'org.', 'net.', 'io.']:
+    for prefix in _NAME_PREFIXES:
         if name.startswith(prefix):
             name = name[len(prefix):]
 
-    # Remove non-alphanumeric
-    name = ''.join(c for c in name if c.isalnum())
-
-    return name.lower()
+    return _NON_ALNUM_RE.sub('', name).lower()
 
 
-def is_likely_orphaned(dir_name, installed_apps):
+def is_likely_orphaned(dir_name, app_index):
     """
     Check if directory is likely orphaned.
 
+    Args:
+        dir_name: Directory name under ~/Library
+        app_index: Result of build_app_index()
+
     Returns:
         (is_orphaned, confidence, reason)
         confidence: 'high' | 'medium' | 'low'
     """
     norm_dir = normalize_name(dir_name)
+    substrings, trie = app_index
 
-    # Check exact matches
-    for app in installed_apps:
-        norm_app = normalize_name(app)
-        if norm_app in norm_dir or norm_dir in norm_app:
-            return (False, None, f"Matches installed app: {app}")
-
-    # System/common directories to always keep
-    system_dirs = {
-        'apple', 'safari', 'finder', 'mail', 'messages', 'notes',
-        'photos', 'music', 'calendar', 'contacts', 'reminders',
-        'preferences', 'cookies', 'webkit', 'coredata',
-        'cloudkit', 'icloud', 'appstore', 'systemmigration'
-    }
+    # Directory name is part of an app name, or contains one
+    app = substrings.get(norm_dir)
+    if app is None:
+        app = _find_in(norm_dir, trie)
+    if app is not None:
+        return (False, None, f"Matches installed app: {app}")
 
-    if any(sys_dir in norm_dir for sys_dir in system_dirs):
+    if _SYSTEM_RE.search(norm_dir):
         return (False, None, "System/built-in application")
 
     # If we get here, likely orphaned
     return (True, 'medium', "No matching application found")
 
 
-def analyze_library_dir(library_path, min_size_bytes, installed_apps):
+def analyze_library_dir(library_path, min_size_bytes, app_index):
     """
     Analyze a Library subdirectory for orphaned data.
 
     Args:
         library_path: Path to scan (e.g., ~/Library/Application Support)
         min_size_bytes: Minimum size to report
-        installed_apps: Set of installed app names
+        app_index: Installed apps, from build_app_index()
 
     Returns:
         List of (name, path, size, confidence, reason) tuples
     """
-    if not os.path.exists(library_path):
-        return []
-
-    results = []
-
     try:
-        for entry in os.scandir(library_path):
-            if entry.is_dir():
-                size = get_dir_size(entry.path)
-                if size >= min_size_bytes:
-                    is_orphaned, confidence, reason = is_likely_orphaned(
-                        entry.name,
-                        installed_apps
-                    )
-                    if is_orphaned:
-                        results.append((
-                            entry.name,
-                            entry.path,
-                            size,
-                            confidence,
-                            reason
-                        ))
+        with os.scandir(library_path) as it:
+            entries = [e for e in it if e.is_dir()]
+    except FileNotFoundError:
+        return []
     except PermissionError:
         print(f"⚠️  Permission denied: {library_path}", file=sys.stderr)
         return []
 
+    # Classifying is a string check, sizing is a tree walk: only size the
+    # directories that don't belong to an installed app
+    candidates = []
+    for entry in entries:
+        is_orphaned, confidence, reason = is_likely_orphaned(entry.name, app_index)
+        if is_orphaned:
+            candidates.append((entry.name, entry.path, confidence, reason))
+
+    # Subtrees are independent and sizing is stat-bound, so overlap the I/O waits
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        sizes = executor.map(get_dir_size, [c[1] for c in candidates])
+        results = [
+            (name, path, size, confidence, reason)
+            for (name, path, confidence, reason), size in zip(candidates, sizes)
+            if size >= min_size_bytes
+        ]
+
     # Sort by size descending
     results.sort(key=lambda x: x[2], reverse=True)
     return results
@@ -181,6 +229,7 @@ def main():
     print("Scanning installed applications...")
     installed_apps = get_installed_apps()
     print(f"Found {len(installed_apps)} installed applications\n")
+    app_index = build_app_index(installed_apps)
 
     # Directories to check
     library_dirs = {
@@ -193,24 +242,36 @@ def main():
     all_orphans = []
     total_size = 0
 
-    for category, path in library_dirs.items():
+    # The four subtrees are scanned side by side and reported in order
+    with ThreadPoolExecutor(max_workers=len(library_dirs)) as executor:
+        scans = [
+            executor.submit(analyze_library_dir, path, min_size_bytes, app_index)
+            for path in library_dirs.values()
+        ]
+
+    for category, scan in zip(library_dirs, scans):
         print(f"\n📂 {category}")
         print("-" * 70)
 
-        orphans = analyze_library_dir(path, min_size_bytes, installed_apps)
+        orphans = scan.result()
 
         if orphans:
             print(f"{'Name':<40} {'Size':<12} {'Confidence'}")
             print("-" * 70)
 
+            # Build the table and write it once instead of a print per entry
+            rows = []
             for name, full_path, size, confidence, reason in orphans:
-                conf_icon = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}[confidence]
                 # Truncate long names
                 display_name = name if len(name) <= 37 else name[:34] + "..."
-                print(f"{display_name:<40} {format_size(size):<12} {conf_icon} {confidence}")
+                rows.append(
+                    f"{display_name:<40} {format_size(size):<12} "
+                    f"{_CONFIDENCE_ICON[confidence]} {confidence}"
+                )
 
                 all_orphans.append((category, name, full_path, size, confidence, reason))
                 total_size += size
+            sys.stdout.write("\n".join(rows) + "\n")
         else:
             print("No orphaned data found above minimum size")
 
@@ -224,13 +285,17 @@ def main():
         print("\n\n🗑️  Recommended Deletions (Medium/High Confidence)")
         print("=" * 70)
 
+        blocks = []
         for category, name, path, size, confidence, reason in all_orphans:
             if confidence in ['medium', 'high']:
-                print(f"\n{name}")
-                print(f"  Location: {path}")
-                print(f"  Size:     {format_size(size)}")
-                print(f"  Reason:   {reason}")
-                print(f"  ⚠️  Verify this app is truly uninstalled before deleting")
+                blocks.append(
+                    f"\n{name}\n"
+                    f"  Location: {path}\n"
+                    f"  Size:     {format_size(size)}\n"
+                    f"  Reason:   {reason}\n"
+                    f"  ⚠️  Verify this app is truly uninstalled before deleting\n"
+                )
+        sys.stdout.write("".join(blocks))
 
         print("\n\n💡 Next Steps:")
         print("   1. Double-check each item in /Applications and ~/Applications")
@@ -11,69 +11,98 @@ Options:
 """
 
 import os
+import re
 import sys
+import stat
+import ctypes
 import shutil
 import argparse
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import sizecache
+from sizecache import format_size
 
-def format_size(bytes_size):
-    """Convert bytes to human-readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_size < 1024.0:
-            return f"{bytes_size:.1f} {unit}"
-        bytes_size /= 1024.0
-    return f"{bytes_size:.1f} PB"
+# Path fragments that suggest personal data
+_DANGER_RE = re.compile(
+    r'documents|desktop|pictures|movies|downloads|music|\.ssh|credentials'
+)
 
+# removefile(3) deletes a whole tree inside libSystem, with no Python-level
+# work per file. <removefile.h>: REMOVEFILE_RECURSIVE
+REMOVEFILE_RECURSIVE = 1 << 0
 
-def get_size(path):
-    """Get size of file or directory."""
-    path_obj = Path(path)
+_removefile = None
+if sys.platform == 'darwin':
+    try:
+        _removefile = ctypes.CDLL('/usr/lib/libSystem.dylib', use_errno=True).removefile
+        _removefile.argtypes = [ctypes.c_char_p, ctypes.c_void_p, ctypes.c_uint32]
+        _removefile.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _removefile = None
 
-    if not path_obj.exists():
-        return 0
 
-    if path_obj.is_file():
-        return path_obj.stat().st_size
-    elif path_obj.is_dir():
+def get_size(path, st=None):
+    """Get size of file or directory (st: its os.lstat() result, if known)."""
+    if st is None:
         try:
-            result = subprocess.run(
-                ['du', '-sk', path],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            if result.returncode == 0:
-                size_kb = int(result.stdout.split()[0])
-                return size_kb * 1024
-        except (subprocess.TimeoutExpired, ValueError, IndexError):
-            pass
+            st = os.lstat(path)
+        except OSError:
+            return 0
 
-    return 0
+    # A symlink is sized as the link itself; deleting it leaves the target alone
+    if stat.S_ISREG(st.st_mode) or stat.S_ISLNK(st.st_mode):
+        return st.st_size
+    elif stat.S_ISDIR(st.st_mode):
+        # Files grown in place (logs, databases) are stale in the disk cache,
+        # so walk the tree afresh for the size shown before deleting
+        return sizecache.get_size(path, st, use_cache=False)
 
+    return 0
 
-def get_description(path):
-    """Get human-readable description of path."""
-    path_obj = Path(path)
 
-    if not path_obj.exists():
-        return "Path does not exist"
+def get_description(path, st=None):
+    """Get human-readable description of path (st: its os.lstat() result, if known)."""
+    if st is None:
+        try:
+            st = os.lstat(path)
+        except OSError:
+            return "Path does not exist"
 
-    if path_obj.is_file():
-        suffix = path_obj.suffix or "file"
+    if stat.S_ISLNK(st.st_mode):
+        try:
+            return f"Symlink (-> {os.readlink(path)})"
+        except OSError:
+            return "Symlink"
+    elif stat.S_ISREG(st.st_mode):
+        suffix = Path(path).suffix or "file"
         return f"File ({suffix})"
-    elif path_obj.is_dir():
+    elif stat.S_ISDIR(st.st_mode):
         try:
-            # Count items
-            items = list(path_obj.iterdir())
-            return f"Directory ({len(items)} items)"
+            # Count items without building a list of them
+            with os.scandir(path) as it:
+                count = sum(1 for _ in it)
+            return f"Directory ({count} items)"
         except PermissionError:
             return "Directory (permission denied to list)"
 
     return "Unknown"
 
 
+def prepare_item(path):
+    """
+    Stat a path once and describe it for the confirmation prompt.
+
+    Returns:
+        (path, size, description), or None if the path doesn't exist
+    """
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return None
+    return (path, get_size(path, st), get_description(path, st))
+
+
 def confirm_delete(path, size, description):
     """
     Ask user to confirm deletion.
@@ -93,13 +122,7 @@ def confirm_delete(path, size, description):
     print(f"Description: {description}")
 
     # Additional safety check for important paths
-    path_str = str(path).lower()
-    danger_patterns = [
-        'documents', 'desktop', 'pictures', 'movies',
-        'downloads', 'music', '.ssh', 'credentials'
-    ]
-
-    if any(pattern in path_str for pattern in danger_patterns):
+    if _DANGER_RE.search(str(path).lower()):
         print("\n⚠️  WARNING: This path may contain important personal data!")
         print("   Consider backing up before deletion.")
 
@@ -172,6 +195,18 @@ def batch_confirm(items):
         return selected
 
 
+def remove_tree(path):
+    """Recursively delete a directory, with removefile(3) on macOS."""
+    if _removefile is None or os.path.islink(path):
+        # shutil.rmtree refuses symlinks; keep that behaviour
+        shutil.rmtree(path)
+        return
+
+    if _removefile(os.fsencode(path), None, REMOVEFILE_RECURSIVE) != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err), path)
+
+
 def delete_path(path):
     """
     Delete a file or directory.
@@ -182,13 +217,14 @@ def delete_path(path):
     try:
         path_obj = Path(path)
 
-        if not path_obj.exists():
+        if not os.path.lexists(path):
             return (False, "Path does not exist")
 
-        if path_obj.is_file():
+        # Remove a symlink itself, never the tree it points to
+        if path_obj.is_symlink() or path_obj.is_file():
             path_obj.unlink()
         elif path_obj.is_dir():
-            shutil.rmtree(path)
+            remove_tree(path)
         else:
             return (False, "Unknown path type")
 
@@ -238,15 +274,11 @@ def main():
         parser.print_help()
         return 1
 
-    # Prepare items
-    items = []
-    for path in paths:
-        size = get_size(path)
-        description = get_description(path)
-        items.append((path, size, description))
-
-    # Remove non-existent paths
-    items = [(p, s, d) for p, s, d in items if Path(p).exists()]
+    # Prepare items; sizing large directories is I/O-bound, so do them side by side
+    print("Computing sizes...")
+    # Non-existent paths come back as None and are dropped
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        items = [item for item in executor.map(prepare_item, paths) if item is not None]
 
     if not items:
         print("❌ No valid paths to delete")
@@ -0,0 +1,238 @@
+"""
+Directory sizes with an on-disk cache shared by the cleaner scripts.
+
+Sizes are summed from allocated blocks, like `du`, by walking the tree
+in-process. Every directory visited is remembered in
+~/.macos-cleaner/dirsize.v2.cache.json as (mtime, size of its own files,
+subdirectory names). On the next run a directory whose mtime is unchanged
+has the same children, so only its subdirectories need a stat call.
+
+Limitation: rewriting a file in place does not change its directory's
+mtime, so that file's old size is reused until something is added to or
+removed from the directory. Cache trees (brew, npm, pip, .git objects)
+grow and shrink by whole files, which is what this targets.
+
+Set DU_CACHE=0 to always walk from scratch; callers that show a size
+right before deleting something pass use_cache=False for the same effect.
+
+fs_memoize caches whole scan results (e.g. the large file list) under
+~/.macos-cleaner/results/ for a short TTL, so running a script twice in a
+row doesn't repeat the walk. Set MACOS_CLEANER_NOCACHE=1 to bypass it.
+
+Usage:
+    import sizecache
+    size = sizecache.get_size('~/Library/Caches/Homebrew')
+"""
+
+import os
+import stat
+import json
+import errno
+import atexit
+import time
+import hashlib
+import functools
+import threading
+from pathlib import Path
+
+import _fast_walk_darwin
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# v2: entries written by the misparsing getattrlistbulk reader are ignored
+CACHE_PATH = Path.home() / '.macos-cleaner' / 'dirsize.v2.cache.json'
+RESULTS_DIR = Path.home() / '.macos-cleaner' / 'results'
+
+_cache = None
+_cache_lock = threading.Lock()
+_flush_registered = False
+
+
+def format_size(bytes_size):
+    """Convert bytes to human-readable format."""
+    # Each unit is 2**10 of the previous one, so the bit length picks it directly
+    index = min(max(int(bytes_size).bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    return f"{bytes_size / (1 << (10 * index)):.1f} {_SIZE_UNITS[index]}"
+
+
+def _load_cache():
+    """Load the cache once per process ({dir: [mtime_ns, own_bytes, subdirs]})."""
+    global _cache
+    if _cache is None:
+        try:
+            with CACHE_PATH.open() as f:
+                _cache = json.load(f)
+        except (OSError, ValueError):
+            _cache = {}
+    return _cache
+
+
+def _save_cache(cache):
+    """Write the cache atomically so other scripts never read a partial file."""
+    try:
+        CACHE_PATH.parent.mkdir(exist_ok=True)
+        tmp_path = CACHE_PATH.with_name(f'{CACHE_PATH.name}.{os.getpid()}.tmp')
+        with tmp_path.open('w') as f:
+            json.dump(cache, f, separators=(',', ':'))
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError:
+        pass
+
+
+def _flush():
+    """Write the in-memory cache back once, at interpreter exit."""
+    with _cache_lock:
+        if _cache is not None:
+            _save_cache(_cache)
+
+
+def _list_dir(path):
+    """
+    Return (name, is_dir, allocated_bytes) for each entry in path.
+
+    Uses getattrlistbulk on macOS, which fetches sizes for a batch of entries
+    per syscall, and falls back to scandir plus a stat per entry elsewhere.
+    """
+    if _fast_walk_darwin.AVAILABLE:
+        try:
+            return _fast_walk_darwin.scan(path)
+        except OSError as e:
+            if e.errno not in (errno.ENOTSUP, errno.EINVAL):
+                raise
+
+    entries = []
+    with os.scandir(path) as it:
+        for child in it:
+            try:
+                child_st = child.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            entries.append((child.name, stat.S_ISDIR(child_st.st_mode), child_st.st_blocks << 9))
+    return entries
+
+
+def _walk_size(path, cache, fresh, root_stat=None):
+    """
+    Sum allocated blocks under path, reusing entries from cache.
+
+    Entries for every directory visited are recorded in fresh. root_stat,
+    if the caller already has it, saves stat'ing path again.
+    """
+    total = 0
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        if root_stat is not None and current == path:
+            st = root_stat
+        else:
+            try:
+                st = os.lstat(current)
+            except OSError:
+                continue
+
+        entry = cache.get(current)
+        if entry and entry[0] == st.st_mtime_ns:
+            _, own, subdirs = entry
+        else:
+            own, subdirs = 0, []
+            try:
+                for name, is_dir, size in _list_dir(current):
+                    if is_dir:
+                        subdirs.append(name)
+                    else:
+                        own += size
+            except OSError:
+                # Unreadable: count what we have but don't remember it
+                total += st.st_blocks << 9
+                continue
+
+        fresh[current] = [st.st_mtime_ns, own, subdirs]
+        total += (st.st_blocks << 9) + own
+        stack.extend(os.path.join(current, name) for name in subdirs)
+    return total
+
+
+def get_size(path, root_stat=None, use_cache=True):
+    """
+    Get directory size in bytes, reusing unchanged directories from CACHE_PATH.
+
+    Args:
+        path: Directory path (~ is expanded)
+        root_stat: os.stat() result for path, if the caller already has one
+        use_cache: Set False to walk every directory, ignoring CACHE_PATH
+            and any earlier result for path in this process
+
+    Returns:
+        Size in bytes, or 0 if path can't be read
+    """
+    path = os.path.abspath(os.path.expanduser(path))
+    if not use_cache or os.environ.get('DU_CACHE') == '0':
+        return _walk_size(path, {}, {}, root_stat)
+    return _cached_size(path, root_stat)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_size(path, root_stat):
+    """Size path through CACHE_PATH, once per (path, root_stat) per process."""
+    with _cache_lock:
+        cache = _load_cache()
+    fresh = {}
+    size = _walk_size(path, cache, fresh, root_stat)
+
+    global _flush_registered
+    with _cache_lock:
+        # Forget directories under path that no longer exist
+        prefix = path + os.sep
+        for key in [k for k in cache if k.startswith(prefix) and k not in fresh]:
+            del cache[key]
+        cache.update(fresh)
+        # Callers size many siblings in a row; write the file once at exit
+        if not _flush_registered:
+            atexit.register(_flush)
+            _flush_registered = True
+    return size
+
+
+def fs_memoize(ttl=60, name=None):
+    """
+    Cache a function's result on disk for ttl seconds, keyed by its arguments.
+
+    The function must take JSON-serializable positional arguments and return
+    a JSON-serializable result; cached calls return the decoded JSON, so
+    return lists rather than tuples to get the same shape either way.
+
+    Args:
+        ttl: Seconds a stored result stays valid
+        name: File name prefix under RESULTS_DIR (default: function name)
+    """
+    def decorator(func):
+        prefix = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            if os.environ.get('MACOS_CLEANER_NOCACHE') == '1':
+                return func(*args)
+
+            digest = hashlib.sha1(json.dumps(args).encode()).hexdigest()[:16]
+            result_path = RESULTS_DIR / f'{prefix}-{digest}.json'
+            try:
+                with result_path.open() as f:
+                    entry = json.load(f)
+                if time.time() < entry['expires_at']:
+                    return entry['result']
+            except (OSError, ValueError, KeyError):
+                pass
+
+            result = func(*args)
+            try:
+                RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+                tmp_path = result_path.with_name(f'{result_path.name}.{os.getpid()}.tmp')
+                with tmp_path.open('w') as f:
+                    json.dump({'expires_at': time.time() + ttl, 'result': result}, f)
+                os.replace(tmp_path, result_path)
+            except OSError:
+                pass
+            return result
+        return wrapper
+    return decorator
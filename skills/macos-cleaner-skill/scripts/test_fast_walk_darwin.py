@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Unit tests for _fast_walk_darwin.py — uses only stdlib unittest."""
+
+import struct
+import unittest
+
+import _fast_walk_darwin as fw
+
+COMMON = fw.ATTR_CMN_RETURNED_ATTRS | fw.ATTR_CMN_NAME | fw.ATTR_CMN_OBJTYPE | fw.ATTR_CMN_ERROR
+VREG = 1
+
+
+def _entry(name, objtype, size=None, error=0):
+    """Pack one getattrlistbulk(2) entry in the documented attribute order."""
+    fileattr = fw.ATTR_FILE_ALLOCSIZE if size is not None else 0
+    # length, returned attribute_set_t, then ATTR_CMN_ERROR, NAME, OBJTYPE, ALLOCSIZE
+    fixed = 4 + 20 + 4 + 8 + 4 + (8 if size is not None else 0)
+    encoded = name.encode() + b'\0'
+    padded = encoded + b'\0' * (-len(encoded) % 4)
+    length = fixed + len(padded)
+    # attrreference_t offset is relative to the reference itself (at byte 28)
+    name_off = fixed - 28
+    data = struct.pack('=I5I', length, COMMON, 0, 0, fileattr, 0)
+    data += struct.pack('=I', error)
+    data += struct.pack('=iI', name_off, len(encoded))
+    data += struct.pack('=I', objtype)
+    if size is not None:
+        data += struct.pack('=q', size)
+    return data + padded
+
+
+class TestParse(unittest.TestCase):
+    """Tests for decoding packed getattrlistbulk entries."""
+
+    def test_reads_files_and_directories(self):
+        buf = _entry('notes.txt', VREG, size=8192) + _entry('Caches', fw.VDIR)
+        entries = []
+        fw._parse(memoryview(buf), 2, entries)
+        self.assertEqual(entries, [('notes.txt', False, 8192), ('Caches', True, 0)])
+
+    def test_skips_entries_with_errors(self):
+        buf = _entry('gone', VREG, size=4096, error=13) + _entry('kept', VREG, size=4096)
+        entries = []
+        fw._parse(memoryview(buf), 2, entries)
+        self.assertEqual(entries, [('kept', False, 4096)])
+
+
+if __name__ == '__main__':
+    unittest.main()
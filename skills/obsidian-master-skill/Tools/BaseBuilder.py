@@ -11,11 +11,14 @@ Environment:
 """
 from __future__ import annotations
 
+import functools
+import io
 import json
 import os
 import re
 import sys
 from pathlib import Path
+from typing import TextIO
 
 try:
     import click
@@ -27,25 +30,32 @@ try:
     import yaml
 except ImportError:
     yaml = None
+    _SafeLoader = None
+else:
+    # libyaml-backed loader when pyyaml was built with it
+    _SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 # ---------------------------------------------------------------------------
 # Vault detection
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=None)
 def _detect_vault(vault_arg: str | None = None) -> Path:
     if vault_arg:
         return Path(vault_arg)
     env = os.getenv("OBSIDIAN_VAULT")
     if env:
         return Path(env)
-    cwd = Path.cwd()
-    if (cwd / ".obsidian").is_dir():
-        return cwd
-    for parent in cwd.parents:
-        if (parent / ".obsidian").is_dir():
-            return parent
-    return cwd
+    cwd = os.getcwd()
+    p = cwd
+    while True:
+        if os.path.isdir(os.path.join(p, ".obsidian")):
+            return Path(p)
+        parent = os.path.dirname(p)
+        if parent == p:
+            return Path(cwd)
+        p = parent
 
 
 # ---------------------------------------------------------------------------
@@ -53,7 +63,8 @@ def _detect_vault(vault_arg: str | None = None) -> Path:
 # ---------------------------------------------------------------------------
 
 
-def _build_base_yaml(
+def _write_base_yaml(
+    out: TextIO,
     name: str,
     filter_expr: str | None,
     view_type: str,
@@ -63,63 +74,69 @@ def _build_base_yaml(
     sort_dir: str = "ASC",
     limit: int | None = None,
     summaries: dict[str, str] | None = None,
-) -> str:
-    lines = []
+) -> None:
+    """Write the .base YAML line by line to a text stream."""
+    w = out.write
 
     # Global filters
     if filter_expr:
-        filters = _parse_filter_expr(filter_expr)
-        lines.append("filters:")
-        lines.append("  and:")
-        for f in filters:
-            lines.append(f"    - '{f}'")
-        lines.append("")
+        w("filters:\n  and:\n")
+        for f in _parse_filter_expr(filter_expr):
+            w(f"    - '{f}'\n")
+        w("\n")
 
     # Formulas
     if formulas:
-        lines.append("formulas:")
+        w("formulas:\n")
         for fname, fexpr in formulas.items():
-            lines.append(f"  {fname}: '{fexpr}'")
-        lines.append("")
+            w(f"  {fname}: '{fexpr}'\n")
+        w("\n")
 
     # Properties display names for formulas
     if formulas:
-        lines.append("properties:")
+        w("properties:\n")
         for fname in formulas:
             display = fname.replace("_", " ").title()
-            lines.append(f"  formula.{fname}:")
-            lines.append(f'    displayName: "{display}"')
-        lines.append("")
+            w(f"  formula.{fname}:\n")
+            w(f'    displayName: "{display}"\n')
+        w("\n")
 
     # Views
-    lines.append("views:")
-    lines.append(f"  - type: {view_type}")
-    lines.append(f'    name: "{name}"')
+    w("views:\n")
+    w(f"  - type: {view_type}\n")
+    w(f'    name: "{name}"\n')
 
     if limit:
-        lines.append(f"    limit: {limit}")
+        w(f"    limit: {limit}\n")
 
     if group_by:
-        lines.append("    groupBy:")
-        lines.append(f"      property: {group_by}")
-        lines.append(f"      direction: {sort_dir}")
+        w("    groupBy:\n")
+        w(f"      property: {group_by}\n")
+        w(f"      direction: {sort_dir}\n")
 
-    lines.append("    order:")
+    w("    order:\n")
     for col in columns:
-        lines.append(f"      - {col}")
+        w(f"      - {col}\n")
 
     if summaries:
-        lines.append("    summaries:")
+        w("    summaries:\n")
         for prop, summary_type in summaries.items():
-            lines.append(f"      {prop}: {summary_type}")
+            w(f"      {prop}: {summary_type}\n")
 
-    return "\n".join(lines) + "\n"
+
+def _build_base_yaml(*args, **kwargs) -> str:
+    """Return the .base YAML as a string (see _write_base_yaml)."""
+    buf = io.StringIO()
+    _write_base_yaml(buf, *args, **kwargs)
+    return buf.getvalue()
+
+
+_AND_RE = re.compile(r"\s*&&\s*")
 
 
 def _parse_filter_expr(expr: str) -> list[str]:
     """Split a filter expression by && into individual filter strings."""
-    parts = re.split(r"\s*&&\s*", expr)
-    return [p.strip() for p in parts if p.strip()]
+    return [p for p in (part.strip() for part in _AND_RE.split(expr)) if p]
 
 
 # ---------------------------------------------------------------------------
@@ -162,7 +179,7 @@ def create(name, filter_expr, view_type, columns, formula_list, group_by, sort_d
         prop, stype = s.split("=", 1)
         summaries[prop.strip()] = stype.strip()
 
-    base_yaml = _build_base_yaml(
+    params = dict(
         name=name,
         filter_expr=filter_expr,
         view_type=view_type,
@@ -178,10 +195,17 @@ def create(name, filter_expr, view_type, columns, formula_list, group_by, sort_d
         v = _detect_vault(vault)
         dest = v / output if not Path(output).is_absolute() else Path(output)
         dest.parent.mkdir(parents=True, exist_ok=True)
-        dest.write_text(base_yaml, encoding="utf-8")
+        # Write beside the target and swap it in, so Obsidian never sees a
+        # partial file; one buffered write covers a typical .base
+        tmp = dest.with_name(f".{dest.name}.tmp")
+        with tmp.open("w", encoding="utf-8") as fh:
+            _write_base_yaml(fh, **params)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, dest)
         click.echo(f"Created: {dest}")
     else:
-        click.echo(base_yaml)
+        click.echo(_build_base_yaml(**params))
 
 
 @cli.command()
@@ -197,9 +221,8 @@ def validate(path, vault):
     if not base_path.exists():
         raise click.ClickException(f"File not found: {base_path}")
 
-    text = base_path.read_text(encoding="utf-8")
     try:
-        data = yaml.safe_load(text)
+        data = yaml.load(base_path.read_bytes(), Loader=_SafeLoader)
     except yaml.YAMLError as e:
         raise click.ClickException(f"Invalid YAML: {e}")
 
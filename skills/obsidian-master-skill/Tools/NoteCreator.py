@@ -11,11 +11,13 @@ Environment:
 """
 from __future__ import annotations
 
+import functools
 import json
 import os
 import re
 import sys
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timezone
+from collections.abc import Iterator
 from pathlib import Path
 
 try:
@@ -52,22 +54,34 @@ CAPTURE_DESTINATIONS = {
     "generic": "inbox",
 }
 
+# Per-directory note listings, reused while a directory's mtime is unchanged
+STEM_CACHE_PATH = (
+    Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "obsidian-tools" / "note-stems.json"
+)
+
+# Appends look for the frontmatter ``updated:`` line in this much of the file
+APPEND_HEAD_BYTES = 4096
+UPDATED_LINE_RE = re.compile(rb"^updated:[^\n]*", re.MULTILINE)
+
 WIKILINK_RE = re.compile(r"\[\[([^\]|#]+?)(?:#[^\]|]*)?(?:\|[^\]]+)?\]\]")
 
 
+@functools.lru_cache(maxsize=None)
 def _detect_vault(vault_arg: str | None = None) -> Path:
     if vault_arg:
         return Path(vault_arg)
     env = os.getenv("OBSIDIAN_VAULT")
     if env:
         return Path(env)
-    cwd = Path.cwd()
-    if (cwd / ".obsidian").is_dir():
-        return cwd
-    for parent in cwd.parents:
-        if (parent / ".obsidian").is_dir():
-            return parent
-    return cwd
+    cwd = os.getcwd()
+    p = cwd
+    while True:
+        if os.path.isdir(os.path.join(p, ".obsidian")):
+            return Path(p)
+        parent = os.path.dirname(p)
+        if parent == p:
+            return Path(cwd)
+        p = parent
 
 
 def _now_str() -> str:
@@ -78,16 +92,73 @@ def _today() -> datetime:
     return datetime.now()
 
 
+def _touch_updated(text: str, now: str) -> str:
+    """Rewrite the first line starting with ``updated:`` to ``updated: {now}``."""
+    if text.startswith("updated:"):
+        start = 0
+    else:
+        start = text.find("\nupdated:") + 1
+        if not start:
+            return text
+    end = text.find("\n", start)
+    if end == -1:
+        end = len(text)
+    return f"{text[:start]}updated: {now}{text[end:]}"
+
+
+def _append_to_note(path: Path, text: str, now: str) -> None:
+    """Append text as a new paragraph and set the note's ``updated:`` line to now.
+
+    The file is patched in place: the timestamp is overwritten where it
+    stands and only trailing whitespace is replaced, so an append costs the
+    same however long the note is. If the ``updated:`` line isn't in the
+    first APPEND_HEAD_BYTES or its length would change, the whole file is
+    rewritten instead.
+    """
+    line = f"updated: {now}".encode("utf-8")
+    with open(path, "r+b") as f:
+        size = os.fstat(f.fileno()).st_size
+        head = f.read(APPEND_HEAD_BYTES)
+        m = UPDATED_LINE_RE.search(head)
+        whole = len(head) == size
+        if m is None:
+            in_place = whole
+        else:
+            in_place = (m.end() < len(head) or whole) and m.end() - m.start() == len(line)
+        if in_place:
+            if m is not None:
+                f.seek(m.start())
+                f.write(line)
+            # Walk back over trailing whitespace, a block at a time
+            end = size
+            while end > 0:
+                start = max(end - APPEND_HEAD_BYTES, 0)
+                f.seek(start)
+                block = f.read(end - start).rstrip()
+                if block:
+                    end = start + len(block)
+                    break
+                end = start
+            f.seek(end)
+            f.write(f"\n\n{text}\n".encode("utf-8"))
+            f.truncate()
+            return
+
+    existing = _touch_updated(path.read_text(encoding="utf-8"), now)
+    path.write_text(f"{existing.rstrip()}\n\n{text}\n", encoding="utf-8")
+
+
 # ---------------------------------------------------------------------------
 # Templates
 # ---------------------------------------------------------------------------
 
 
-def _template_generic(title: str, tags: list[str]) -> str:
+def _template_generic(title: str, tags: list[str], now: str | None = None) -> str:
     tag_yaml = "\n".join(f"  - {t}" for t in tags) if tags else "  - inbox"
+    now = now or _now_str()
     return f"""---
-created: {_now_str()}
-updated: {_now_str()}
+created: {now}
+updated: {now}
 tags:
 {tag_yaml}
 ---
@@ -97,11 +168,12 @@ tags:
 """
 
 
-def _template_concept(title: str, tags: list[str]) -> str:
+def _template_concept(title: str, tags: list[str], now: str | None = None) -> str:
     tag_yaml = "\n".join(f"  - {t}" for t in ["permanent", "concept"] + tags)
+    now = now or _now_str()
     return f"""---
-created: {_now_str()}
-updated: {_now_str()}
+created: {now}
+updated: {now}
 type: zettelkasten
 tags:
 {tag_yaml}
@@ -129,11 +201,12 @@ One-paragraph explanation in your own words.
 """
 
 
-def _template_adr(title: str, tags: list[str]) -> str:
+def _template_adr(title: str, tags: list[str], now: str | None = None) -> str:
     tag_yaml = "\n".join(f"  - {t}" for t in ["decision"] + tags)
+    now = now or _now_str()
     return f"""---
-created: {_now_str()}
-updated: {_now_str()}
+created: {now}
+updated: {now}
 type: adr
 status: accepted
 tags:
@@ -164,11 +237,12 @@ What is the change that we're proposing?
 """
 
 
-def _template_howto(title: str, tags: list[str]) -> str:
+def _template_howto(title: str, tags: list[str], now: str | None = None) -> str:
     tag_yaml = "\n".join(f"  - {t}" for t in ["howto"] + tags)
+    now = now or _now_str()
     return f"""---
-created: {_now_str()}
-updated: {_now_str()}
+created: {now}
+updated: {now}
 type: howto
 tags:
 {tag_yaml}
@@ -201,12 +275,13 @@ Common issues and fixes.
 """
 
 
-def _template_meeting(title: str, tags: list[str]) -> str:
+def _template_meeting(title: str, tags: list[str], now: str | None = None) -> str:
     tag_yaml = "\n".join(f"  - {t}" for t in ["meeting"] + tags)
     date = _today().strftime("%Y-%m-%d")
+    now = now or _now_str()
     return f"""---
-created: {_now_str()}
-updated: {_now_str()}
+created: {now}
+updated: {now}
 type: meeting
 attendees: []
 tags:
@@ -234,11 +309,12 @@ tags:
 """
 
 
-def _template_project(title: str, tags: list[str]) -> str:
+def _template_project(title: str, tags: list[str], now: str | None = None) -> str:
     tag_yaml = "\n".join(f"  - {t}" for t in [f"project/{title.lower().replace(' ', '-')}"] + tags)
+    now = now or _now_str()
     return f"""---
-created: {_now_str()}
-updated: {_now_str()}
+created: {now}
+updated: {now}
 type: project
 status: active
 priority: medium
@@ -265,11 +341,12 @@ tags:
 """
 
 
-def _template_moc(title: str, tags: list[str]) -> str:
+def _template_moc(title: str, tags: list[str], now: str | None = None) -> str:
     tag_yaml = "\n".join(f"  - {t}" for t in ["moc"] + tags)
+    now = now or _now_str()
     return f"""---
-created: {_now_str()}
-updated: {_now_str()}
+created: {now}
+updated: {now}
 type: moc
 tags:
 {tag_yaml}
@@ -298,17 +375,20 @@ tags:
 
 
 def _template_daily(dt: datetime) -> str:
-    date_str = dt.strftime("%Y-%m-%d")
-    title = dt.strftime("%Y%m%d")
-    year = dt.strftime("%Y")
-    month = dt.strftime("%Y-%m")
-    prev_dt = dt - timedelta(days=1)
-    next_dt = dt + timedelta(days=1)
-    prev = prev_dt.strftime("%Y%m%d")
-    nxt = next_dt.strftime("%Y%m%d")
+    # Plain formatting of the date fields; strftime is much slower per call
+    y, m, d = dt.year, dt.month, dt.day
+    year = f"{y:04d}"
+    month = f"{year}-{m:02d}"
+    date_str = f"{month}-{d:02d}"
+    title = f"{year}{m:02d}{d:02d}"
+    prev_d = date.fromordinal(dt.toordinal() - 1)
+    next_d = date.fromordinal(dt.toordinal() + 1)
+    prev = f"{prev_d.year:04d}{prev_d.month:02d}{prev_d.day:02d}"
+    nxt = f"{next_d.year:04d}{next_d.month:02d}{next_d.day:02d}"
+    stamp = f"{date_str}T{dt.hour:02d}:{dt.minute:02d}"
     return f"""---
-created: {dt.strftime("%Y-%m-%dT%H:%M")}
-updated: {dt.strftime("%Y-%m-%dT%H:%M")}
+created: {stamp}
+updated: {stamp}
 title: "{title}"
 type: daily-note
 status: true
@@ -348,18 +428,80 @@ TEMPLATES = {
 # ---------------------------------------------------------------------------
 
 
+def _iter_note_stems(vault: Path) -> Iterator[str]:
+    """Yield the stems of all notes in the vault, outside hidden folders.
+
+    Adding, removing or renaming a note changes its directory's mtime, so a
+    directory whose mtime matches the cached entry is not read again; only
+    one stat per directory is needed on a warm cache. The cache is saved when
+    the generator finishes or is closed early.
+    """
+    try:
+        cache = json.loads(STEM_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cache = {}
+    key = str(vault.resolve())
+    cached = cache.get(key, {})
+    fresh: dict[str, list] = {}
+
+    stack = [key]
+    try:
+        while stack:
+            d = stack.pop()
+            try:
+                mtime = os.stat(d).st_mtime_ns
+            except OSError:
+                continue
+            entry = cached.get(d)
+            if entry is None or entry[0] != mtime:
+                notes, subdirs = [], []
+                try:
+                    with os.scandir(d) as it:
+                        for e in it:
+                            if e.is_dir(follow_symlinks=False):
+                                # .obsidian, .trash, .git: never descend
+                                if not e.name.startswith("."):
+                                    subdirs.append(e.name)
+                            elif e.name.endswith(".md"):
+                                notes.append(e.name[:-3])
+                except OSError:
+                    continue
+                entry = [mtime, notes, subdirs]
+            fresh[d] = entry
+            stack.extend(os.path.join(d, name) for name in entry[2])
+            yield from entry[1]
+    finally:
+        # A full walk drops directories that are gone; a partial one keeps
+        # the entries it didn't get to
+        cache[key] = fresh if not stack else {**cached, **fresh}
+        try:
+            STEM_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = STEM_CACHE_PATH.with_name(f"{STEM_CACHE_PATH.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(cache, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp_path, STEM_CACHE_PATH)
+        except OSError:
+            pass
+
+
 def _scan_related(vault: Path, title: str, content: str) -> list[str]:
     """Find existing notes that could be linked."""
-    words = set(title.lower().split())
+    words = {w for w in title.lower().split() if len(w) > 3}
+    if not words:
+        return []
+    # One alternation scans each stem for all title words in a single pass
+    words_re = re.compile("|".join(map(re.escape, words)))
     related = []
-    for md in vault.rglob("*.md"):
-        rel = str(md.relative_to(vault))
-        if rel.startswith(".obsidian"):
-            continue
-        name = md.stem.lower()
-        if any(w in name for w in words if len(w) > 3):
-            related.append(md.stem)
-    return related[:10]
+    stems = _iter_note_stems(vault)
+    try:
+        for stem in stems:
+            if words_re.search(stem.lower()):
+                related.append(stem)
+                if len(related) == 10:
+                    break
+    finally:
+        # Stop the walk here; nothing past the tenth match is needed
+        stems.close()
+    return related
 
 
 # ---------------------------------------------------------------------------
@@ -434,15 +576,11 @@ def daily(date_str, content, append_text, vault, dry_run):
     dest = dest_dir / filename
 
     if append_text and dest.exists():
-        existing = dest.read_text(encoding="utf-8")
-        now = _now_str()
-        existing = re.sub(r"^updated:.*$", f"updated: {now}", existing, count=1, flags=re.MULTILINE)
-        new_content = f"{existing.rstrip()}\n\n{append_text}\n"
         if dry_run:
             click.echo(f"Would append to: {dest.relative_to(v)}")
             click.echo(f"Content: {append_text}")
             return
-        dest.write_text(new_content, encoding="utf-8")
+        _append_to_note(dest, append_text, _now_str())
         click.echo(f"Appended to: {dest.relative_to(v)}")
         return
 
@@ -484,14 +622,10 @@ def capture(capture_type, title, content, tags, vault, dry_run):
         filename = dt.strftime("%Y%m%d.md")
         dest = v / "06 - Daily" / year / month / filename
         if dest.exists():
-            existing = dest.read_text(encoding="utf-8")
-            now = _now_str()
-            existing = re.sub(r"^updated:.*$", f"updated: {now}", existing, count=1, flags=re.MULTILINE)
-            new_content = f"{existing.rstrip()}\n\n{content}\n"
             if dry_run:
                 click.echo(f"Would append to daily: {dest.relative_to(v)}")
                 return
-            dest.write_text(new_content, encoding="utf-8")
+            _append_to_note(dest, content, _now_str())
             click.echo(f"Appended to daily: {dest.relative_to(v)}")
         else:
             note = _template_daily(dt)
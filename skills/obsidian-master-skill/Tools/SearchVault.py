@@ -13,10 +13,16 @@ Environment:
 """
 from __future__ import annotations
 
+import atexit
+import functools
 import json
+import mmap
 import os
 import re
 import sys
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 try:
@@ -26,9 +32,9 @@ except ImportError:
     sys.exit(1)
 
 try:
-    import httpx
+    import orjson
 except ImportError:
-    httpx = None
+    orjson = None
 
 # ---------------------------------------------------------------------------
 # REST API Client
@@ -36,73 +42,217 @@ except ImportError:
 
 API_BASE = os.getenv("OBSIDIAN_BASE_URL", "https://127.0.0.1:27124")
 API_KEY = os.getenv("OBSIDIAN_API_KEY", "")
+# Sent on every request through the shared client
+API_HEADERS = {"Authorization": f"Bearer {API_KEY}", "Accept": "application/json"}
 
 
+@functools.lru_cache(maxsize=1)
+def _httpx():
+    """Import httpx on first use, or return None if it isn't installed.
+
+    httpx pulls in httpcore, h11 and ssl, which --help and callers of the
+    direct file search helpers never need.
+    """
+    try:
+        import httpx
+    except ImportError:
+        return None
+    return httpx
+
+
+@functools.lru_cache(maxsize=1)
 def _client() -> "httpx.Client":
+    """Shared client, so the probe and the query reuse one keep-alive connection."""
+    httpx = _httpx()
     if httpx is None:
         raise click.ClickException("httpx not installed. Run: pip install httpx")
-    return httpx.Client(
+    client = httpx.Client(
         base_url=API_BASE,
-        headers={"Authorization": f"Bearer {API_KEY}"},
+        headers=API_HEADERS,
         verify=False,
         timeout=30.0,
     )
+    atexit.register(client.close)
+    return client
 
 
 def _api_available() -> bool:
     try:
-        c = _client()
-        r = c.get("/vault/")
-        c.close()
+        r = _client().get("/vault/")
         return r.status_code == 200
     except Exception:
         return False
 
 
+def _api_post(path: str, **kwargs) -> "httpx.Response | None":
+    """POST to the REST API, or return None if httpx is missing or it's unreachable."""
+    httpx = _httpx()
+    if httpx is None:
+        return None
+    try:
+        return _client().post(path, **kwargs)
+    except httpx.TransportError:
+        return None
+
+
+def _dumps_json(data, indent: bool = True) -> bytes:
+    """Encode data as UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False, default=str).encode("utf-8")
+
+
 # ---------------------------------------------------------------------------
 # Direct file search fallback
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=None)
 def _detect_vault() -> Path:
     """Detect vault path from env or cwd."""
     env = os.getenv("OBSIDIAN_VAULT")
     if env:
         return Path(env)
-    cwd = Path.cwd()
-    if (cwd / ".obsidian").is_dir():
-        return cwd
-    for parent in cwd.parents:
-        if (parent / ".obsidian").is_dir():
-            return parent
-    return cwd
+    cwd = os.getcwd()
+    p = cwd
+    while True:
+        if os.path.isdir(os.path.join(p, ".obsidian")):
+            return Path(p)
+        parent = os.path.dirname(p)
+        if parent == p:
+            return Path(cwd)
+        p = parent
+
+
+FRONTMATTER_RE = re.compile(rb"\A---\r?\n(.*?)\r?\n---[ \t]*(?:\r?\n|\Z)", re.DOTALL)
+TAGS_KEY_RE = re.compile(rb"^tags:[ \t]*([^\r\n]*)((?:\r?\n[ \t]*-[^\r\n]*)*)", re.MULTILINE)
+TAG_ITEM_RE = re.compile(rb"^[ \t]*-[ \t]*(\S+)", re.MULTILINE)
+
+
+def _note_tags(data: bytes) -> set[str]:
+    """Tags listed in a note's frontmatter, without '#', found without a YAML parser.
+
+    Handles ``tags: [a, b]``, ``tags: a, b`` and a block list of ``- a`` items.
+    """
+    fm = FRONTMATTER_RE.match(data)
+    if fm is None:
+        return set()
+    m = TAGS_KEY_RE.search(fm.group(1))
+    if m is None:
+        return set()
+    inline, block = m.groups()
+    raw = re.split(rb"[,\s]+", inline.strip(b"[]")) if inline.strip() else TAG_ITEM_RE.findall(block)
+    tags = set()
+    for t in raw:
+        t = t.strip(b"'\"").lstrip(b"#")
+        if t:
+            tags.add(t.decode("utf-8", errors="replace"))
+    return tags
+
+
+def _scan_note(
+    md: str,
+    vault: Path,
+    pattern: re.Pattern,
+    pattern_b: re.Pattern | None,
+    tags: set[str] | None = None,
+) -> dict | None:
+    """Return ``{"path", "matches"}`` for one note, or None if nothing matches.
+
+    With tags, notes whose frontmatter has none of them are skipped before
+    their text is decoded.
+    """
+    try:
+        with open(md, "rb") as f:
+            if pattern_b is not None:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if not pattern_b.search(mm):
+                            return None
+                except ValueError:
+                    # Empty file: nothing to match
+                    return None
+            data = f.read()
+    except OSError:
+        return None
+    if tags and not tags & _note_tags(data):
+        return None
+    text = data.decode("utf-8", errors="replace")
+    matches = []
+    for i, line in enumerate(text.splitlines(), 1):
+        if pattern.search(line):
+            matches.append({"line": i, "text": line.strip()})
+    if not matches:
+        return None
+    return {"path": os.path.relpath(md, vault), "matches": matches}
+
+
+def _iter_notes(top: str) -> Iterator[str]:
+    """Yield ``.md`` paths under top, in the order sorting the full list would give.
+
+    Each directory's entries are sorted by name and subdirectories are
+    visited in place, which matches sorting paths component by component.
+    Hidden folders (.obsidian plugin caches, .trash, .git) are skipped.
+    """
+    try:
+        with os.scandir(top) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            continue
+        if is_dir:
+            if not entry.name.startswith(".") and not entry.is_symlink():
+                yield from _iter_notes(entry.path)
+        elif entry.name.endswith(".md"):
+            yield entry.path
+
+
+def _bounded_map(executor: ThreadPoolExecutor, fn, items: Iterable, window: int) -> Iterator:
+    """Like ``executor.map`` but keeps at most window calls in flight.
+
+    ``executor.map`` submits every item up front, which would drain a lazy
+    iterable before the first result is returned.
+    """
+    pending: deque = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
 
 
 def _direct_content_search(
     query: str,
     folder: str | None = None,
     limit: int = 50,
+    tags: set[str] | None = None,
 ) -> list[dict]:
     vault = _detect_vault()
     base = vault / folder if folder else vault
     pattern = re.compile(re.escape(query), re.IGNORECASE)
+    # Non-matching files are rejected by a bytes search over an mmap, without
+    # decoding them; bytes IGNORECASE only folds ASCII, so only for ASCII queries
+    pattern_b = re.compile(re.escape(query.encode()), re.IGNORECASE) if query.isascii() else None
+    # Reading and matching is I/O-bound, so scan notes side by side. Paths
+    # are walked lazily and only a window of them is in flight, so the walk
+    # stops soon after limit matches instead of listing the whole vault first
+    scan = functools.partial(_scan_note, vault=vault, pattern=pattern, pattern_b=pattern_b, tags=tags)
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    executor = ThreadPoolExecutor(max_workers=workers)
     results = []
-    for md in sorted(base.rglob("*.md")):
-        rel = str(md.relative_to(vault))
-        if rel.startswith(".obsidian"):
-            continue
-        try:
-            text = md.read_text(encoding="utf-8", errors="replace")
-        except OSError:
-            continue
-        matches = []
-        for i, line in enumerate(text.splitlines(), 1):
-            if pattern.search(line):
-                matches.append({"line": i, "text": line.strip()})
-        if matches:
-            results.append({"path": rel, "matches": matches})
-            if len(results) >= limit:
-                break
+    try:
+        for found in _bounded_map(executor, scan, _iter_notes(os.fspath(base)), workers * 2):
+            if found is not None:
+                results.append(found)
+                if len(results) >= limit:
+                    break
+    finally:
+        executor.shutdown(cancel_futures=True)
     return results
 
 
@@ -119,7 +269,7 @@ def cli():
 @cli.command()
 def status():
     """Check REST API connectivity."""
-    if httpx is None:
+    if _httpx() is None:
         click.echo("httpx not installed - REST API unavailable")
         click.echo(f"Direct file fallback: vault at {_detect_vault()}")
         return
@@ -132,12 +282,10 @@ def status():
 @cli.command()
 def auth():
     """Verify API key authentication."""
-    if httpx is None:
+    if _httpx() is None:
         raise click.ClickException("httpx not installed. Run: pip install httpx")
     try:
-        c = _client()
-        r = c.get("/vault/")
-        c.close()
+        r = _client().get("/vault/")
         if r.status_code == 200:
             click.echo("Authenticated successfully")
         elif r.status_code == 401:
@@ -163,42 +311,41 @@ def search(query, search_type, query_opt, folder, tags, as_json, as_table, limit
     if not q:
         raise click.ClickException("Provide a search query as argument or --query")
 
-    use_api = httpx is not None and _api_available()
+    tag_set = {t.strip().lstrip("#") for t in tags.split(",")} if tags else None
+    # Direct search applies tag_set itself, from each note's frontmatter
+    tags_applied = False
 
+    # No separate availability probe: send the query and fall back (or fail)
+    # only if the API can't be reached
     if search_type == "dataview":
-        if not use_api:
-            raise click.ClickException("Dataview search requires Obsidian REST API running")
-        c = _client()
-        r = c.post(
+        r = _api_post(
             "/search/",
             content=q.encode("utf-8"),
             headers={"Content-Type": "application/vnd.olrapi.dataview.dql+txt"},
         )
-        c.close()
+        if r is None:
+            raise click.ClickException("Dataview search requires Obsidian REST API running")
         if r.status_code != 200:
             raise click.ClickException(f"Dataview query failed ({r.status_code}): {r.text}")
         results = r.json()
 
     elif search_type == "jsonlogic":
-        if not use_api:
-            raise click.ClickException("JsonLogic search requires Obsidian REST API running")
         logic = json.loads(q)
-        c = _client()
-        r = c.post(
+        r = _api_post(
             "/search/jsonlogic/",
-            json=logic,
+            content=_dumps_json(logic, indent=False),
             headers={"Content-Type": "application/vnd.olrapi.jsonlogic+json"},
         )
-        c.close()
+        if r is None:
+            raise click.ClickException("JsonLogic search requires Obsidian REST API running")
         if r.status_code != 200:
             raise click.ClickException(f"JsonLogic query failed ({r.status_code}): {r.text}")
         results = r.json()
 
     elif search_type == "content":
-        if use_api:
-            c = _client()
-            r = c.post("/search/simple/", json={"query": q})
-            c.close()
+        r = _api_post("/search/simple/", json={"query": q})
+        # A rejected key falls back to file search, as an unreachable API does
+        if r is not None and r.status_code != 401:
             if r.status_code != 200:
                 raise click.ClickException(f"Search failed ({r.status_code}): {r.text}")
             results = r.json()
@@ -206,13 +353,13 @@ def search(query, search_type, query_opt, folder, tags, as_json, as_table, limit
                 results = [r for r in results if r.get("filename", "").startswith(folder)]
             results = results[:limit]
         else:
-            results = _direct_content_search(q, folder=folder, limit=limit)
+            results = _direct_content_search(q, folder=folder, limit=limit, tags=tag_set)
+            tags_applied = True
     else:
         raise click.ClickException(f"Unknown search type: {search_type}")
 
     # Tag filtering (post-filter for content/jsonlogic)
-    if tags and isinstance(results, list):
-        tag_set = {t.strip().lstrip("#") for t in tags.split(",")}
+    if tag_set and not tags_applied and isinstance(results, list):
         filtered = []
         for r in results:
             note_tags = set()
@@ -224,7 +371,7 @@ def search(query, search_type, query_opt, folder, tags, as_json, as_table, limit
 
     # Output
     if as_json:
-        click.echo(json.dumps(results, indent=2, default=str))
+        click.echo(_dumps_json(results).decode("utf-8"))
     elif as_table and isinstance(results, list):
         for item in results:
             if isinstance(item, dict):
@@ -242,7 +389,7 @@ def search(query, search_type, query_opt, folder, tags, as_json, as_table, limit
                 else:
                     click.echo(str(item))
         else:
-            click.echo(json.dumps(results, indent=2, default=str))
+            click.echo(_dumps_json(results).decode("utf-8"))
 
 
 if __name__ == "__main__":
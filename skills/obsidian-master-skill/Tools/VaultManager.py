@@ -14,12 +14,16 @@ Environment:
 """
 from __future__ import annotations
 
+import functools
 import json
 import os
 import re
 import shutil
 import sys
-from collections import Counter, defaultdict
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -33,6 +37,15 @@ try:
     import yaml
 except ImportError:
     yaml = None
+    _SafeLoader = None
+else:
+    # libyaml-backed loader when pyyaml was built with it
+    _SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # ---------------------------------------------------------------------------
 # Vault detection
@@ -42,28 +55,68 @@ WIKILINK_RE = re.compile(r"\[\[([^\]|#]+?)(?:#[^\]|]*)?(?:\|[^\]]+)?\]\]")
 FRONTMATTER_RE = re.compile(r"^---\n(.*?)\n---", re.DOTALL)
 TAG_RE = re.compile(r"(?:^|\s)#([a-zA-Z][a-zA-Z0-9_/\-]*)", re.MULTILINE)
 
+# Frontmatter shapes _parse_frontmatter_fast reads; anything else goes to YAML
+FM_KEY_RE = re.compile(r"([A-Za-z_][\w-]*):(?: +(.*?))? *")
+FM_ITEM_RE = re.compile(r"( *)- +(.*?) *")
+FM_WORD_RE = re.compile(r"[A-Za-z_][\w/.-]*|[0-9]+-[0-9]+")
+FM_INT_RE = re.compile(r"0|[1-9][0-9]*")
+FM_QUOTED_RE = re.compile(r"\"[^\"\\]*\"|'[^']*'")
+# Plain words YAML reads as booleans or null rather than strings
+FM_YAML_WORDS = frozenset(
+    "yes Yes YES no No NO true True TRUE false False FALSE on On ON off Off OFF null Null NULL".split()
+)
+# Keys whose values callers read; these must come out exactly as YAML would
+FM_LIST_KEYS = frozenset({"tags", "aliases"})
+
+# Below this many notes, a thread pool costs more than it saves
+PARALLEL_READ_MIN = 64
 
+
+@functools.lru_cache(maxsize=None)
 def _detect_vault(vault_arg: str | None = None) -> Path:
     if vault_arg:
         return Path(vault_arg)
     env = os.getenv("OBSIDIAN_VAULT")
     if env:
         return Path(env)
-    cwd = Path.cwd()
-    if (cwd / ".obsidian").is_dir():
-        return cwd
-    for parent in cwd.parents:
-        if (parent / ".obsidian").is_dir():
-            return parent
-    return cwd
+    cwd = os.getcwd()
+    p = cwd
+    while True:
+        if os.path.isdir(os.path.join(p, ".obsidian")):
+            return Path(p)
+        parent = os.path.dirname(p)
+        if parent == p:
+            return Path(cwd)
+        p = parent
+
+
+def _scandir_notes(top: str) -> Iterator[tuple[os.DirEntry, str]]:
+    """Yield each note's DirEntry under top with its path relative to top.
+
+    scandir gives each entry's type without a stat call, and the entry
+    caches its stat once asked. Hidden folders (.obsidian, .trash, .git)
+    are pruned instead of walked and filtered.
+    """
+    prefix_len = len(os.path.join(top, ""))
+    stack = [top]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for e in it:
+                if e.name.startswith("."):
+                    continue
+                if e.is_dir(follow_symlinks=False):
+                    stack.append(e.path)
+                elif e.name.endswith(".md"):
+                    yield e, e.path[prefix_len:]
 
 
 def _iter_notes(vault: Path):
-    for md in vault.rglob("*.md"):
-        rel = str(md.relative_to(vault))
-        if rel.startswith(".obsidian") or rel.startswith("."):
-            continue
-        yield md, rel
+    for e, rel in _scandir_notes(str(vault)):
+        yield Path(e.path), rel
 
 
 def _read_note(path: Path) -> str:
@@ -73,24 +126,106 @@ def _read_note(path: Path) -> str:
         return ""
 
 
+def _fm_word(value: str) -> str | int | None:
+    """A list item or tag as YAML would read it, or None if unsure."""
+    if FM_QUOTED_RE.fullmatch(value):
+        return value[1:-1]
+    if FM_INT_RE.fullmatch(value):
+        return int(value)
+    if FM_WORD_RE.fullmatch(value) and value not in FM_YAML_WORDS:
+        return value
+    return None
+
+
+def _parse_frontmatter_fast(block: str) -> dict | None:
+    """Read flat frontmatter line by line, or return None if it needs a YAML parser.
+
+    Handles ``key: value`` lines and lists of words, either ``[a, b]`` or
+    ``- a`` lines. Values under FM_LIST_KEYS match what YAML returns;
+    other scalars are kept as their raw text.
+    """
+    if "\t" in block or "\r" in block:
+        return None
+    fm: dict = {}
+    list_key = indent = None
+    for line in block.split("\n"):
+        if not line.strip():
+            continue
+        m = FM_ITEM_RE.fullmatch(line)
+        if m:
+            if list_key is None or indent not in (None, len(m.group(1))):
+                return None
+            word = _fm_word(m.group(2))
+            if word is None:
+                return None
+            indent = len(m.group(1))
+            if fm[list_key] is None:
+                fm[list_key] = []
+            fm[list_key].append(word)
+            continue
+        m = FM_KEY_RE.fullmatch(line)
+        if m is None:
+            return None
+        key, value = m.groups()
+        list_key = indent = None
+        if not value:
+            fm[key] = None
+            list_key = key
+        elif value.startswith("["):
+            if not value.endswith("]"):
+                return None
+            inner = value[1:-1].strip()
+            words = [_fm_word(w.strip()) for w in inner.split(",")] if inner else []
+            if None in words:
+                return None
+            fm[key] = words
+        elif key in FM_LIST_KEYS:
+            fm[key] = _fm_word(value)
+            if fm[key] is None:
+                return None
+        elif FM_QUOTED_RE.fullmatch(value):
+            fm[key] = value[1:-1]
+        elif value[0] in "]{}&*!|>'\"%@`#,?:-" or ": " in value or " #" in value or value.endswith(":"):
+            return None
+        else:
+            fm[key] = value
+    return fm
+
+
 def _parse_frontmatter(text: str) -> dict:
+    # Cheap substring checks skip the regex for notes that can't match it
+    if not text.startswith("---\n"):
+        return {}
     m = FRONTMATTER_RE.match(text)
     if not m:
         return {}
+    # Most frontmatter is flat key: value lines, which don't need a YAML parser
+    fm = _parse_frontmatter_fast(m.group(1))
+    if fm is not None:
+        return fm
     if yaml:
         try:
-            return yaml.safe_load(m.group(1)) or {}
+            return yaml.load(m.group(1), Loader=_SafeLoader) or {}
         except Exception:
             return {}
     return {"_raw": m.group(1)}
 
 
 def _extract_wikilinks(text: str) -> list[str]:
-    return WIKILINK_RE.findall(text)
+    return WIKILINK_RE.findall(text) if "[[" in text else []
 
 
 def _extract_tags(text: str) -> list[str]:
-    return TAG_RE.findall(text)
+    return TAG_RE.findall(text) if "#" in text else []
+
+
+def _dumps_json(data) -> str:
+    """Encode data as indented JSON, with orjson when it is installed."""
+    if orjson is not None:
+        # Datetimes go through default=str, as with the json module
+        option = orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(data, default=str, option=option).decode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False, default=str)
 
 
 def _note_name(rel: str) -> str:
@@ -102,6 +237,50 @@ def _folder_name(rel: str) -> str:
     return parts[0] if len(parts) > 1 else "/"
 
 
+@dataclass
+class NoteData:
+    text: str
+    links: list[str]
+
+
+@dataclass
+class VaultIndex:
+    """Every note read once, with the link lookups orphans and broken-links need."""
+
+    notes: dict[str, NoteData] = field(default_factory=dict)
+    # Lowercased note name -> rel path
+    names_lower: dict[str, str] = field(default_factory=dict)
+    # Lowercased targets of every wikilink; orphans only asks whether a
+    # name is linked at all, so who links to it isn't kept
+    linked: set[str] = field(default_factory=set)
+
+
+def _scan_vault(vault: Path, links: bool = True) -> VaultIndex:
+    """Walk the vault and read each note a single time.
+
+    With links=False, wikilinks aren't extracted: NoteData.links stays
+    empty and nothing is added to VaultIndex.linked.
+    """
+    found = list(_iter_notes(vault))
+    paths = [md for md, _ in found]
+    if len(found) < PARALLEL_READ_MIN:
+        return _index_notes(found, map(_read_note, paths), links)
+    # Reads block on the filesystem and release the GIL, so threads overlap
+    # them; parsing stays on this thread, in walk order
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as executor:
+        return _index_notes(found, executor.map(_read_note, paths), links)
+
+
+def _index_notes(found: list[tuple[Path, str]], texts: Iterable[str], links: bool) -> VaultIndex:
+    index = VaultIndex()
+    for (_, rel), text in zip(found, texts):
+        note_links = _extract_wikilinks(text) if links else []
+        index.notes[rel] = NoteData(text, note_links)
+        index.names_lower[_note_name(rel).lower()] = rel
+        index.linked.update(link.strip().lower() for link in note_links)
+    return index
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -125,11 +304,14 @@ def health(vault, as_json):
     no_frontmatter = []
     no_tags = []
 
-    for md, rel in _iter_notes(v):
+    # health never looks at wikilinks, so don't extract them
+    for rel, note in _scan_vault(v, links=False).notes.items():
         total += 1
         folder_counts[_folder_name(rel)] += 1
-        text = _read_note(md)
-        if len(text.strip()) < 10:
+        text = note.text
+        # Ten non-blank characters in the head settle it without copying
+        # the whole note for strip(); only short notes need the full check
+        if len(text[:64].strip()) < 10 and len(text.strip()) < 10:
             empty_notes.append(rel)
         fm = _parse_frontmatter(text)
         if not fm:
@@ -156,7 +338,7 @@ def health(vault, as_json):
     }
 
     if as_json:
-        click.echo(json.dumps(report, indent=2))
+        click.echo(_dumps_json(report))
     else:
         click.echo("Vault Health Report")
         click.echo("=" * 40)
@@ -180,30 +362,17 @@ def health(vault, as_json):
 @click.option("--json", "as_json", is_flag=True)
 def orphans(vault, as_json):
     """Find notes with no inlinks or outlinks."""
-    v = _detect_vault(vault)
-    outlinks: dict[str, set] = {}
-    inlinks: defaultdict[str, set] = defaultdict(set)
-    all_names: dict[str, str] = {}
-
-    for md, rel in _iter_notes(v):
-        name = _note_name(rel)
-        all_names[name.lower()] = rel
-        text = _read_note(md)
-        links = _extract_wikilinks(text)
-        outlinks[rel] = {l.strip() for l in links}
-        for link in links:
-            inlinks[link.strip().lower()].add(rel)
+    index = _scan_vault(_detect_vault(vault))
 
     orphan_list = []
-    for md, rel in _iter_notes(v):
-        name = _note_name(rel)
-        has_outlinks = bool(outlinks.get(rel))
-        has_inlinks = bool(inlinks.get(name.lower()))
+    for rel, note in index.notes.items():
+        has_outlinks = bool(note.links)
+        has_inlinks = _note_name(rel).lower() in index.linked
         if not has_outlinks and not has_inlinks:
             orphan_list.append(rel)
 
     if as_json:
-        click.echo(json.dumps({"orphans": orphan_list, "count": len(orphan_list)}, indent=2))
+        click.echo(_dumps_json({"orphans": orphan_list, "count": len(orphan_list)}))
     else:
         click.echo(f"Orphan notes (no inlinks or outlinks): {len(orphan_list)}")
         for o in sorted(orphan_list):
@@ -215,31 +384,34 @@ def orphans(vault, as_json):
 @click.option("--json", "as_json", is_flag=True)
 def broken_links(vault, as_json):
     """Find wikilinks pointing to non-existent notes."""
-    v = _detect_vault(vault)
-    all_names: set[str] = set()
-    for md, rel in _iter_notes(v):
-        all_names.add(_note_name(rel).lower())
-
-    broken = []
-    for md, rel in _iter_notes(v):
-        text = _read_note(md)
-        links = _extract_wikilinks(text)
-        for link in links:
-            target = link.strip().lower()
-            if target and target not in all_names:
-                broken.append({"source": rel, "target": link.strip()})
-
+    index = _scan_vault(_detect_vault(vault))
+    # (source, target) for every broken link, in vault order
+    broken = (
+        (rel, link.strip())
+        for rel, note in index.notes.items()
+        for link in note.links
+        if link.strip() and link.strip().lower() not in index.names_lower
+    )
+
+    count = 0
     if as_json:
-        click.echo(json.dumps({"broken_links": broken, "count": len(broken)}, indent=2))
+        # Stream the records as they are found, in the same indented layout
+        click.echo('{\n  "broken_links": [', nl=False)
+        for source, target in broken:
+            record = _dumps_json({"source": source, "target": target}).replace("\n", "\n    ")
+            click.echo(("," if count else "") + "\n    " + record, nl=False)
+            count += 1
+        click.echo(("\n  ]" if count else "]") + f',\n  "count": {count}\n}}')
     else:
-        click.echo(f"Broken wikilinks: {len(broken)}")
-        seen = set()
-        for b in broken:
-            key = f"{b['source']} -> {b['target']}"
-            if key not in seen:
-                seen.add(key)
-                click.echo(f"  {b['source']}")
-                click.echo(f"    -> [[{b['target']}]]")
+        # The total is printed first, so collect the distinct pairs meanwhile
+        unique: dict[tuple[str, str], None] = {}
+        for pair in broken:
+            count += 1
+            unique[pair] = None
+        click.echo(f"Broken wikilinks: {count}")
+        for source, target in unique:
+            click.echo(f"  {source}")
+            click.echo(f"    -> [[{target}]]")
 
 
 @cli.command()
@@ -253,22 +425,38 @@ def lifecycle(vault, note_path, state):
     if not full.exists():
         raise click.ClickException(f"Note not found: {note_path}")
 
-    text = _read_note(full)
+    try:
+        raw = full.read_bytes()
+    except OSError as e:
+        raise click.ClickException(f"Cannot read {note_path}: {e}") from e
     now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M")
 
-    fm = FRONTMATTER_RE.match(text)
-    if fm:
-        fm_text = fm.group(1)
-        if re.search(r"^status:", fm_text, re.MULTILINE):
-            fm_text = re.sub(r"^status:.*$", f"status: {state}", fm_text, flags=re.MULTILINE)
-        else:
-            fm_text += f"\nstatus: {state}"
-        fm_text = re.sub(r"^updated:.*$", f"updated: {now}", fm_text, flags=re.MULTILINE)
-        new_text = f"---\n{fm_text}\n---{text[fm.end():]}"
+    # Only the frontmatter is decoded; the body bytes are copied through as-is
+    end = raw.find(b"\n---", 4) if raw.startswith(b"---\n") else -1
+    if end != -1:
+        # One pass over the frontmatter lines rewrites both keys
+        lines = raw[4:end].decode("utf-8", errors="replace").split("\n")
+        saw_status = False
+        for i, line in enumerate(lines):
+            if line.startswith("status:"):
+                lines[i] = f"status: {state}"
+                saw_status = True
+            elif line.startswith("updated:"):
+                lines[i] = f"updated: {now}"
+        if not saw_status:
+            lines.append(f"status: {state}")
+        fm_text = "\n".join(lines)
+        out = f"---\n{fm_text}\n---".encode("utf-8") + raw[end + 4:]
     else:
-        new_text = f"---\nstatus: {state}\nupdated: {now}\n---\n{text}"
-
-    full.write_text(new_text, encoding="utf-8")
+        out = f"---\nstatus: {state}\nupdated: {now}\n---\n".encode("utf-8") + raw
+
+    # Write beside the note and swap it in, so a crash never leaves it half-written
+    tmp = full.with_name(f".{full.name}.tmp")
+    with tmp.open("wb") as fh:
+        fh.write(out)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, full)
     click.echo(f"Updated {note_path} -> status: {state}")
 
 
@@ -305,10 +493,11 @@ def inbox(vault, as_json):
         click.echo("No inbox folder found (00 - Inbox/)")
         return
 
+    # Same order as sorting the paths; each entry is stat'ed once, below
+    found = sorted(_scandir_notes(str(inbox_dir)), key=lambda item: item[1].split(os.sep))
     notes = []
-    for md in sorted(inbox_dir.rglob("*.md")):
-        rel = str(md.relative_to(v))
-        text = _read_note(md)
+    for e, rel in found:
+        text = _read_note(Path(e.path))
         fm = _parse_frontmatter(text)
         preview = ""
         lines = text.split("\n")
@@ -317,18 +506,19 @@ def inbox(vault, as_json):
             if stripped and not stripped.startswith("---") and not stripped.startswith("#"):
                 preview = stripped[:100]
                 break
+        st = e.stat()
         notes.append({
-            "path": rel,
-            "name": md.stem,
+            "path": os.path.join(inbox_dir.name, rel),
+            "name": e.name[:-3],
             "has_frontmatter": bool(fm),
             "tags": fm.get("tags", []),
             "preview": preview,
-            "size": md.stat().st_size,
-            "modified": datetime.fromtimestamp(md.stat().st_mtime).isoformat(),
+            "size": st.st_size,
+            "modified": datetime.fromtimestamp(st.st_mtime).isoformat(),
         })
 
     if as_json:
-        click.echo(json.dumps(notes, indent=2, default=str))
+        click.echo(_dumps_json(notes))
     else:
         click.echo(f"Inbox notes: {len(notes)}")
         for n in notes:
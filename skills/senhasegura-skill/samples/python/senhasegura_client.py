@@ -3,18 +3,36 @@ Senhasegura A2A API Client for Python
 OAuth 2.0 authentication with credential management
 """
 
+import asyncio
+import importlib.util
+import json
 import os
+import threading
 import time
+from collections.abc import AsyncIterator, Iterator
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any, Callable, TypeVar
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 
-import requests
-from requests.auth import AuthBase
+import httpx
 
+try:
+    import orjson
+except ImportError:  # optional speedup for large listings
+    orjson = None
 
-@dataclass
+# HTTP/2 multiplexes concurrent requests over one connection; needs httpx[http2]
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Transient gateway errors retried with backoff, for requests safe to repeat
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.2
+
+
+@dataclass(slots=True)
 class Credential:
     """Credential model"""
     id: str
@@ -27,7 +45,7 @@ class Credential:
     tags: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CredentialPassword:
     """Credential password model"""
     id: str
@@ -35,41 +53,102 @@ class CredentialPassword:
     expiration: datetime
 
 
-class OAuth2Auth(AuthBase):
-    """OAuth 2.0 authentication handler for requests"""
+def _loads_json(content: bytes) -> Any:
+    """Decode a response body, with orjson when it is installed"""
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
+
+def _list_credential(c: dict[str, Any]) -> Credential:
+    """Build a Credential from a credential listing row"""
+    return Credential(
+        id=c["id"],
+        identifier=c["identifier"],
+        username=c["username"],
+        hostname=c["hostname"],
+        ip=c.get("ip"),
+        credential_type=c.get("type", "Local User"),
+        additional_info=c.get("additional_info"),
+        tags=c.get("tags"),
+    )
+
+
+def _credential_password(data: dict[str, Any]) -> CredentialPassword:
+    """Build a CredentialPassword from a /iso/coe/senha response"""
+    cred = data["response"]["credential"]
+    return CredentialPassword(
+        id=cred["id"],
+        password=cred["password"],
+        expiration=datetime.fromisoformat(cred["expiration"].replace("Z", "+00:00")),
+    )
+
+
+def _should_retry(method: str, response: httpx.Response, attempt: int) -> bool:
+    return (
+        attempt < MAX_RETRIES
+        and response.status_code in RETRY_STATUSES
+        and method.upper() in IDEMPOTENT_METHODS
+    )
+
 
-    def __init__(self, base_url: str, client_id: str, client_secret: str):
+class OAuth2Auth(httpx.Auth):
+    """OAuth 2.0 authentication handler for httpx (sync and async clients)
+
+    The token request is sent through the client being authenticated, so it
+    reuses that client's connection pool.
+    """
+
+    def __init__(self, base_url: str, client_id: str, client_secret: str, timeout: float = 30):
         self.base_url = base_url
         self.client_id = client_id
         self.client_secret = client_secret
+        self.timeout = timeout
         self.access_token: str | None = None
-        self.token_expiry: datetime | None = None
-
-    def _get_token(self) -> str:
-        """Obtain new access token"""
-        response = requests.post(
+        # time.monotonic() deadline; unaffected by wall-clock changes
+        self.token_expiry: float = 0.0
+        self._lock = threading.Lock()
+        self._async_lock = asyncio.Lock()
+
+    def _token_request(self) -> httpx.Request:
+        """Build the client-credentials token request"""
+        return httpx.Request(
+            "POST",
             f"{self.base_url}/iso/oauth2/token",
             data={
                 "grant_type": "client_credentials",
                 "client_id": self.client_id,
                 "client_secret": self.client_secret,
             },
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            timeout=30,
+            extensions={"timeout": httpx.Timeout(self.timeout).as_dict()},
         )
-        response.raise_for_status()
 
+    def _store_token(self, response: httpx.Response) -> None:
+        """Keep the access token from a token response"""
+        response.raise_for_status()
         data = response.json()
         self.access_token = data["access_token"]
         # Set expiry with 1 minute buffer
-        self.token_expiry = datetime.now() + timedelta(seconds=data["expires_in"] - 60)
-        return self.access_token
-
-    def __call__(self, request):
-        if not self.access_token or not self.token_expiry or self.token_expiry < datetime.now():
-            self._get_token()
+        self.token_expiry = time.monotonic() + data["expires_in"] - 60
+
+    def sync_auth_flow(self, request: httpx.Request) -> Iterator[httpx.Request]:
+        if time.monotonic() >= self.token_expiry:
+            # Only one thread refreshes; the others wait and reuse its token
+            with self._lock:
+                if time.monotonic() >= self.token_expiry:
+                    response = yield self._token_request()
+                    response.read()
+                    self._store_token(response)
         request.headers["Authorization"] = f"Bearer {self.access_token}"
-        return request
+        yield request
+
+    async def async_auth_flow(self, request: httpx.Request) -> AsyncIterator[httpx.Request]:
+        if time.monotonic() >= self.token_expiry:
+            async with self._async_lock:
+                if time.monotonic() >= self.token_expiry:
+                    response = yield self._token_request()
+                    await response.aread()
+                    self._store_token(response)
+        request.headers["Authorization"] = f"Bearer {self.access_token}"
+        yield request
 
 
 class SenhaseguraClient:
@@ -88,9 +167,31 @@ class SenhaseguraClient:
             self.base_url,
             client_id or os.environ["SENHASEGURA_CLIENT_ID"],
             client_secret or os.environ["SENHASEGURA_CLIENT_SECRET"],
+            timeout,
+        )
+        # One keep-alive pool for every call; retries cover connection errors
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            auth=self.auth,
+            timeout=timeout,
+            headers={"Accept": "application/json"},
+            # httpx ignores client-level http2/limits once a transport is given
+            transport=httpx.HTTPTransport(
+                http2=HTTP2,
+                retries=MAX_RETRIES,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            ),
         )
-        self.session = requests.Session()
-        self.session.auth = self.auth
+
+    def close(self) -> None:
+        """Close pooled connections"""
+        self._client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def _request(
         self,
@@ -100,32 +201,24 @@ class SenhaseguraClient:
         json: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Make authenticated API request"""
-        response = self.session.request(
-            method,
-            f"{self.base_url}{endpoint}",
-            params=params,
-            json=json,
-            timeout=self.timeout,
-        )
+        attempt = 0
+        while True:
+            response = self._client.request(method, endpoint, params=params, json=json)
+            if not _should_retry(method, response, attempt):
+                break
+            time.sleep(BACKOFF_FACTOR * 2 ** attempt)
+            attempt += 1
         response.raise_for_status()
-        return response.json()
+        return _loads_json(response.content)
+
+    def iter_credentials(self) -> Iterator[Credential]:
+        """Yield all credentials, building each Credential only when reached"""
+        data = self._request("GET", "/api/pam/credential")
+        return map(_list_credential, data["response"]["credentials"])
 
     def list_credentials(self) -> list[Credential]:
         """List all credentials"""
-        data = self._request("GET", "/api/pam/credential")
-        return [
-            Credential(
-                id=c["id"],
-                identifier=c["identifier"],
-                username=c["username"],
-                hostname=c["hostname"],
-                ip=c.get("ip"),
-                credential_type=c.get("type", "Local User"),
-                additional_info=c.get("additional_info"),
-                tags=c.get("tags"),
-            )
-            for c in data["response"]["credentials"]
-        ]
+        return list(self.iter_credentials())
 
     def get_credential(self, credential_id: str) -> Credential:
         """Get credential by ID"""
@@ -147,12 +240,7 @@ class SenhaseguraClient:
             "/iso/coe/senha",
             params={"credentialId": credential_id},
         )
-        cred = data["response"]["credential"]
-        return CredentialPassword(
-            id=cred["id"],
-            password=cred["password"],
-            expiration=datetime.fromisoformat(cred["expiration"].replace("Z", "+00:00")),
-        )
+        return _credential_password(data)
 
     def create_credential(
         self,
@@ -208,6 +296,97 @@ class SenhaseguraClient:
             self.release_custody(credential_id)
 
 
+class AsyncSenhaseguraClient:
+    """Async Senhasegura A2A API Client for concurrent bulk calls
+
+    Requests issued together, e.g. with asyncio.gather, share one
+    connection when HTTP/2 is available.
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        timeout: int = 30,
+    ):
+        self.base_url = base_url or os.environ["SENHASEGURA_URL"]
+        self.timeout = timeout
+        self.auth = OAuth2Auth(
+            self.base_url,
+            client_id or os.environ["SENHASEGURA_CLIENT_ID"],
+            client_secret or os.environ["SENHASEGURA_CLIENT_SECRET"],
+            timeout,
+        )
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            auth=self.auth,
+            timeout=timeout,
+            headers={"Accept": "application/json"},
+            # httpx ignores client-level http2/limits once a transport is given
+            transport=httpx.AsyncHTTPTransport(
+                http2=HTTP2,
+                retries=MAX_RETRIES,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """Close pooled connections"""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Make authenticated API request"""
+        attempt = 0
+        while True:
+            response = await self._client.request(method, endpoint, params=params, json=json)
+            if not _should_retry(method, response, attempt):
+                break
+            await asyncio.sleep(BACKOFF_FACTOR * 2 ** attempt)
+            attempt += 1
+        response.raise_for_status()
+        return _loads_json(response.content)
+
+    async def list_credentials(self) -> list[Credential]:
+        """List all credentials"""
+        data = await self._request("GET", "/api/pam/credential")
+        return [_list_credential(c) for c in data["response"]["credentials"]]
+
+    async def get_password(self, credential_id: str) -> CredentialPassword:
+        """Get credential password"""
+        data = await self._request(
+            "GET",
+            "/iso/coe/senha",
+            params={"credentialId": credential_id},
+        )
+        return _credential_password(data)
+
+    async def release_custody(self, credential_id: str) -> None:
+        """Release credential custody"""
+        await self._request("DELETE", f"/iso/pam/credential/custody/{credential_id}")
+
+    @asynccontextmanager
+    async def password_context(self, credential_id: str):
+        """Context manager for password with automatic custody release"""
+        cred = await self.get_password(credential_id)
+        try:
+            yield cred.password
+        finally:
+            await self.release_custody(credential_id)
+
+
 # DSM Client for DevOps Secrets
 class DSMClient(SenhaseguraClient):
     """Senhasegura DSM (DevOps Secrets Manager) Client"""
@@ -264,8 +443,7 @@ def main():
     client = SenhaseguraClient()
 
     # List credentials
-    credentials = client.list_credentials()
-    for cred in credentials:
+    for cred in client.iter_credentials():
         print(f"  {cred.identifier}: {cred.username}@{cred.hostname}")
 
     # Get password with automatic custody release